@@ -48,9 +48,15 @@ impl RustBatchManager {
     }
 
     #[pyo3(signature = (collection, properties, uuid=None, vector=None))]
-    fn add_object(&self, collection: PyObject, properties: Py<PyDict>, uuid: Option<PyObject>, vector: Option<Vec<f32>>) {
+    /// Queues an item without blocking; false when the channel is full and the item was dropped.
+    fn add_object(&self, collection: PyObject, properties: Py<PyDict>, uuid: Option<PyObject>, vector: Option<Vec<f32>>) -> bool {
         let item = LogItem { collection, properties, uuid, vector };
-        let _ = self.sender.try_send(item);
+        self.sender.try_send(item).is_ok()
+    }
+
+    /// Number of items queued and not yet picked up by the flush worker.
+    fn pending_size(&self) -> usize {
+        self.sender.len()
     }
 
     fn shutdown(&self, py: Python<'_>) {
@@ -163,9 +169,89 @@ fn mask_and_serialize(py: Python, data: &Bound<'_, PyAny>, sensitive_keys: Vec<S
     process_recursive(py, data, &sensitive_set)
 }
 
+fn is_masked(value: &Bound<'_, PyAny>) -> bool {
+    value.downcast::<PyString>().map_or(false, |s| s.to_str().map_or(false, |s| s == "[MASKED]"))
+}
+
+/// Joins already-masked args/kwargs into the span's input embedding text in a single
+/// buffer, skipping masked values. Must match tracer._create_input_vector_data.
+fn write_vector_text(func_name: &str, args: &Bound<'_, PyList>, kwargs: &Bound<'_, PyDict>) -> PyResult<String> {
+    let mut text = String::with_capacity(32 + func_name.len() + 16 * (args.len() + kwargs.len()));
+    text.push_str("Function Context: ");
+    text.push_str(func_name);
+
+    for item in args.iter() {
+        if !is_masked(&item) {
+            text.push(' ');
+            text.push_str(item.str()?.to_str()?);
+        }
+    }
+
+    for (key, val) in kwargs.iter() {
+        if !is_masked(&val) {
+            text.push(' ');
+            text.push_str(key.str()?.to_str()?);
+            text.push_str(": ");
+            text.push_str(val.str()?.to_str()?);
+        }
+    }
+
+    Ok(text)
+}
+
+#[pyfunction]
+fn build_vector_text(func_name: &str, processed_args: &Bound<'_, PyList>, processed_kwargs: &Bound<'_, PyDict>) -> PyResult<String> {
+    write_vector_text(func_name, processed_args, processed_kwargs)
+}
+
+/// Builds the per-span payload in one call: masked captured attributes and, optionally,
+/// the input text used for vectorization (same format as the Python fallback).
+#[pyfunction]
+#[pyo3(signature = (func_name, bound_values, args, kwargs, sensitive_keys, attributes_to_capture, with_vector_text=false))]
+fn build_span_payload(
+    py: Python,
+    func_name: &str,
+    bound_values: &Bound<'_, PyDict>,
+    args: &Bound<'_, PyList>,
+    kwargs: &Bound<'_, PyDict>,
+    sensitive_keys: Vec<String>,
+    attributes_to_capture: Vec<String>,
+    with_vector_text: bool,
+) -> PyResult<(PyObject, Option<String>)> {
+    let sensitive_set: HashSet<String> = sensitive_keys.into_iter().map(|s| s.to_lowercase()).collect();
+
+    let captured = PyDict::new(py);
+    for attr_name in &attributes_to_capture {
+        let attr_name = attr_name.as_str();
+        if let Some(raw_value) = bound_values.get_item(attr_name)? {
+            if sensitive_set.contains(&attr_name.to_lowercase()) {
+                captured.set_item(attr_name, "[MASKED]")?;
+            } else {
+                captured.set_item(attr_name, process_recursive(py, &raw_value, &sensitive_set)?)?;
+            }
+        }
+    }
+
+    let vector_text = if with_vector_text {
+        let processed_args = process_recursive(py, args.as_any(), &sensitive_set)?;
+        let processed_kwargs = process_recursive(py, kwargs.as_any(), &sensitive_set)?;
+        Some(write_vector_text(
+            func_name,
+            processed_args.bind(py).downcast::<PyList>()?,
+            processed_kwargs.bind(py).downcast::<PyDict>()?,
+        )?)
+    } else {
+        None
+    };
+
+    Ok((captured.into(), vector_text))
+}
+
 #[pymodule]
 fn vectorwave_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<RustBatchManager>()?;
     m.add_function(wrap_pyfunction!(mask_and_serialize, m)?)?;
+    m.add_function(wrap_pyfunction!(build_span_payload, m)?)?;
+    m.add_function(wrap_pyfunction!(build_vector_text, m)?)?;
     Ok(())
 }
\ No newline at end of file
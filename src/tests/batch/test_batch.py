@@ -107,6 +107,23 @@ def test_add_object_enqueues_item(mock_deps):
     # Ensure DB was NOT called directly (buffering works)
     mock_deps["client"].collections.get.assert_not_called()
 
+def test_add_object_counts_rust_drops(mock_deps, monkeypatch):
+    """
+    Case 4b: A full Rust channel (add_object returns False) counts as dropped, not added.
+    """
+    monkeypatch.setattr("vectorwave.batch.batch.USE_RUST_CORE", True)
+    mock_rust_cls = MagicMock()
+    monkeypatch.setattr("vectorwave.batch.batch.RustBatchManager", mock_rust_cls, raising=False)
+    manager = get_batch_manager()
+
+    mock_rust_cls.return_value.add_object.return_value = True
+    manager.add_object(collection="TestCollection", properties={"k": 1})
+    mock_rust_cls.return_value.add_object.return_value = False
+    manager.add_object(collection="TestCollection", properties={"k": 2})
+
+    assert manager._added == 1
+    assert manager.dropped == 1
+
 def test_flush_batch_sends_to_weaviate(mock_deps):
     """
     [Updated] Case 5: Test if the Python callback (_flush_batch_core) sends items
@@ -156,4 +173,41 @@ def test_flush_batch_reconnects_if_disconnected(mock_deps):
     # Should try to reconnect
     mock_deps["get_client"].assert_called_once()
     # And then send
-    mock_deps["client"].batch.dynamic.assert_called_once()
\ No newline at end of file
+    mock_deps["client"].batch.dynamic.assert_called_once()
+
+def test_wait_until_flushed_tracks_flush_callback(mock_deps):
+    """
+    Case 7: wait_until_flushed() returns once the flush callback has handled every added object
+    """
+    manager = get_batch_manager()
+    assert manager.wait_until_flushed(timeout=0) is True
+
+    # Two objects accepted but not yet handed back by the worker
+    manager._added = manager._flushed + 2
+    assert manager.wait_until_flushed(timeout=0.01) is False
+
+    manager._flush_batch_core([
+        {"collection": "C1", "properties": {}, "uuid": "u1", "vector": None},
+        {"collection": "C1", "properties": {}, "uuid": "u2", "vector": None}
+    ])
+    assert manager.wait_until_flushed(timeout=0.01) is True
+
+
+def test_python_queue_overflow_counts_drops_and_warns_once(mock_deps, monkeypatch, caplog):
+    """
+    Case 8: A full Python fallback queue drops objects with a counter, not a warning per drop
+    """
+    import logging
+    import queue
+
+    monkeypatch.setattr("vectorwave.batch.batch.USE_RUST_CORE", False)
+    manager = get_batch_manager()
+    manager.queue = queue.Queue(maxsize=1)
+
+    with caplog.at_level(logging.WARNING, logger="vectorwave.batch.batch"):
+        for i in range(3):
+            manager.add_object(collection="C1", properties={"i": i})
+
+    assert manager.dropped == 2
+    assert manager.queue.qsize() == 1
+    assert len([r for r in caplog.records if "FULL" in r.getMessage()]) == 1
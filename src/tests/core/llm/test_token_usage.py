@@ -109,4 +109,39 @@ def test_create_embedding_logs_token_usage(mock_deps):
     assert call_kwargs["collection"] == "VectorWaveTokenUsage"
     assert props["tokens"] == 45
     assert props["usage_type"] == "embedding"
-    assert props["category"] == "test_embed_category"
\ No newline at end of file
+    assert props["category"] == "test_embed_category"
+
+def test_create_embeddings_uses_one_request(mock_deps):
+    """
+    [Case 3] Verify that create_embeddings sends all texts in one request and keeps input order.
+    """
+    # Arrange
+    mock_client_instance = mock_deps["openai_cls"].return_value
+
+    # The API may return items out of order; 'index' maps them back to the inputs
+    mock_response = MagicMock()
+    mock_response.data = [
+        MagicMock(index=1, embedding=[0.2]),
+        MagicMock(index=0, embedding=[0.1]),
+    ]
+    mock_response.usage.total_tokens = 12
+    mock_client_instance.embeddings.create.return_value = mock_response
+
+    # Act
+    client = VectorWaveOpenAIClient()
+    result = client.create_embeddings(
+        texts=["first\nline", "second"],
+        model="text-embedding-3-small",
+        category="test_embed_category"
+    )
+
+    # Assert
+    assert result == [[0.1], [0.2]]
+    mock_client_instance.embeddings.create.assert_called_once_with(
+        input=["first line", "second"], model="text-embedding-3-small"
+    )
+
+    # Token usage is logged once for the whole batch
+    mock_batch = mock_deps["batch"]
+    mock_batch.add_object.assert_called_once()
+    assert mock_batch.add_object.call_args.kwargs["properties"]["tokens"] == 12
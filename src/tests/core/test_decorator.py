@@ -144,6 +144,142 @@ def test_vectorize_static_data_collection(mock_decorator_deps):
     assert kwargs["properties"]["sequence_narrative"] == "Test sequence narr"
 
 
+def test_function_source_follows_wrapped_and_edits(tmp_path):
+    """
+    Case 1-0: Source is read from the unwrapped function and re-read after the file changes
+    """
+    import functools
+    import importlib.util
+    import os
+    from vectorwave.core.decorator import _get_function_source
+
+    def passthrough(f):
+        @functools.wraps(f)
+        def w(*args, **kwargs):
+            return f(*args, **kwargs)
+        return w
+
+    @passthrough
+    def my_wrapped_target():
+        return "target"
+
+    assert "def my_wrapped_target" in _get_function_source(my_wrapped_target)
+
+    module_file = tmp_path / "edited_module.py"
+    module_file.write_text("def edited():\n    return 1\n")
+    spec = importlib.util.spec_from_file_location("edited_module", module_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert "return 1" in _get_function_source(module.edited)
+
+    module_file.write_text("def edited():\n    return 22\n")
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "return 22" in _get_function_source(module.edited)
+
+
+def test_vectorize_defers_registration_when_async_logging(mock_decorator_deps, monkeypatch):
+    """
+    Case 1-1: With ASYNC_LOGGING=True, the DB registration is submitted to the background executor
+    """
+    mock_decorator_deps["settings"].ASYNC_LOGGING = True
+    mock_submit = MagicMock()
+    monkeypatch.setattr("vectorwave.core.decorator._background_executor.submit", mock_submit)
+
+    @vectorize(search_description="Deferred desc")
+    def my_deferred_function():
+        pass
+
+    mock_decorator_deps["batch"].add_object.assert_not_called()
+    mock_submit.assert_called_once()
+    args = mock_submit.call_args[0]
+    assert args[1] == "my_deferred_function"
+    assert args[4]["function_name"] == "my_deferred_function"
+
+
+def test_vectorize_passthrough_when_tracing_disabled(mock_decorator_deps):
+    """
+    Case 1-2: With ENABLE_TRACING=False, the function is still registered but calls skip tracing
+    """
+    mock_decorator_deps["settings"].ENABLE_TRACING = False
+    mock_batch = mock_decorator_deps["batch"]
+
+    @vectorize(search_description="Passthrough desc", team="backend")
+    def my_untraced_function(x):
+        return x * 2
+
+    mock_batch.add_object.assert_called_once()
+    mock_batch.add_object.reset_mock()
+
+    assert my_untraced_function(4) == 8
+    assert my_untraced_function._is_vectorized is True
+    mock_batch.add_object.assert_not_called()
+
+
+def test_vectorize_passthrough_applies_to_cached_functions(mock_decorator_deps, monkeypatch):
+    """
+    Case 1-2b: ENABLE_TRACING=False also bypasses semantic_cache/capture_return_value functions
+    """
+    mock_decorator_deps["settings"].ENABLE_TRACING = False
+    mock_cache = MagicMock(return_value="cached")
+    monkeypatch.setattr("vectorwave.core.decorator._check_and_return_cached_result", mock_cache)
+
+    @vectorize(search_description="Cached passthrough", semantic_cache=True, capture_return_value=True)
+    def my_cached_untraced_function(x):
+        return x + 1
+
+    assert my_cached_untraced_function(1) == 2
+    mock_cache.assert_not_called()
+
+
+def test_vectorize_runtime_disable_skips_tracing(mock_decorator_deps):
+    """
+    Case 1-3: disable_tracing() makes already-decorated functions call straight through
+    """
+    from vectorwave.monitoring.tracer import disable_tracing, enable_tracing
+
+    mock_batch = mock_decorator_deps["batch"]
+
+    @vectorize(search_description="Switchable desc")
+    def my_switchable_function(x):
+        return x * 3
+
+    mock_batch.add_object.reset_mock()
+    disable_tracing()
+    try:
+        assert my_switchable_function(2) == 6
+        mock_batch.add_object.assert_not_called()
+    finally:
+        enable_tracing()
+
+    assert my_switchable_function(2) == 6
+    mock_batch.add_object.assert_called_once()
+
+
+def test_vectorize_sample_rate_traces_only_sampled_calls(mock_decorator_deps, monkeypatch):
+    """
+    Case 1-4: With sample_rate < 1.0, unsampled calls run the function without writing a span
+    """
+    mock_batch = mock_decorator_deps["batch"]
+    draws = iter([0.9, 0.1, 0.7])
+    monkeypatch.setattr("vectorwave.core.decorator.random.random", lambda: next(draws))
+
+    @vectorize(search_description="Sampled desc", sample_rate=0.5)
+    def my_sampled_function(x):
+        return x + 1
+
+    mock_batch.add_object.reset_mock()
+
+    assert [my_sampled_function(x) for x in range(3)] == [1, 2, 3]
+    assert my_sampled_function._is_vectorized is True
+    # Only the second draw (0.1) falls under the rate, so exactly one execution log is written.
+    mock_batch.add_object.assert_called_once()
+    assert mock_batch.add_object.call_args.kwargs["collection"] == "TestExecutions"
+
+    with pytest.raises(ValueError):
+        vectorize(sample_rate=1.5)
+
+
 def test_vectorize_dynamic_data_logging_success(mock_decorator_deps):
     """
     Case 2: Test if the decorated function adds a log to 'VectorWaveExecutions' (dynamic) on 'successful' execution
@@ -369,4 +369,31 @@ def test_tracer_input_vector_data_and_masking(mock_caching_deps):
     props = input_data["properties"]
     assert props["function"] == "test_func"
     assert props["kwargs"]["amount"] == 100
-    assert props["kwargs"]["secret_key"] == "[MASKED]"
\ No newline at end of file
+    assert props["kwargs"]["secret_key"] == "[MASKED]"
+
+
+def test_tracer_input_vector_data_without_arguments():
+    """
+    Tests that a call with no arguments yields the bare context text and empty properties.
+    """
+    input_data = _create_input_vector_data(
+        func_name="test_func", args=(), kwargs={}, sensitive_keys=set()
+    )
+
+    assert input_data["text"] == "Function Context: test_func"
+    assert input_data["properties"] == {"function": "test_func", "args": [], "kwargs": {}}
+
+
+def test_tracer_input_vector_data_uses_native_text_builder(monkeypatch):
+    """
+    When the Rust core exposes build_vector_text, it receives the masked args/kwargs.
+    """
+    native = MagicMock(return_value="native text")
+    monkeypatch.setattr("vectorwave.monitoring.tracer._native_build_vector_text", native)
+
+    input_data = _create_input_vector_data(
+        func_name="test_func", args=(1,), kwargs={"secret_key": "x"}, sensitive_keys={"secret_key"}
+    )
+
+    assert input_data["text"] == "native text"
+    native.assert_called_once_with("test_func", [1], {"secret_key": "[MASKED]"})
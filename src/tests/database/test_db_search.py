@@ -7,6 +7,8 @@ import weaviate
 from vectorwave.database.db_search import (
     search_functions,
     search_executions,
+    search_functions_hybrid,
+    search_functions_hybrid_multi,
     _build_weaviate_filters
 )
 from vectorwave.models.db_config import WeaviateSettings
@@ -96,6 +98,44 @@ def test_search_functions_with_filters(mock_search_deps):
     assert call_args.kwargs['filters'] is not None
 
 
+# --- Tests for search_functions_hybrid(_multi) ---
+
+def test_search_functions_hybrid_passes_alpha_and_vector(mock_search_deps, monkeypatch):
+    mock_query = mock_search_deps["query"]
+    mock_query.hybrid.return_value = MagicMock(objects=[])
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed.return_value = [0.1, 0.2]
+    monkeypatch.setattr("vectorwave.database.db_search.get_vectorizer", lambda: mock_vectorizer)
+
+    assert search_functions_hybrid(query="pay", limit=2, alpha=0.3) == []
+
+    mock_query.hybrid.assert_called_once_with(
+        query="pay",
+        vector=[0.1, 0.2],
+        alpha=0.3,
+        limit=2,
+        filters=None,
+        return_metadata=wvc.query.MetadataQuery(score=True, distance=True)
+    )
+
+
+def test_search_functions_hybrid_multi_embeds_query_once(mock_search_deps, monkeypatch):
+    mock_query = mock_search_deps["query"]
+    mock_obj = MagicMock(properties={"function_name": "pay"}, uuid="u-1")
+    mock_query.hybrid.return_value = MagicMock(objects=[mock_obj])
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed.return_value = [0.1, 0.2]
+    monkeypatch.setattr("vectorwave.database.db_search.get_vectorizer", lambda: mock_vectorizer)
+
+    results = search_functions_hybrid_multi(query="pay", alphas=[0.1, 0.5, 0.9], limit=3)
+
+    mock_vectorizer.embed.assert_called_once_with("pay")
+    assert [c.kwargs["alpha"] for c in mock_query.hybrid.call_args_list] == [0.1, 0.5, 0.9]
+    assert all(c.kwargs["vector"] == [0.1, 0.2] for c in mock_query.hybrid.call_args_list)
+    assert list(results) == [0.1, 0.5, 0.9]
+    assert results[0.5][0]["properties"] == {"function_name": "pay"}
+
+
 # --- Tests for search_executions ---
 
 @pytest.fixture
@@ -160,4 +200,11 @@ def test_search_executions_filter_and_sort_duration(mock_search_exec_deps):
     assert call_args.kwargs['filters'] is not None
 
     sort_arg = call_args.kwargs['sort']
-    assert sort_arg is not None
\ No newline at end of file
+    assert sort_arg is not None
+
+def test_search_executions_passes_return_properties(mock_search_exec_deps):
+    mock_collection = mock_search_exec_deps["collection"]
+    search_executions(limit=2, return_properties=["error_message", "return_value"])
+
+    call_args = mock_collection.query.fetch_objects.call_args
+    assert call_args.kwargs["return_properties"] == ["error_message", "return_value"]
@@ -3,7 +3,7 @@ import json
 from unittest.mock import patch, mock_open, call
 from json import JSONDecodeError
 # Function to test
-from vectorwave.models.db_config import get_weaviate_settings
+from vectorwave.models.db_config import get_weaviate_settings, WeaviateSettings
 
 # --- Mock Data ---
 
@@ -183,4 +183,17 @@ def test_get_settings_sensitive_keys_default(mock_exists, monkeypatch): # <-- FI
 
     # 3. Assert: check default for 5
     assert settings.sensitive_keys == {"password", "api_key", "token", "secret", "auth_token"}
-    assert len(settings.sensitive_keys) == 5
\ No newline at end of file
+    assert len(settings.sensitive_keys) == 5
+
+def test_allowed_custom_keys_is_cached_and_invalidated():
+    """
+    allowed_custom_keys is built once and rebuilt when custom_properties is reassigned
+    """
+    settings = WeaviateSettings(custom_properties={"run_id": {"data_type": "TEXT"}})
+
+    first = settings.allowed_custom_keys
+    assert first == frozenset({"run_id"})
+    assert settings.allowed_custom_keys is first
+
+    settings.custom_properties = {"team": {"data_type": "TEXT"}}
+    assert settings.allowed_custom_keys == frozenset({"team"})
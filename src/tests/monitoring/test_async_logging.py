@@ -1,33 +1,42 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from contextvars import ContextVar
 
-from vectorwave.monitoring.tracer import trace_span, TraceCollector
-from vectorwave.models.db_config import WeaviateSettings
+from vectorwave.monitoring.tracer import trace_span
 from vectorwave.utils.context import execution_source_context
 
 # --- Fixtures ---
 
 @pytest.fixture
 def mock_settings():
-    """Settings object for testing"""
-    settings = MagicMock(spec=WeaviateSettings)
-    settings.ASYNC_LOGGING = False  # Default value
-    settings.SENSITIVE_FIELD_NAMES = "password,secret"
-    settings.sensitive_keys = {"password", "secret"}
-    settings.ignored_error_codes = set()
-    settings.DRIFT_DETECTION_ENABLED = False
-    return settings
+    """Settings object for testing (plain namespace; no spec introspection)"""
+    return SimpleNamespace(
+        ASYNC_LOGGING=False,  # Default value
+        SENSITIVE_FIELD_NAMES="password,secret",
+        sensitive_keys={"password", "secret"},
+        ignored_error_codes=set(),
+        failure_mapping=None,
+        global_custom_values=None,
+        DRIFT_DETECTION_ENABLED=False,
+        EMBED_SHED_THRESHOLD=0,
+        EXECUTION_COLLECTION_NAME="TestExecutions",
+    )
 
 @pytest.fixture
 def mock_tracer(mock_settings):
-    """TraceCollector object for testing"""
-    tracer = MagicMock(spec=TraceCollector)
-    tracer.settings = mock_settings
-    tracer.batch = MagicMock()
-    tracer.alerter = MagicMock()
-    tracer.alert_sent = False
-    return tracer
+    """TraceCollector stand-in for testing; only batch/alerter need call tracking"""
+    return SimpleNamespace(
+        trace_id="test-trace-id",
+        settings=mock_settings,
+        batch=MagicMock(),
+        alerter=MagicMock(),
+        vectorizer=None,
+        base_span_template={},
+        alert_sent=False,
+        pending_spans=None,
+        pending_lock=None,
+    )
 
 # --- Tests ---
 
@@ -160,4 +169,115 @@ async def test_async_wrapper_logging(mock_tracer):
 
         assert result == "async_result"
         mock_submit.assert_called_once()
-        assert mock_submit.call_args[0][0] == mock_perform
\ No newline at end of file
+        assert mock_submit.call_args[0][0] == mock_perform
+
+def test_bounded_executor_runs_inline_when_full():
+    """
+    [Case 6] Once the pending cap is reached, submit() runs the task in the caller thread.
+    """
+    import threading
+    from vectorwave.monitoring.tracer import _BoundedExecutor
+
+    executor = _BoundedExecutor(max_pending=1, max_workers=1)
+    release = threading.Event()
+    try:
+        blocked = executor.submit(release.wait)
+
+        caller = threading.get_ident()
+        inline = executor.submit(threading.get_ident)
+
+        assert inline.done()
+        assert inline.result() == caller
+        assert executor.caller_runs == 1
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+    assert blocked.result() is True
+
+
+def test_bounded_executor_wait_idle():
+    """
+    [Case 6-1] wait_idle() blocks until every submitted task has finished.
+    """
+    import threading
+    from vectorwave.monitoring.tracer import _BoundedExecutor
+
+    executor = _BoundedExecutor(max_pending=4, max_workers=1)
+    release = threading.Event()
+    try:
+        assert executor.wait_idle(timeout=0) is True
+        executor.submit(release.wait)
+        assert executor.wait_idle(timeout=0.01) is False
+        release.set()
+        assert executor.wait_idle(timeout=1) is True
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+
+def test_background_logging_does_not_need_submitter_context(mock_tracer):
+    """
+    [Case 7] Logging on a real worker thread (which does not inherit the caller's
+    contextvars) still records exec_source, because SpanContext carries it.
+    """
+    from vectorwave.monitoring.tracer import _background_executor
+
+    mock_tracer.settings.ASYNC_LOGGING = True
+    real_submit = _background_executor.submit
+    futures = []
+
+    def spy_submit(fn, *args, **kwargs):
+        future = real_submit(fn, *args, **kwargs)
+        futures.append(future)
+        return future
+
+    token = execution_source_context.set("WORKER_CHECK")
+    try:
+        with patch('vectorwave.monitoring.tracer.current_tracer_var') as mock_ctx_var, \
+                patch.object(_background_executor, 'submit', side_effect=spy_submit):
+            mock_ctx_var.get.return_value = mock_tracer
+
+            @trace_span()
+            def worker_func():
+                return "ok"
+
+            worker_func()
+            futures[0].result(timeout=5)
+    finally:
+        execution_source_context.reset(token)
+
+    props = mock_tracer.batch.add_object.call_args.kwargs["properties"]
+    assert props["exec_source"] == "WORKER_CHECK"
+
+
+def test_flush_spans_submits_one_task_per_trace(mock_settings):
+    """
+    [Case 8] trace_root(flush_spans=True) buffers async spans and submits them together
+    when the root returns.
+    """
+    from vectorwave.monitoring.tracer import trace_root, _log_span_batch
+
+    mock_settings.ASYNC_LOGGING = True
+
+    @trace_span()
+    def child(x):
+        return x * 2
+
+    @trace_root(flush_spans=True)
+    @trace_span()
+    def root(x):
+        return child(x) + child(x + 1)
+
+    with patch('vectorwave.monitoring.tracer.get_weaviate_settings', return_value=mock_settings), \
+            patch('vectorwave.monitoring.tracer.get_batch_manager', return_value=MagicMock()), \
+            patch('vectorwave.monitoring.tracer.get_alerter', return_value=MagicMock()), \
+            patch('vectorwave.monitoring.tracer.get_vectorizer', return_value=None), \
+            patch('vectorwave.monitoring.tracer._background_executor.submit') as mock_submit:
+        assert root(1) == 6
+
+    mock_submit.assert_called_once()
+    fn, spans = mock_submit.call_args[0]
+    assert fn is _log_span_batch
+    assert [ctx.func.__name__ for ctx in spans] == ["child", "child", "root"]
+    assert spans[0].tracer.pending_spans is None  # later spans log directly
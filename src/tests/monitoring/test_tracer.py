@@ -421,3 +421,88 @@ def test_enable_alert_false_default_is_true(mock_tracer_deps):
     my_workflow()
 
     mock_alerter.notify.assert_called_once()
+
+
+def test_native_span_payload_is_used_when_available(mock_tracer_deps, monkeypatch):
+    """
+    When the Rust core exposes build_span_payload, attributes come from that single call.
+    """
+    mock_batch = mock_tracer_deps["batch"]
+    mock_native = MagicMock(return_value=({"team": "from-native"}, None))
+    monkeypatch.setattr(f"{TRACER_MODULE_PATH}._native_build_span_payload", mock_native)
+
+    @trace_root()
+    @trace_span(attributes_to_capture=["team"])
+    def native_workflow(team):
+        return "ok"
+
+    native_workflow(team="billing")
+
+    mock_native.assert_called_once()
+    args = mock_native.call_args.args
+    assert args[0] == "native_workflow"
+    assert args[1]["team"] == "billing"
+    assert args[5] == ["team"]
+
+    props = mock_batch.add_object.call_args.kwargs["properties"]
+    assert props["team"] == "from-native"
+
+
+def test_fast_binder_matches_signature_bind():
+    """
+    The decoration-time binder yields the same values as sig.bind + apply_defaults.
+    """
+    import inspect
+    from vectorwave.monitoring.tracer import _make_fast_binder
+
+    def target(a, b=2, *rest, c, d="dflt", **extra):
+        pass
+
+    binder = _make_fast_binder(target)
+    sig = inspect.signature(target)
+
+    for args, kwargs in [((1,), {"c": 3}), ((1, 5, 6, 7), {"c": 3, "d": "x"}), ((), {"a": 1, "c": 3})]:
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        assert binder(args, kwargs) == dict(bound.arguments)
+
+
+def test_input_embedding_shed_when_batch_backed_up(mock_tracer_deps, monkeypatch):
+    """
+    Successful spans skip input embedding while the batch queue exceeds EMBED_SHED_THRESHOLD.
+    """
+    mock_batch = mock_tracer_deps["batch"]
+    mock_batch.pending_size.return_value = 500
+    mock_tracer_deps["settings"].EMBED_SHED_THRESHOLD = 100
+
+    mock_vectorizer = MagicMock()
+    monkeypatch.setattr(f"{TRACER_MODULE_PATH}.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    @trace_root()
+    @trace_span(capture_return_value=True)
+    def busy_workflow(x):
+        return x + 1
+
+    assert busy_workflow(1) == 2
+    mock_vectorizer.embed.assert_not_called()
+
+    mock_batch.pending_size.return_value = 0
+    busy_workflow(2)
+    mock_vectorizer.embed.assert_called_once()
+
+
+def test_env_positive_int_falls_back_on_bad_values(monkeypatch):
+    """
+    Case: A malformed VECTORWAVE_QUEUE_SIZE warns and uses the default instead of raising at import
+    """
+    from vectorwave.monitoring.tracer import _env_positive_int
+
+    monkeypatch.setenv("VECTORWAVE_QUEUE_SIZE", "2048")
+    assert _env_positive_int("VECTORWAVE_QUEUE_SIZE", 1024) == 2048
+
+    for bad in ("lots", "", "0", "-5"):
+        monkeypatch.setenv("VECTORWAVE_QUEUE_SIZE", bad)
+        assert _env_positive_int("VECTORWAVE_QUEUE_SIZE", 1024) == 1024
+
+    monkeypatch.delenv("VECTORWAVE_QUEUE_SIZE")
+    assert _env_positive_int("VECTORWAVE_QUEUE_SIZE", 1024) == 1024
@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from unittest.mock import patch, mock_open, ANY, MagicMock
 from vectorwave.utils.function_cache import FunctionCacheManager
 
@@ -38,7 +39,7 @@ def test_calculate_content_hash_sensitivity_id():
 def test_calculate_content_hash_order_invariance():
     """
     Tests that different dictionary key orders return the same hash,
-    due to json.dumps(sort_keys=True).
+    because properties are hashed in sorted key order.
     """
     props1 = {"a": 1, "b": 2}
     props2 = {"b": 2, "a": 1} # Changed order
@@ -49,6 +50,18 @@ def test_calculate_content_hash_order_invariance():
     assert hash1 == hash2
 
 
+def test_calculate_content_hash_nested_order_invariance():
+    """Key order inside nested dict values does not change the hash either."""
+    props1 = {"tags": {"team": "a", "env": "prod"}, "args": [{"x": 1, "y": 2}]}
+    props2 = {"args": [{"y": 2, "x": 1}], "tags": {"env": "prod", "team": "a"}}
+
+    hash1 = FunctionCacheManager.calculate_content_hash("id1", props1)
+    hash2 = FunctionCacheManager.calculate_content_hash("id1", props2)
+
+    assert hash1 == hash2
+    assert len(hash1) == 64
+
+
 # --- 2. Tests for __init__ and _load_cache ---
 
 @patch("os.path.exists", return_value=False)
@@ -102,9 +115,10 @@ def test_is_cached_and_unchanged_logic(mock_exists):
     assert manager.is_cached_and_unchanged("uuid_C_NEW", "hash_C_123") == False
 
 @patch("os.path.exists", return_value=False)
+@patch("os.replace")
 @patch("json.dump") # Mock json.dump
 @patch("builtins.open", new_callable=mock_open)
-def test_update_cache_calls_save(mock_file, mock_json_dump, mock_exists):
+def test_update_cache_calls_save(mock_file, mock_json_dump, mock_replace, mock_exists):
     """Tests if update_cache updates self.cache and calls _save_cache."""
     manager = FunctionCacheManager()
     assert manager.cache == {}
@@ -115,8 +129,10 @@ def test_update_cache_calls_save(mock_file, mock_json_dump, mock_exists):
     expected_cache = {"uuid_new": {"hash": "hash_new_123", "metadata": None}}
     assert manager.cache == expected_cache
 
-    # 2. Check if _save_cache was called and attempted to write to the file
-    mock_file.assert_called_once_with("./.vectorwave_functions_cache.json", 'w', encoding='utf-8')
+    # 2. Check if _save_cache wrote a temp file and swapped it in atomically
+    tmp_path = f"./.vectorwave_functions_cache.json.{os.getpid()}.tmp"
+    mock_file.assert_called_once_with(tmp_path, 'w', encoding='utf-8')
+    mock_replace.assert_called_once_with(tmp_path, "./.vectorwave_functions_cache.json")
 
     # 3. Check if json.dump was called with the correct arguments (indent, sort_keys)
     mock_json_dump.assert_called_once_with(
@@ -124,4 +140,24 @@ def test_update_cache_calls_save(mock_file, mock_json_dump, mock_exists):
         ANY, # 2. The mock_file handle
         indent=4,
         sort_keys=True
-    )
\ No newline at end of file
+    )
+
+
+def test_concurrent_updates_keep_cache_file_valid(tmp_path):
+    """Concurrent registrations serialize on the lock and leave a complete JSON file."""
+    import threading
+
+    manager = FunctionCacheManager(cache_dir=str(tmp_path))
+    threads = [
+        threading.Thread(target=manager.update_cache, args=(f"uuid_{i}", f"hash_{i}"))
+        for i in range(32)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(manager.cache_path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert len(saved) == 32
+    assert saved["uuid_7"] == {"hash": "hash_7", "metadata": None}
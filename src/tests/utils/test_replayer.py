@@ -287,4 +287,379 @@ def test_replay_with_mocks_side_effect(mock_replayer_deps):
     )
 
     assert result["passed"] == 1
-    assert result["failed"] == 0
\ No newline at end of file
+    assert result["failed"] == 0
+
+def _double_or_fail(x):
+    from vectorwave.utils.context import execution_source_context
+    assert execution_source_context.get() == "REPLAY"
+    if x < 0:
+        raise ValueError("negative input")
+    return x * 2
+
+
+def test_replay_parallel_workers_keep_log_order(mock_replayer_deps):
+    """[Case 9] max_workers > 1: sync replays run concurrently, results stay in log order"""
+    replayer = VectorWaveReplayer()
+    mock_logs = [
+        create_mock_log("uuid-p-1", {"x": 1}, 2),
+        create_mock_log("uuid-p-2", {"x": -1}, 0),
+        create_mock_log("uuid-p-3", {"x": 3}, 7),
+        create_mock_log("uuid-p-4", {"x": 4}, 8),
+    ]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    result = replayer.replay("tests.utils.test_replayer._double_or_fail", limit=4, max_workers=4)
+
+    assert result["total"] == 4
+    assert result["passed"] == 2
+    assert result["failed"] == 2
+    assert [f["uuid"] for f in result["failures"]] == ["uuid-p-2", "uuid-p-3"]
+    assert result["failures"][0]["actual"] == "EXCEPTION_RAISED"
+    assert "negative input" in result["failures"][0]["traceback"]
+    assert result["failures"][0]["diff_html"].startswith("<div class='error'><pre>Traceback")
+
+
+async def _async_echo_after_peers(x):
+    from vectorwave.utils.context import execution_source_context
+    assert execution_source_context.get() == "REPLAY"
+    _async_echo_after_peers.loops.append(asyncio.get_running_loop())
+    await asyncio.sleep(0.01)
+    return x
+
+
+def test_replay_async_logs_share_one_event_loop(mock_replayer_deps):
+    """[Case 10] Async replays are gathered on a single event loop"""
+    replayer = VectorWaveReplayer()
+    mock_logs = [create_mock_log(f"uuid-a-{i}", {"x": i}, i) for i in range(5)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+    _async_echo_after_peers.loops = []
+
+    result = replayer.replay("tests.utils.test_replayer._async_echo_after_peers", limit=5)
+
+    assert result["passed"] == 5
+    assert len(_async_echo_after_peers.loops) == 5
+    assert all(loop is _async_echo_after_peers.loops[0] for loop in _async_echo_after_peers.loops)
+
+
+def test_replay_fetches_only_needed_properties(mock_replayer_deps):
+    """[Case 11] Execution logs are fetched with a projection onto the target's params + return_value"""
+    from types import SimpleNamespace
+
+    replayer = VectorWaveReplayer()
+    mock_replayer_deps["collection"].config.get.return_value.properties = [
+        SimpleNamespace(name=n) for n in ("a", "b", "source_code", "return_value", "trace_id")
+    ]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = [create_mock_log("uuid-1", {"a": 1, "b": 2}, 3)]
+
+    mock_func = MagicMock(return_value=3)
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter('b', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter('c', inspect.Parameter.POSITIONAL_OR_KEYWORD, default=0)
+    ])
+
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(add=mock_func)
+        result = replayer.replay("my_module.add", limit=1)
+
+    assert result["passed"] == 1
+    exec_call = mock_replayer_deps["query"].fetch_objects.call_args_list[-1]
+    assert exec_call.kwargs["return_properties"] == ["a", "b", "return_value"]
+
+
+def test_replay_update_baseline_many(mock_replayer_deps):
+    """[Case 12] Several drifted baselines are all written after the loop"""
+    replayer = VectorWaveReplayer()
+    mock_logs = [create_mock_log(f"uuid-u-{i}", {"msg": str(i)}, "Old") for i in range(3)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    mock_func = MagicMock(return_value="New")
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('msg', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(greet=mock_func)
+        result = replayer.replay("my_module.greet", update_baseline=True)
+
+    assert result["updated"] == 3
+    updated = {c.kwargs["uuid"] for c in mock_replayer_deps["data"].update.call_args_list}
+    assert updated == {"uuid-u-0", "uuid-u-1", "uuid-u-2"}
+
+
+def test_semantic_replay_embeds_all_pairs_in_one_batch(mock_replayer_deps, monkeypatch):
+    """[Case 13] Similarity mode embeds every non-exact pair with a single embed_batch call"""
+    from vectorwave.utils.replayer_semantic import SemanticReplayer
+
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed_batch.side_effect = lambda texts: [
+        [1.0, 0.0] if text.startswith("Hello") else [0.0, 1.0] for text in texts
+    ]
+    monkeypatch.setattr("vectorwave.utils.replayer_semantic.get_llm_client", MagicMock())
+    monkeypatch.setattr("vectorwave.utils.replayer_semantic.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    replayer = SemanticReplayer()
+    mock_logs = [
+        create_mock_log("uuid-s-1", {"msg": "a"}, "Hello there"),
+        create_mock_log("uuid-s-2", {"msg": "b"}, "Goodbye"),
+        create_mock_log("uuid-s-3", {"msg": "c"}, "Hello, world"),
+    ]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    mock_func = MagicMock(return_value="Hello world")
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('msg', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(greet=mock_func)
+        result = replayer.replay("my_module.greet", similarity_threshold=0.9)
+
+    assert result["passed"] == 2
+    assert [f["uuid"] for f in result["failures"]] == ["uuid-s-2"]
+    mock_vectorizer.embed_batch.assert_called_once()
+    # Three distinct baselines plus the one actual output they are all compared with
+    assert sorted(mock_vectorizer.embed_batch.call_args.args[0]) == [
+        "Goodbye", "Hello there", "Hello world", "Hello, world"
+    ]
+    mock_vectorizer.embed.assert_not_called()
+
+    # A second replay over the same outputs is served from the embedding cache
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(greet=mock_func)
+        replayer.replay("my_module.greet", similarity_threshold=0.9)
+    mock_vectorizer.embed_batch.assert_called_once()
+
+
+async def _async_track_in_flight(x):
+    state = _async_track_in_flight.state
+    state["now"] += 1
+    state["peak"] = max(state["peak"], state["now"])
+    await asyncio.sleep(0.01)
+    state["now"] -= 1
+    return x
+
+
+def test_replay_async_concurrency_is_bounded(mock_replayer_deps):
+    """[Case 14] Async replays overlap, but never more than max_workers at once"""
+    replayer = VectorWaveReplayer()
+    mock_logs = [create_mock_log(f"uuid-b-{i}", {"x": i}, i) for i in range(6)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+    _async_track_in_flight.state = {"now": 0, "peak": 0}
+
+    result = replayer.replay("tests.utils.test_replayer._async_track_in_flight", limit=6, max_workers=2)
+
+    assert result["passed"] == 6
+    assert _async_track_in_flight.state["peak"] == 2
+
+
+def test_replay_auto_workers_runs_sync_logs_concurrently(mock_replayer_deps):
+    """[Case 15] max_workers=None sizes the thread pool from the number of logs"""
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_peers(x):
+        barrier.wait()
+        return x
+
+    mock_func = MagicMock(side_effect=wait_for_peers)
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('x', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+    mock_logs = [create_mock_log(f"uuid-w-{i}", {"x": i}, i) for i in range(3)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    replayer = VectorWaveReplayer()
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(work=mock_func)
+        result = replayer.replay("my_module.work", limit=3, max_workers=None)
+
+    # Each call blocks until all three are in flight, so this only passes with a pool of >= 3.
+    assert result["passed"] == 3
+
+
+def test_replay_resolves_golden_inputs_in_one_query(mock_replayer_deps_v2):
+    """[Case 16] Several Golden Data entries resolve their original logs with a single by-id query"""
+    orig_ids = {i: f"00000000-0000-0000-0000-00000000000{i}" for i in (1, 2)}
+    golden_objs = []
+    for i in (1, 2):
+        golden_obj = MagicMock()
+        golden_obj.uuid = f"golden-{i}"
+        golden_obj.properties = {"original_uuid": orig_ids[i], "return_value": str(i * 2)}
+        golden_objs.append(golden_obj)
+    mock_replayer_deps_v2["golden_col"].query.fetch_objects.return_value.objects = golden_objs
+
+    orig_logs = []
+    for i in (2, 1):  # returned out of order on purpose
+        orig_log = MagicMock()
+        orig_log.uuid = orig_ids[i]
+        orig_log.properties = {"x": i}
+        orig_logs.append(orig_log)
+    mock_replayer_deps_v2["exec_col"].query.fetch_objects.return_value.objects = orig_logs
+
+    mock_func = MagicMock(side_effect=lambda x: x * 2)
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('x', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+
+    replayer = VectorWaveReplayer()
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(double=mock_func)
+        result = replayer.replay("mod.double", limit=2)
+
+    assert result["total"] == 2
+    assert result["passed"] == 2
+    mock_replayer_deps_v2["exec_col"].query.fetch_object_by_id.assert_not_called()
+    mock_replayer_deps_v2["exec_col"].query.fetch_objects.assert_called_once()
+    assert mock_replayer_deps_v2["exec_col"].query.fetch_objects.call_args.kwargs["limit"] == 2
+
+
+def test_replay_pages_large_limits_by_timestamp(mock_replayer_deps):
+    """[Case 17] Limits above one page are fetched page by page without repeating tied logs"""
+    from datetime import datetime, timedelta, timezone
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def make_log(i, ts):
+        obj = MagicMock()
+        obj.uuid = f"uuid-pg-{i}"
+        obj.properties = {"x": i, "return_value": str(i), "timestamp_utc": ts}
+        return obj
+
+    first_page = [make_log(i, base - timedelta(seconds=i)) for i in range(998)]
+    tied_ts = base - timedelta(seconds=998)
+    tied = [make_log(998, tied_ts), make_log(999, tied_ts)]
+    first_page += tied
+    second_page = tied + [make_log(1000 + i, tied_ts - timedelta(seconds=i)) for i in range(200)]
+    mock_replayer_deps["query"].fetch_objects.side_effect = [
+        MagicMock(objects=[]),  # Golden Data
+        MagicMock(objects=first_page),
+        MagicMock(objects=second_page),
+    ]
+
+    replayer = VectorWaveReplayer()
+    candidates = replayer._fetch_test_candidates("func", limit=1200)
+
+    assert len(candidates) == 1200
+    assert len({c["uuid"] for c in candidates}) == 1200
+    limits = [c.kwargs["limit"] for c in mock_replayer_deps["query"].fetch_objects.call_args_list[1:]]
+    assert limits == [1000, 202]
+
+
+def test_semantic_replay_reuses_llm_verdicts(mock_replayer_deps, monkeypatch):
+    """[Case 18] Identical (expected, actual) mismatches are judged by the LLM only once"""
+    from vectorwave.utils.replayer_semantic import SemanticReplayer
+
+    mock_llm = MagicMock()
+    mock_llm.create_chat_completion.return_value = "true"
+    monkeypatch.setattr("vectorwave.utils.replayer_semantic.get_llm_client", MagicMock(return_value=mock_llm))
+
+    replayer = SemanticReplayer()
+    mock_logs = [create_mock_log(f"uuid-l-{i}", {"msg": "m"}, "Hi there") for i in range(3)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    mock_func = MagicMock(return_value="Hello there")
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('msg', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(greet=mock_func)
+        result = replayer.replay("my_module.greet", semantic_eval=True)
+
+    assert result["passed"] == 3
+    mock_llm.create_chat_completion.assert_called_once()
+
+
+def test_compare_results_structural_equality(mock_replayer_deps):
+    """[Case 19] Containers compare structurally: list/tuple alike, floats within tolerance"""
+    replayer = VectorWaveReplayer()
+
+    assert replayer._compare_results({"a": [1, 2], "b": 0.1 + 0.2}, {"b": 0.3, "a": (1, 2)})
+    assert replayer._compare_results([{"x": float("nan")}], ({"x": float("nan")},))
+    assert not replayer._compare_results({"a": [1, 2]}, {"a": [2, 1]})
+    assert not replayer._compare_results([True], (1,))
+
+
+def test_generate_diff_html_bounds_large_outputs(mock_replayer_deps):
+    """[Case 20] Long outputs are diffed by head/tail only; huge ones are summarised"""
+    replayer = VectorWaveReplayer()
+
+    lines = [f"line {i}" for i in range(1000)]
+    kept = replayer._truncate_for_diff(lines)
+    assert kept[:100] == lines[:100] and kept[-100:] == lines[-100:]
+    assert kept[100] == "... (800 lines omitted) ..."
+    assert replayer._truncate_for_diff(lines[:5]) == lines[:5]
+    assert '<span class="diff_chg">X</span>' in replayer._generate_diff_html(lines, lines[:-1] + ["line X"])
+
+    huge = "x" * 600_000
+    summary = replayer._generate_diff_html(huge, huge + "y")
+    assert summary.startswith("<pre class='diff-summary'>")
+    assert "600002 chars" in summary  # repr adds the quotes
+
+
+def test_semantic_replay_judges_distinct_pairs_concurrently(mock_replayer_deps, monkeypatch):
+    """[Case 21] Distinct LLM-stage mismatches are judged up front, in parallel, with the small model"""
+    import threading
+    from vectorwave.utils.replayer_semantic import SemanticReplayer
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def judge(**kwargs):
+        barrier.wait()  # only returns once all three judgements are in flight
+        return "false" if "Expected: Bye" in kwargs["messages"][0]["content"] else "true"
+
+    mock_llm = MagicMock()
+    mock_llm.create_chat_completion.side_effect = judge
+    monkeypatch.setattr("vectorwave.utils.replayer_semantic.get_llm_client", MagicMock(return_value=mock_llm))
+
+    replayer = SemanticReplayer()
+    mock_logs = [create_mock_log(f"uuid-j-{i}", {"msg": "m"}, text) for i, text in enumerate(["Hi", "Hey", "Bye"])]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    mock_func = MagicMock(return_value="Hello")
+    mock_func.__signature__ = inspect.Signature([
+        inspect.Parameter('msg', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ])
+
+    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
+        mock_import.return_value = MagicMock(greet=mock_func)
+        result = replayer.replay("my_module.greet", semantic_eval=True)
+
+    assert result["passed"] == 2
+    assert [f["uuid"] for f in result["failures"]] == ["uuid-j-2"]
+    assert mock_llm.create_chat_completion.call_count == 3
+    assert mock_llm.create_chat_completion.call_args.kwargs["model"] == "gpt-4o-mini"
+    assert mock_llm.create_chat_completion.call_args.kwargs["max_tokens"] == 5
+
+
+def test_get_semantic_replayer_is_shared(mock_replayer_deps, monkeypatch):
+    """[Case 22] get_semantic_replayer builds one replayer per judge model"""
+    from vectorwave.utils.replayer_semantic import SemanticReplayer, get_semantic_replayer
+
+    monkeypatch.setattr("vectorwave.utils.replayer_semantic.get_llm_client", MagicMock())
+    get_semantic_replayer.cache_clear()
+    try:
+        replayer = get_semantic_replayer()
+        assert isinstance(replayer, SemanticReplayer)
+        assert get_semantic_replayer() is replayer
+        assert get_semantic_replayer("gpt-4o").judge_model == "gpt-4o"
+    finally:
+        get_semantic_replayer.cache_clear()
+
+
+def test_compare_results_matches_json_stringified_keys(mock_replayer_deps):
+    """[Case 23] A recorded int/float/bool/None-keyed dict still matches after its JSON round-trip"""
+    from vectorwave.utils.serialization import serialize_return_value, deserialize_return_value
+
+    replayer = VectorWaveReplayer()
+    actual = {1: "a", 2: {2.5: "b", None: [False]}, "x": {True: 0}}
+    stored = serialize_return_value(actual)
+    expected = replayer._deserialize_value(stored)
+
+    assert expected == {"1": "a", "2": {"2.5": "b", "null": [False]}, "x": {"true": 0}}
+    assert replayer._compare_results(expected, actual)
+    assert replayer._compare_results(deserialize_return_value(stored), actual)
+    assert not replayer._compare_results(expected, {1: "a", 2: {2.5: "b", None: [True]}, "x": {True: 0}})
+    assert not replayer._compare_results({"1": "a"}, {2: "a"})
@@ -0,0 +1,62 @@
+from vectorwave.utils.serialization import serialize_return_value, serialize_lenient, deserialize_return_value
+
+
+def test_serialize_round_trip():
+    """Serialized values deserialize back to the same object."""
+    value = {"status": "ok", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+    assert deserialize_return_value(serialize_return_value(value)) == value
+
+
+def test_serialize_falls_back_for_big_ints():
+    """Integers beyond 64 bits are still serialized (stdlib fallback)."""
+    value = {"big": 2 ** 70, "items": [-(2 ** 70)]}
+
+    restored = deserialize_return_value(serialize_return_value(value))
+    assert restored == value
+    assert isinstance(restored["big"], int) and isinstance(restored["items"][0], int)
+    assert deserialize_return_value(str(2 ** 70)) == 2 ** 70
+    assert type(deserialize_return_value(str(2 ** 70))) is int
+
+
+def test_deserialize_passes_through_non_json():
+    """Plain strings and non-string values are returned unchanged."""
+    assert deserialize_return_value("not json") == "not json"
+    assert deserialize_return_value(42) == 42
+    assert deserialize_return_value(None) is None
+
+
+def test_serialize_lenient_stringifies_unknown_objects():
+    """serialize_lenient renders non-JSON values with str() instead of raising."""
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert deserialize_return_value(serialize_lenient({"x": Opaque(), "n": 1})) == {"x": "opaque", "n": 1}
+
+
+def test_deserialize_recognises_every_json_start():
+    """Values that start like JSON are parsed; other strings skip the parser."""
+    assert deserialize_return_value(' {"a": 1}') == {"a": 1}
+    assert deserialize_return_value("-1.5") == -1.5
+    assert deserialize_return_value("null") is None
+    assert deserialize_return_value("") == ""
+    assert deserialize_return_value("hello [world]") == "hello [world]"
+
+
+
+def test_serialize_keeps_non_finite_floats():
+    """NaN/Infinity are written by the stdlib instead of orjson's null."""
+    assert serialize_return_value({"nan": float("nan"), "v": [float("inf"), None]}) == \
+        '{"nan": NaN, "v": [Infinity, null]}'
+
+
+def test_deserialize_parses_non_finite_literals():
+    """NaN/Infinity literals fall back to the stdlib parser instead of staying strings."""
+    import math
+
+    assert math.isnan(deserialize_return_value("NaN"))
+    assert deserialize_return_value("Infinity") == float("inf")
+    assert deserialize_return_value("-Infinity") == float("-inf")
+    restored = deserialize_return_value(serialize_return_value({"nan": float("nan"), "v": [float("inf")]}))
+    assert math.isnan(restored["nan"]) and restored["v"] == [float("inf")]
@@ -0,0 +1,55 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from vectorwave.vectorizer.batcher import EmbedBatcher
+
+
+def test_concurrent_embeds_are_coalesced():
+    """Texts submitted within the delay window go out as one embed_batch call."""
+    vectorizer = MagicMock()
+    vectorizer.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    batcher = EmbedBatcher(vectorizer, max_batch=8, max_delay_ms=200)
+
+    futures = [batcher.submit(t) for t in ("a", "bb", "ccc")]
+    results = [f.result(timeout=2) for f in futures]
+    batcher.close()
+
+    assert results == [[1.0], [2.0], [3.0]]
+    vectorizer.embed_batch.assert_called_once_with(["a", "bb", "ccc"])
+    vectorizer.embed.assert_not_called()
+
+
+def test_batch_failure_propagates_to_every_caller():
+    """An embed_batch error is raised from each waiting Future."""
+    vectorizer = MagicMock()
+    vectorizer.embed_batch.side_effect = RuntimeError("model down")
+    batcher = EmbedBatcher(vectorizer, max_delay_ms=50)
+
+    futures = [batcher.submit("x"), batcher.submit("y")]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=2)
+    batcher.close()
+
+
+def test_full_queue_embeds_on_caller_thread():
+    """When the pending queue is full, submit() embeds inline."""
+    vectorizer = MagicMock()
+    vectorizer.embed.return_value = [0.5]
+    release = threading.Event()
+    vectorizer.embed_batch.side_effect = lambda texts: (release.wait(), [[0.0]] * len(texts))[1]
+    batcher = EmbedBatcher(vectorizer, max_batch=1, max_delay_ms=0, max_pending=1)
+
+    try:
+        batcher.submit("first")       # picked up by the worker, which then blocks
+        threading.Event().wait(0.05)
+        batcher.submit("second")      # fills the queue
+        inline = batcher.submit("third")
+
+        assert inline.done()
+        assert inline.result() == [0.5]
+    finally:
+        release.set()
+        batcher.close()
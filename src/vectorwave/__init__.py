@@ -1,7 +1,8 @@
 from .core.decorator import vectorize
 from .database.db import initialize_database, update_database_schema
-from .database.db_search import search_functions, search_executions, search_errors_by_message, search_functions_hybrid
-from .monitoring.tracer import trace_span
+from .database.db_search import search_functions, search_executions, search_errors_by_message, search_functions_hybrid, \
+    search_functions_hybrid_multi
+from .monitoring.tracer import trace_span, flush, enable_tracing, disable_tracing
 from .search.rag_search import search_and_answer, analyze_trace_log
 from .core.generator import generate_and_register_metadata
 from .utils.healer import VectorWaveHealer
@@ -15,9 +16,13 @@ __all__ = [
     'initialize_database',
     'search_functions',
     'search_functions_hybrid',
+    'search_functions_hybrid_multi',
     'search_executions',
     'search_errors_by_message',
     'trace_span',
+    'flush',
+    'enable_tracing',
+    'disable_tracing',
     'search_and_answer',
     'analyze_trace_log',
     'generate_and_register_metadata',
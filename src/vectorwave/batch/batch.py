@@ -43,11 +43,18 @@ class WeaviateBatchManager:
         self.batch_threshold = self.settings.BATCH_THRESHOLD
         self.flush_interval = self.settings.FLUSH_INTERVAL_SECONDS
 
+        # Objects accepted by add_object vs. objects the flush callback has finished with;
+        # wait_until_flushed() blocks on the gap.
+        self._progress = threading.Condition()
+        self._added = 0
+        self._flushed = 0
+        self.dropped = 0  # objects rejected by a full queue (Python or Rust)
+
         # Connect to DB
         self._connect_client()
 
         if USE_RUST_CORE:
-            logger.info(f"🚀 [VectorWave] Rust Core Activated! (Threshold: {self.batch_threshold}, Interval: {self.flush_interval}s)")
+            logger.info("🚀 [VectorWave] Rust Core Activated! (Threshold: %s, Interval: %ss)", self.batch_threshold, self.flush_interval)
             self._rust_manager = RustBatchManager(
                 self._flush_batch_core,
                 self.batch_threshold,
@@ -77,7 +84,7 @@ class WeaviateBatchManager:
             if self.client:
                 self._initialized = True
         except Exception as e:
-            logger.warning(f"Initial DB connection failed: {e}")
+            logger.warning("Initial DB connection failed: %s", e)
             self._initialized = False
 
     def _start_python_worker(self):
@@ -90,8 +97,13 @@ class WeaviateBatchManager:
         [Public API] Adds an object to the batch queue.
         """
         if USE_RUST_CORE:
-
-            self._rust_manager.add_object(collection, properties, uuid, vector)
+            with self._progress:
+                # try_send never blocks; older builds return None instead of the accepted flag.
+                accepted = self._rust_manager.add_object(collection, properties, uuid, vector)
+                if accepted is False:
+                    self._record_drop()
+                else:
+                    self._added += 1
         else:
             # Python Legacy Queue
             item = {
@@ -100,15 +112,54 @@ class WeaviateBatchManager:
                 "uuid": uuid,
                 "vector": vector
             }
-            try:
-                self.queue.put_nowait(item)
-            except queue.Full:
-                logger.warning("🚨 VectorWave Log Queue is FULL. Dropping log.")
+            with self._progress:
+                try:
+                    self.queue.put_nowait(item)
+                except queue.Full:
+                    self._record_drop()
+                else:
+                    self._added += 1
+
+    def _record_drop(self):
+        """Counts a rejected object; callers hold self._progress."""
+        # Warn once; a warning per drop would add I/O exactly when the writer is behind.
+        self.dropped += 1
+        if self.dropped == 1:
+            logger.warning("🚨 VectorWave Log Queue is FULL. Dropping logs (see .dropped for the count).")
+
+    def pending_size(self) -> int:
+        """
+        [Public API] Number of objects queued and not yet flushed (0 if unknown).
+        """
+        if USE_RUST_CORE:
+            # Older Rust core builds do not expose the queue depth.
+            pending = getattr(self._rust_manager, "pending_size", None)
+            return pending() if pending is not None else 0
+        return self.queue.qsize()
+
+    def wait_until_flushed(self, timeout: Optional[float] = None) -> bool:
+        """
+        [Public API] Blocks until every object added so far has been handed to Weaviate
+        (or discarded by a failed flush). Returns False if the timeout expired first.
+        Items still waiting for the worker's threshold / interval are included, so this can
+        take up to FLUSH_INTERVAL_SECONDS.
+        """
+        with self._progress:
+            target = self._added
+            return self._progress.wait_for(lambda: self._flushed >= target, timeout)
 
     def _flush_batch_core(self, items: List[Dict[str, Any]]):
         """
         The actual flush logic called by either Rust or Python worker.
         """
+        try:
+            self._write_batch(items)
+        finally:
+            with self._progress:
+                self._flushed += len(items)
+                self._progress.notify_all()
+
+    def _write_batch(self, items: List[Dict[str, Any]]):
         if not items:
             return
 
@@ -132,7 +183,7 @@ class WeaviateBatchManager:
 
             if len(self.client.batch.failed_objects) > 0:
                 for failed in self.client.batch.failed_objects:
-                    logger.error(f"⚠️ Batch Item Failed: {failed.message}")
+                    logger.error("⚠️ Batch Item Failed: %s", failed.message)
 
         except RuntimeError:
             return
@@ -140,7 +191,7 @@ class WeaviateBatchManager:
             msg = str(e).lower()
             if "shutdown" in msg or "closed" in msg:
                 return
-            logger.error(f"❌ Batch Flush Error: {e}")
+            logger.error("❌ Batch Flush Error: %s", e)
 
     # --- Legacy Python Worker Methods (Only used if Rust is missing) ---
     def _python_worker_loop(self):
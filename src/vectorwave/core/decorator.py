@@ -1,14 +1,16 @@
 import inspect
 import logging
 import os
-from functools import wraps
+import random
+from functools import wraps, lru_cache
 from typing import List, Optional, Dict, Any
 
 from weaviate.util import generate_uuid5
 
 from ..batch.batch import get_batch_manager
 from ..models.db_config import get_weaviate_settings
-from ..monitoring.tracer import trace_root, trace_span
+from ..monitoring import tracer as _tracer_module
+from ..monitoring.tracer import trace_root, trace_span, _background_executor
 from ..utils.function_cache import function_cache_manager
 from ..utils.return_caching_utils import _check_and_return_cached_result
 from ..vectorizer.factory import get_vectorizer
@@ -19,6 +21,190 @@ logger = logging.getLogger(__name__)
 
 PENDING_FUNCTIONS: List[Dict[str, Any]] = []
 
+# Settings resolved once for all decorations, remembered together with the factory that
+# produced them so a swapped-out get_weaviate_settings (e.g. in tests) is picked up.
+_SETTINGS = None
+_SETTINGS_FACTORY = None
+
+
+def _get_settings():
+    global _SETTINGS, _SETTINGS_FACTORY
+    if _SETTINGS is None or _SETTINGS_FACTORY is not get_weaviate_settings:
+        _SETTINGS = get_weaviate_settings()
+        _SETTINGS_FACTORY = get_weaviate_settings
+    return _SETTINGS
+
+
+@lru_cache(maxsize=64)
+def _read_module_lines(filename: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Reads a source file once per (path, mtime, size), so every function decorated in it
+    shares the same lines while edits and reloads are still picked up.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        return tuple(f.readlines())
+
+
+def _get_function_source(func) -> str:
+    """
+    Returns the source of func (unwrapped through __wrapped__, like inspect.getsource),
+    slicing the cached module lines by the code object's first line. Falls back to
+    inspect.getsource when the file cannot be read.
+    """
+    target = inspect.unwrap(func)
+    code = getattr(target, "__code__", None)
+    if code is not None:
+        try:
+            stat = os.stat(code.co_filename)
+            lines = _read_module_lines(code.co_filename, stat.st_mtime_ns, stat.st_size)
+        except (OSError, UnicodeDecodeError):
+            lines = ()
+        start = code.co_firstlineno
+        if lines and 0 < start <= len(lines):
+            return "".join(inspect.getblock(lines[start - 1:]))
+    return inspect.getsource(func)
+
+
+def _get_param_names(func) -> tuple:
+    """
+    Returns the parameter names of func in signature order, read straight from the
+    code object. Falls back to inspect.signature for callables without one.
+    """
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return tuple(inspect.signature(func).parameters)
+
+    names = code.co_varnames
+    n_pos = code.co_argcount
+    n_all = n_pos + code.co_kwonlyargcount
+    positional, kwonly = names[:n_pos], names[n_pos:n_all]
+    varargs = varkw = ()
+    if code.co_flags & inspect.CO_VARARGS:
+        varargs = (names[n_all],)
+        n_all += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        varkw = (names[n_all],)
+    return positional + varargs + kwonly + varkw
+
+
+def _get_function_doc(func) -> str:
+    doc = func.__doc__
+    return inspect.cleandoc(doc) if isinstance(doc, str) else ""
+
+
+def _register_function(function_name: str, func_identifier: str, func_uuid: str,
+                       static_properties: Dict[str, Any], search_description: Optional[str],
+                       settings) -> None:
+    """
+    Writes a function definition to the DB unless the local cache shows it is unchanged.
+    """
+    try:
+        current_content_hash = function_cache_manager.calculate_content_hash(func_identifier, static_properties)
+
+        if function_cache_manager.is_cached_and_unchanged(func_uuid, current_content_hash):
+            logger.info("Function '%s' is UNCHANGED. Skipping DB write.", function_name)
+            return
+
+        logger.info("Function '%s' is NEW or CHANGED. Writing to DB.", function_name)
+        batch = get_batch_manager()
+        vectorizer = get_vectorizer()
+        vector_to_add = None
+
+        if vectorizer is not None and search_description:
+            try:
+                vector_to_add = vectorizer.embed(search_description)
+            except Exception as e:
+                logger.warning("Failed to vectorize '%s': %s", function_name, e)
+
+        batch.add_object(
+            collection=settings.COLLECTION_NAME,
+            properties=static_properties,
+            uuid=func_uuid,
+            vector=vector_to_add
+        )
+        function_cache_manager.update_cache(func_uuid, current_content_hash)
+    except Exception as e:
+        logger.error("Error registering function '%s': %s", function_name, e)
+
+
+@lru_cache(maxsize=None)
+def _compile_strip(strip_keys: frozenset):
+    """
+    Generates a function that pops each injected key from kwargs, with the keys baked in
+    as constants. Key sets are shared across functions with the same tags, hence the cache.
+    """
+    lines = ["def _strip(kwargs):"]
+    lines += [f"    kwargs.pop({key!r}, None)" for key in sorted(strip_keys)]
+    lines.append("    return kwargs")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_strip"]
+
+
+def _make_sync_inner(func, strip_keys: frozenset, attributes: tuple,
+                     capture_return_value: bool, force_sync: bool, enable_alert: bool,
+                     flush_spans: bool = False):
+    """
+    Builds the traced inner wrapper for a sync function. Not memoized: a cache keyed on
+    func would keep every decorated function (and its closure) alive for the process.
+    """
+    @trace_root(flush_spans=flush_spans)
+    @trace_span(
+        attributes_to_capture=list(attributes),
+        capture_return_value=capture_return_value,
+        force_sync=force_sync,
+        enable_alert=enable_alert
+    )
+    @wraps(func)
+    def inner_wrapper(*args, _vw_func=func, _vw_strip=_compile_strip(strip_keys), **kwargs):
+        # kwargs is a fresh dict per call, so stripping it in place is safe.
+        return _vw_func(*args, **_vw_strip(kwargs))
+
+    return inner_wrapper
+
+
+def _make_async_inner(func, strip_keys: frozenset, attributes: tuple,
+                      capture_return_value: bool, force_sync: bool, enable_alert: bool,
+                      flush_spans: bool = False):
+    """Async counterpart of _make_sync_inner."""
+    @trace_root(flush_spans=flush_spans)
+    @trace_span(
+        attributes_to_capture=list(attributes),
+        capture_return_value=capture_return_value,
+        force_sync=force_sync,
+        enable_alert=enable_alert
+    )
+    @wraps(func)
+    async def inner_wrapper(*args, _vw_func=func, _vw_strip=_compile_strip(strip_keys), **kwargs):
+        # kwargs is a fresh dict per call, so stripping it in place is safe.
+        return await _vw_func(*args, **_vw_strip(kwargs))
+
+    return inner_wrapper
+
+
+def _apply_sampling(func, traced_wrapper, sample_rate: float, is_async_func: bool):
+    """
+    Routes roughly a sample_rate fraction of calls through traced_wrapper; the rest call func
+    directly, with no span, embedding or write.
+    """
+    if is_async_func:
+        @wraps(func)
+        async def sampled_wrapper(*args, _vw_traced=traced_wrapper, _vw_rate=sample_rate,
+                                  _vw_random=random.random, **kwargs):
+            if _vw_random() < _vw_rate:
+                return await _vw_traced(*args, **kwargs)
+            return await func(*args, **kwargs)
+    else:
+        @wraps(func)
+        def sampled_wrapper(*args, _vw_traced=traced_wrapper, _vw_rate=sample_rate,
+                            _vw_random=random.random, **kwargs):
+            if _vw_random() < _vw_rate:
+                return _vw_traced(*args, **kwargs)
+            return func(*args, **kwargs)
+
+    sampled_wrapper._is_vectorized = True
+    return sampled_wrapper
+
 
 def vectorize(search_description: Optional[str] = None,
               sequence_narrative: Optional[str] = None,
@@ -32,10 +218,18 @@ def vectorize(search_description: Optional[str] = None,
               semantic_cache_filters: Optional[Dict[str, Any]] = None,
               semantic_cache_scope: Optional[List[str]] = None,
               enable_alert: bool = True,
+              flush_spans: bool = False,
+              sample_rate: float = 1.0,
               **execution_tags):
     """
     VectorWave Decorator with Auto-Generation support.
+    flush_spans=True holds this trace's asynchronously logged spans until the function
+    returns and hands them to the logger pool as a single task.
+    sample_rate < 1.0 traces only that fraction of calls (head sampling); the others run the
+    function untraced. Semantic cache lookups are skipped for untraced calls as well.
     """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"sample_rate must be between 0.0 and 1.0, got {sample_rate}")
 
     if semantic_cache:
         if get_vectorizer() is None:
@@ -68,18 +262,17 @@ def vectorize(search_description: Optional[str] = None,
 
         if capture_inputs or replay:
             try:
-                sig = inspect.signature(func)
-                for param_name in sig.parameters:
+                for param_name in _get_param_names(func):
                     if param_name not in ('self', 'cls') and param_name not in final_attributes:
                         final_attributes.append(param_name)
             except Exception as e:
-                logger.warning(f"Failed to inspect signature for auto-capture in '{function_name}': {e}")
+                logger.warning("Failed to inspect signature for auto-capture in '%s': %s", function_name, e)
 
         # Extract Execution Tags
         valid_execution_tags = {}
-        settings = get_weaviate_settings()
+        settings = _get_settings()
         if execution_tags and settings.custom_properties:
-            allowed_keys = set(settings.custom_properties.keys())
+            allowed_keys = settings.allowed_custom_keys
             for key, value in execution_tags.items():
                 if key in allowed_keys:
                     valid_execution_tags[key] = value
@@ -91,10 +284,13 @@ def vectorize(search_description: Optional[str] = None,
                         key
                     )
 
+        # Keys injected by outer_wrapper that must never reach the user function.
+        strip_keys = frozenset({*valid_execution_tags, 'function_uuid', 'exec_source'})
+
         try:
             # define static properties
-            docstring = inspect.getdoc(func) or ""
-            source_code = inspect.getsource(func)
+            docstring = _get_function_doc(func)
+            source_code = _get_function_source(func)
 
             try:
                 abs_file_path = os.path.abspath(inspect.getsourcefile(func))
@@ -103,11 +299,11 @@ def vectorize(search_description: Optional[str] = None,
                     file_path = relative_file_path
                 else:
                     file_path = abs_file_path
-                    logger.warning(f"Function '{function_name}' is not in a Git repository. "
-                                   f"PR creation might fail for absolute path: {file_path}")
+                    logger.warning("Function '%s' is not in a Git repository. "
+                                   "PR creation might fail for absolute path: %s", function_name, file_path)
             except Exception as e:
                 file_path = ""
-                logger.error(f"Failed to determine file path for '{function_name}': {e}")
+                logger.error("Failed to determine file path for '%s': %s", function_name, e)
 
             static_properties = {
                 "function_name": function_name,
@@ -121,7 +317,7 @@ def vectorize(search_description: Optional[str] = None,
             static_properties.update(valid_execution_tags)
 
             if auto:
-                logger.info(f"Function '{function_name}' registered for auto-metadata generation.")
+                logger.info("Function '%s' registered for auto-metadata generation.", function_name)
                 PENDING_FUNCTIONS.append({
                     "func_name": function_name,
                     "func_uuid": func_uuid,
@@ -129,29 +325,17 @@ def vectorize(search_description: Optional[str] = None,
                     "static_properties": static_properties
                 })
             else:
-                current_content_hash = function_cache_manager.calculate_content_hash(func_identifier, static_properties)
-
-                if function_cache_manager.is_cached_and_unchanged(func_uuid, current_content_hash):
-                    logger.info(f"Function '{function_name}' is UNCHANGED. Skipping DB write.")
+                if settings.ASYNC_LOGGING:
+                    # Keep the hash check, embedding and batch write off the import path.
+                    _background_executor.submit(
+                        _register_function, function_name, func_identifier, func_uuid,
+                        static_properties, search_description, settings
+                    )
                 else:
-                    logger.info(f"Function '{function_name}' is NEW or CHANGED. Writing to DB.")
-                    batch = get_batch_manager()
-                    vectorizer = get_vectorizer()
-                    vector_to_add = None
-
-                    if vectorizer is not None and search_description:
-                        try:
-                            vector_to_add = vectorizer.embed(search_description)
-                        except Exception as e:
-                            logger.warning(f"Failed to vectorize '{function_name}': {e}")
-
-                    batch.add_object(
-                        collection=settings.COLLECTION_NAME,
-                        properties=static_properties,
-                        uuid=func_uuid,
-                        vector=vector_to_add
+                    _register_function(
+                        function_name, func_identifier, func_uuid,
+                        static_properties, search_description, settings
                     )
-                    function_cache_manager.update_cache(func_uuid, current_content_hash)
 
         except Exception as e:
             logger.error("Error in @vectorize setup for '%s': %s", func.__name__, e)
@@ -169,78 +353,95 @@ def vectorize(search_description: Optional[str] = None,
                         if arg_name in bound_args.arguments:
                             runtime_filters[arg_name] = bound_args.arguments[arg_name]
                         else:
-                            logger.warning(f"Semantic Scope: Argument '{arg_name}' not found in call to '{function_name}'.")
+                            logger.warning("Semantic Scope: Argument '%s' not found in call to '%s'.", arg_name, function_name)
                 except Exception as e:
-                    logger.error(f"Failed to resolve semantic_cache_scope for '{function_name}': {e}")
+                    logger.error("Failed to resolve semantic_cache_scope for '%s': %s", function_name, e)
 
             return runtime_filters
 
         # --- Wrapper Logic ---
 
+        if not settings.ENABLE_TRACING:
+            # Same contract as disable_tracing(): every function calls straight through,
+            # including semantic_cache/replay ones, so skip the trace_root/trace_span chain entirely.
+            if is_async_func:
+                @wraps(func)
+                async def passthrough_wrapper(*args, **kwargs):
+                    return await func(*args, **kwargs)
+            else:
+                @wraps(func)
+                def passthrough_wrapper(*args, **kwargs):
+                    return func(*args, **kwargs)
+
+            passthrough_wrapper._is_vectorized = True
+            return passthrough_wrapper
+
         def _try_cache(args, kwargs):
             """Check semantic cache. Returns cached result or None."""
-            if not semantic_cache:
-                return None
             filters = resolve_semantic_filters(args, kwargs)
             return _check_and_return_cached_result(
                 func, args, kwargs, function_name, cache_threshold,
                 is_async_func, filters=filters
             )
 
-        def _build_full_kwargs(kwargs):
+        baked_tags = {**valid_execution_tags, 'function_uuid': func_uuid}
+
+        # Hot per-call values are bound as keyword-only defaults (fast locals instead of
+        # closure cells). The _vw_ prefix keeps them clear of user keyword arguments.
+        def _build_full_kwargs(kwargs, _vw_tags=baked_tags, _vw_source=execution_source_context):
             """Build kwargs with execution tags and metadata."""
-            full_kwargs = kwargs.copy()
-            full_kwargs.update(valid_execution_tags)
-            full_kwargs['function_uuid'] = func_uuid
-            full_kwargs['exec_source'] = execution_source_context.get()
-            return full_kwargs
+            return {**kwargs, **_vw_tags, 'exec_source': _vw_source.get()}
 
         if is_async_func:
-            @trace_root()
-            @trace_span(
-                attributes_to_capture=final_attributes,
-                capture_return_value=capture_return_value,
-                force_sync=semantic_cache,
-                enable_alert=enable_alert
+            inner_wrapper = _make_async_inner(
+                func, strip_keys, tuple(final_attributes),
+                capture_return_value, semantic_cache, enable_alert, flush_spans
             )
-            @wraps(func)
-            async def inner_wrapper(*args, **kwargs):
-                clean_kwargs = {k: v for k, v in kwargs.items() if
-                                k not in valid_execution_tags and k != 'function_uuid' and k != 'exec_source'}
-                return await func(*args, **clean_kwargs)
-
-            @wraps(func)
-            async def outer_wrapper(*args, **kwargs):
-                cached = _try_cache(args, kwargs)
-                if cached is not None:
-                    return cached
-                return await inner_wrapper(*args, **_build_full_kwargs(kwargs))
-
-            outer_wrapper._is_vectorized = True
-            return outer_wrapper
+
+            # semantic_cache is fixed per function, so pick the wrapper once here
+            if semantic_cache:
+                @wraps(func)
+                async def outer_wrapper(*args, _vw_inner=inner_wrapper, _vw_build=_build_full_kwargs,
+                                        _vw_cache=_try_cache, **kwargs):
+                    if not _tracer_module._TRACING_ENABLED:
+                        return await func(*args, **kwargs)
+                    cached = _vw_cache(args, kwargs)
+                    if cached is not None:
+                        return cached
+                    return await _vw_inner(*args, **_vw_build(kwargs))
+            else:
+                @wraps(func)
+                async def outer_wrapper(*args, _vw_inner=inner_wrapper, _vw_build=_build_full_kwargs, **kwargs):
+                    if not _tracer_module._TRACING_ENABLED:
+                        return await func(*args, **kwargs)
+                    return await _vw_inner(*args, **_vw_build(kwargs))
 
         else:  # Sync wrapper
-            @trace_root()
-            @trace_span(
-                attributes_to_capture=final_attributes,
-                capture_return_value=capture_return_value,
-                force_sync=semantic_cache,
-                enable_alert=enable_alert
+            inner_wrapper = _make_sync_inner(
+                func, strip_keys, tuple(final_attributes),
+                capture_return_value, semantic_cache, enable_alert, flush_spans
             )
-            @wraps(func)
-            def inner_wrapper(*args, **kwargs):
-                clean_kwargs = {k: v for k, v in kwargs.items() if
-                                k not in valid_execution_tags and k != 'function_uuid' and k != 'exec_source'}
-                return func(*args, **clean_kwargs)
-
-            @wraps(func)
-            def outer_wrapper(*args, **kwargs):
-                cached = _try_cache(args, kwargs)
-                if cached is not None:
-                    return cached
-                return inner_wrapper(*args, **_build_full_kwargs(kwargs))
-
-            outer_wrapper._is_vectorized = True
-            return outer_wrapper
+
+            if semantic_cache:
+                @wraps(func)
+                def outer_wrapper(*args, _vw_inner=inner_wrapper, _vw_build=_build_full_kwargs,
+                                  _vw_cache=_try_cache, **kwargs):
+                    if not _tracer_module._TRACING_ENABLED:
+                        return func(*args, **kwargs)
+                    cached = _vw_cache(args, kwargs)
+                    if cached is not None:
+                        return cached
+                    return _vw_inner(*args, **_vw_build(kwargs))
+            else:
+                @wraps(func)
+                def outer_wrapper(*args, _vw_inner=inner_wrapper, _vw_build=_build_full_kwargs, **kwargs):
+                    if not _tracer_module._TRACING_ENABLED:
+                        return func(*args, **kwargs)
+                    return _vw_inner(*args, **_vw_build(kwargs))
+
+        if sample_rate < 1.0:
+            return _apply_sampling(func, outer_wrapper, sample_rate, is_async_func)
+        outer_wrapper._is_vectorized = True
+        return outer_wrapper
 
     return decorator
\ No newline at end of file
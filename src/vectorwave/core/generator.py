@@ -75,6 +75,7 @@ def generate_and_register_metadata():
     vectorizer = get_vectorizer()
 
     processed_count = 0
+    unchanged_count = 0
 
     for item in PENDING_FUNCTIONS:
         func_name = item["func_name"]
@@ -90,9 +91,11 @@ def generate_and_register_metadata():
         final_narr = ""
 
         if cached_meta:
-            logger.info(f"✅ [Cache Hit] Loaded metadata for '{func_name}'.")
-            final_desc = cached_meta.get("search_description")
-            final_narr = cached_meta.get("sequence_narrative")
+            # Same source and properties as the definition already generated and registered:
+            # nothing to embed or write.
+            logger.info(f"✅ [Cache Hit] '{func_name}' is UNCHANGED. Skipping embedding and DB write.")
+            unchanged_count += 1
+            continue
         else:
             logger.info(f"🤖 [Auto-Gen] Generating metadata for '{func_name}' via LLM...")
             generated = generate_metadata_via_llm(static_props["source_code"], func_name)
@@ -105,12 +108,6 @@ def generate_and_register_metadata():
                     final_desc = json.dumps(final_desc, ensure_ascii=False)
                 if not isinstance(final_narr, str):
                     final_narr = json.dumps(final_narr, ensure_ascii=False)
-
-                # Update Cache with new metadata
-                function_cache_manager.update_cache_with_metadata(
-                    func_uuid, current_hash,
-                    {"search_description": final_desc, "sequence_narrative": final_narr}
-                )
             else:
                 logger.warning(f"⚠️ Skipping registration for '{func_name}' due to generation failure.")
                 continue
@@ -121,11 +118,14 @@ def generate_and_register_metadata():
 
         # 4. Vectorize the Description
         vector_to_add = None
+        embedded = True
         if vectorizer is not None and final_desc:
             try:
-                vector_to_add = vectorizer.embed(final_desc)
+                # OpenAIVectorizer returns [] when the API call fails.
+                vector_to_add = vectorizer.embed(final_desc) or None
             except Exception as e:
                 logger.warning(f"Vectorization failed for '{func_name}': {e}")
+            embedded = vector_to_add is not None
 
         # 5. Register to DB
         batch.add_object(
@@ -136,5 +136,14 @@ def generate_and_register_metadata():
         )
         processed_count += 1
 
+        # 6. Update Cache only once the object is embedded and queued, since a cache hit
+        # skips the DB write; a failed embed is retried on the next run.
+        if embedded:
+            function_cache_manager.update_cache_with_metadata(
+                func_uuid, current_hash,
+                {"search_description": final_desc, "sequence_narrative": final_narr}
+            )
+
     PENDING_FUNCTIONS.clear()
-    logger.info(f"✨ Auto-generation complete. Registered {processed_count} functions.")
\ No newline at end of file
+    logger.info(f"✨ Auto-generation complete. Registered {processed_count} functions "
+                f"({unchanged_count} unchanged).")
\ No newline at end of file
@@ -1,37 +1,60 @@
+import asyncio
 import threading
 import logging
 from ..models.db_config import get_weaviate_settings
-from ..utils.scheduler import start_scheduler
+from ..utils.scheduler import start_scheduler, start_scheduler_async
 
 logger = logging.getLogger(__name__)
 
 _HEALER_STARTED = False
+_HEALER_TASK = None  # Strong reference so the scheduler task is not garbage-collected
+_HEALER_LOCK = threading.Lock()
 
 def initialize_vectorwave():
     """
     Initialize vectorwave system.
     Refer to config automatically run Auto Healer System.
+    When called from inside a running event loop, the healer runs as an asyncio task;
+    otherwise it runs on a daemon thread.
     """
-    global _HEALER_STARTED
+    global _HEALER_STARTED, _HEALER_TASK
     try:
         settings = get_weaviate_settings()
     except Exception as e:
         logger.warning(f"⚠️ Failed to load settings during initialization: {e}")
         return
 
+    # Lock-free fast path; re-checked under the lock so concurrent startup hooks
+    # cannot both spawn a healer.
     if _HEALER_STARTED:
         return
 
-    if settings.ENABLE_AUTO_HEALER:
-        logger.info("🔧 AutoHealer is enabled. Starting background scheduler...")
-
-        healer_thread = threading.Thread(
-            target=start_scheduler,
-            kwargs={'interval_minutes': settings.HEALER_CHECK_INTERVAL_MINUTES},
-            daemon=True,
-            name="VectorWave-AutoHealer"
-        )
-        healer_thread.start()
-        _HEALER_STARTED = True
-    else:
-        logger.debug("🔧 AutoHealer is disabled (ENABLE_AUTO_HEALER=False).")
\ No newline at end of file
+    with _HEALER_LOCK:
+        if _HEALER_STARTED:
+            return
+
+        if settings.ENABLE_AUTO_HEALER:
+            logger.info("🔧 AutoHealer is enabled. Starting background scheduler...")
+            interval_minutes = settings.HEALER_CHECK_INTERVAL_MINUTES
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            if loop is not None:
+                _HEALER_TASK = loop.create_task(
+                    start_scheduler_async(interval_minutes=interval_minutes),
+                    name="VectorWave-AutoHealer"
+                )
+            else:
+                healer_thread = threading.Thread(
+                    target=start_scheduler,
+                    kwargs={'interval_minutes': interval_minutes},
+                    daemon=True,
+                    name="VectorWave-AutoHealer"
+                )
+                healer_thread.start()
+            _HEALER_STARTED = True
+        else:
+            logger.debug("🔧 AutoHealer is disabled (ENABLE_AUTO_HEALER=False).")
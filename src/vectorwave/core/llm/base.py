@@ -22,6 +22,16 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    def create_embeddings(self, texts: List[str], model: str, category: str = "default") -> List[Optional[List[float]]]:
+        """
+        Generates embeddings for several texts. Providers with a batch endpoint should
+        override this; the default calls create_embedding() once per text.
+
+        Returns:
+            One vector per input text, in order (None for each text that failed).
+        """
+        return [self.create_embedding(text, model=model, category=category) for text in texts]
+
     @abstractmethod
     def create_chat_completion(
             self,
@@ -29,7 +39,8 @@ class BaseLLMClient(ABC):
             model: str,
             temperature: float = 0.1,
             response_format: Optional[Dict] = None,
-            category: str = "default"
+            category: str = "default",
+            max_tokens: Optional[int] = None
     ) -> Optional[str]:
         """
         Generates a chat completion (response).
@@ -40,6 +51,7 @@ class BaseLLMClient(ABC):
             temperature: Parameter for controlling generation diversity.
             response_format: Response format (e.g., {"type": "json_object"}).
             category: Category for aggregating token usage (e.g., 'execution_log', 'auto_doc').
+            max_tokens: Upper bound on generated tokens (provider default if None).
 
         Returns:
             The generated text response (None on failure).
@@ -1,10 +1,18 @@
-from functools import lru_cache
+import threading
+from typing import Optional
 
 from .base import BaseLLMClient
 from .openai_client import VectorWaveOpenAIClient
 
+_client: Optional[BaseLLMClient] = None
+_client_lock = threading.Lock()
+
 
-@lru_cache()
 def get_llm_client() -> BaseLLMClient:
     """Returns the singleton LLM client instance."""
-    return VectorWaveOpenAIClient()
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = VectorWaveOpenAIClient()
+    return _client
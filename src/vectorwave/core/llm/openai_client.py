@@ -58,8 +58,28 @@ class VectorWaveOpenAIClient(BaseLLMClient):
             logger.error(f"Embedding error: {e}")
             return None
 
+    def create_embeddings(self, texts: List[str], model: str = "text-embedding-3-small",
+                          category: str = "default") -> List[Optional[List[float]]]:
+        """
+        Returns: One vector per text from a single embeddings request (all None on failure)
+        """
+        if not texts: return []
+        if not self.client: return [None] * len(texts)
+        try:
+            texts = [text.replace("\n", " ") for text in texts]
+            res = self.client.embeddings.create(input=texts, model=model)
+
+            tokens = res.usage.total_tokens if res.usage else 0
+            self._log_usage(tokens, model, "embedding", category)
+
+            return [item.embedding for item in sorted(res.data, key=lambda item: item.index)]
+        except Exception as e:
+            logger.error(f"Embedding error: {e}")
+            return [None] * len(texts)
+
     def create_chat_completion(self, messages: List[Dict], model: str = "gpt-4-turbo", temperature: float = 0.1,
-                               response_format=None, category: str = "default") -> Optional[str]:
+                               response_format=None, category: str = "default",
+                               max_tokens: Optional[int] = None) -> Optional[str]:
         """
         Returns: Content string only (Tokens are logged internally)
         """
@@ -67,6 +87,7 @@ class VectorWaveOpenAIClient(BaseLLMClient):
         try:
             kwargs = {"model": model, "messages": messages, "temperature": temperature}
             if response_format: kwargs["response_format"] = response_format
+            if max_tokens: kwargs["max_tokens"] = max_tokens
 
             res = self.client.chat.completions.create(**kwargs)
 
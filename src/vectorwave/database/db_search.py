@@ -1,7 +1,7 @@
 import logging
 import weaviate
 import weaviate.classes as wvc
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 
 from weaviate.collections.classes.filters import _Filters
 from weaviate.classes.query import Filter
@@ -185,11 +185,12 @@ def search_executions(
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         sort_by: Optional[str] = "timestamp_utc",
-        sort_ascending: bool = False
+        sort_ascending: bool = False,
+        return_properties: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
-    # ... (No changes needed here)
     """
     Searches execution logs from the [VectorWaveExecutions] collection using filtering and sorting.
+    If return_properties is given, only those properties are fetched.
     """
     try:
         settings: WeaviateSettings = get_weaviate_settings()
@@ -205,10 +206,12 @@ def search_executions(
                 ascending=sort_ascending
             )
 
+        projection = {"return_properties": return_properties} if return_properties else {}
         response = collection.query.fetch_objects(
             limit=limit,
             filters=weaviate_filter,
-            sort=weaviate_sort
+            sort=weaviate_sort,
+            **projection
         )
         results = []
         for obj in response.objects:
@@ -291,51 +294,71 @@ def search_functions_hybrid(
         filters: Optional[Dict[str, Any]] = None,
         alpha: float = 0.5
 ) -> List[Dict[str, Any]]:
-    # ... (No changes needed here)
     """
     Performs Hybrid Search (Keyword + Vector) on function definitions.
     """
     try:
-        settings: WeaviateSettings = get_weaviate_settings()
-        client: weaviate.WeaviateClient = get_cached_client()
-
-        collection = client.collections.get(settings.COLLECTION_NAME)
-        weaviate_filter = _build_weaviate_filters(filters)
-
-        vectorizer = get_vectorizer()
-
-        # 1. Python Vectorizer
-        if vectorizer is not None:
-            logger.info(f"[Hybrid] Vectorizing query with Python client... (alpha={alpha})")
-            try:
-                query_vector = vectorizer.embed(query)
-            except Exception as e:
-                logger.error(f"Query vectorization failed: {e}")
-                raise WeaviateConnectionError(f"Query vectorization failed: {e}")
+        return _hybrid_search(query, [alpha], limit, filters)[alpha]
+    except Exception as e:
+        logger.error("Error during Weaviate Hybrid search: %s", e)
+        raise WeaviateConnectionError(f"Failed to execute 'search_functions_hybrid': {e}")
 
-            # Hybrid Search with explicit vector
-            response = collection.query.hybrid(
-                query=query,
-                vector=query_vector,
-                alpha=alpha,
-                limit=limit,
-                filters=weaviate_filter,
-                return_metadata=wvc.query.MetadataQuery(score=True, distance=True)
-            )
 
+def search_functions_hybrid_multi(
+        query: str,
+        alphas: Sequence[float],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+) -> Dict[float, List[Dict[str, Any]]]:
+    """
+    Runs the same Hybrid Search for several alpha values, keyed by alpha.
+    The query is vectorized once and its vector reused for every alpha.
+    """
+    try:
+        return _hybrid_search(query, alphas, limit, filters)
+    except Exception as e:
+        logger.error("Error during Weaviate Hybrid search: %s", e)
+        raise WeaviateConnectionError(f"Failed to execute 'search_functions_hybrid_multi': {e}")
 
-        else:
-            logger.info(f"[Hybrid] Searching with Weaviate module... (alpha={alpha})")
-            # Hybrid Search letting Weaviate handle vectorization (if module enabled)
-            response = collection.query.hybrid(
-                query=query,
-                alpha=alpha,
-                limit=limit,
-                filters=weaviate_filter,
-                return_metadata=wvc.query.MetadataQuery(score=True, distance=True)
-            )
 
-        results = [
+def _hybrid_search(
+        query: str,
+        alphas: Sequence[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]]
+) -> Dict[float, List[Dict[str, Any]]]:
+    settings: WeaviateSettings = get_weaviate_settings()
+    client: weaviate.WeaviateClient = get_cached_client()
+
+    collection = client.collections.get(settings.COLLECTION_NAME)
+    weaviate_filter = _build_weaviate_filters(filters)
+
+    vectorizer = get_vectorizer()
+
+    # 1. Python Vectorizer: embed once, the alpha only changes how Weaviate fuses the scores.
+    # Without one, Weaviate handles vectorization itself (if a module is enabled).
+    vector_kwargs = {}
+    if vectorizer is not None:
+        logger.info(f"[Hybrid] Vectorizing query with Python client... (alphas={list(alphas)})")
+        try:
+            vector_kwargs["vector"] = vectorizer.embed(query)
+        except Exception as e:
+            logger.error(f"Query vectorization failed: {e}")
+            raise WeaviateConnectionError(f"Query vectorization failed: {e}")
+    else:
+        logger.info(f"[Hybrid] Searching with Weaviate module... (alphas={list(alphas)})")
+
+    results = {}
+    for alpha in alphas:
+        response = collection.query.hybrid(
+            query=query,
+            **vector_kwargs,
+            alpha=alpha,
+            limit=limit,
+            filters=weaviate_filter,
+            return_metadata=wvc.query.MetadataQuery(score=True, distance=True)
+        )
+        results[alpha] = [
             {
                 "properties": obj.properties,
                 "metadata": obj.metadata,
@@ -343,11 +366,7 @@ def search_functions_hybrid(
             }
             for obj in response.objects
         ]
-        return results
-
-    except Exception as e:
-        logger.error("Error during Weaviate Hybrid search: %s", e)
-        raise WeaviateConnectionError(f"Failed to execute 'search_functions_hybrid': {e}")
+    return results
 
 
 def check_semantic_drift(
@@ -1,9 +1,11 @@
 import logging
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
-from typing import Dict, Optional, Any, Set
+from typing import Dict, Optional, Any, Set, FrozenSet
 import json
 import os
+import sys
 
 # Create module-level logger
 logger = logging.getLogger(__name__)
@@ -69,9 +71,31 @@ class WeaviateSettings(BaseSettings):
     sensitive_keys: Set[str] = set()
 
     ASYNC_LOGGING: bool = False
+    # Skip input embedding for successful spans while the batch queue holds more objects than this (0 = never).
+    EMBED_SHED_THRESHOLD: int = 5000
+    # False makes every @vectorize function a plain passthrough (semantic cache lookups included),
+    # like disable_tracing(); definitions are still registered.
+    ENABLE_TRACING: bool = True
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra='ignore')
 
+    _allowed_keys_cache: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'custom_properties':
+            # Reassigning the schema invalidates the cached key set.
+            super().__setattr__('_allowed_keys_cache', None)
+
+    @property
+    def allowed_custom_keys(self) -> FrozenSet[str]:
+        """
+        Frozen set of custom property names, built once and reused by every decoration.
+        """
+        if self._allowed_keys_cache is None:
+            self._allowed_keys_cache = frozenset(self.custom_properties or ())
+        return self._allowed_keys_cache
+
 
 # @lru_cache ensures this function creates the Settings object only once (Singleton pattern)
 # and reuses the cached object on subsequent calls.
@@ -151,7 +175,7 @@ def get_weaviate_settings() -> WeaviateSettings:
 
     try:
         settings.sensitive_keys = {
-            key.strip().lower()
+            sys.intern(key.strip().lower())
             for key in settings.SENSITIVE_FIELD_NAMES.split(',')
             if key.strip()
         }
@@ -1,15 +1,18 @@
 import logging
 import inspect
+import os
+import sys
+import threading
 import time
 import traceback
-import json
 from dataclasses import dataclass
 from functools import wraps, lru_cache
+from itertools import chain
 from contextvars import ContextVar
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Collection
 from uuid import uuid4
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 
 import vectorwave.vectorwave_core as vectorwave_core
 from .alert.base import BaseAlerter
@@ -17,14 +20,138 @@ from ..batch.batch import get_batch_manager
 from ..models.db_config import get_weaviate_settings, WeaviateSettings
 from .alert.factory import get_alerter
 from ..vectorizer.factory import get_vectorizer
+from ..vectorizer.batcher import EmbedBatcher
 from ..database.db_search import check_semantic_drift
 from ..utils.context import execution_source_context
-from ..utils.serialization import deserialize_return_value as _deserialize_return_value
+from ..utils.serialization import deserialize_return_value as _deserialize_return_value, serialize_return_value
 
 logger = logging.getLogger(__name__)
 
+# One-hop span payload builder from the Rust core; older builds only ship mask_and_serialize.
+_native_build_span_payload = getattr(vectorwave_core, "build_span_payload", None)
+# Single-buffer input text builder; absent from older builds, which use the join below.
+_native_build_vector_text = getattr(vectorwave_core, "build_vector_text", None)
+
+_UTC = timezone.utc
+
+# Placeholder the Rust core substitutes for sensitive values.
+_MASKED = "[MASKED]"
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Reads a positive int from the environment; bad values warn and use the default
+    instead of failing `import vectorwave`."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning("Ignoring %s=%r (expected a positive integer); using %d.", name, raw, default)
+        return default
+    return value
+
+
+# Logging work is short serialization plus a batched DB write, so a small pool is enough;
+# more threads only add GIL contention.
+_LOGGER_MAX_WORKERS = min(8, os.cpu_count() or 2)
+# Upper bound on queued-but-unfinished log tasks.
+_LOGGER_MAX_PENDING = _env_positive_int("VECTORWAVE_QUEUE_SIZE", 1024)
+# Spans a flush_spans trace holds before handing them to the pool early.
+_SPAN_BUFFER_MAX = _env_positive_int("VECTORWAVE_SPAN_BUFFER_SIZE", 256)
+# Runtime kill switch checked at the top of every @vectorize call; VECTORWAVE_DISABLED=1
+# starts the process with it off. A plain bool read, so the disabled path is one global load.
+_TRACING_ENABLED = os.environ.get("VECTORWAVE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+
+class _BoundedExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor with a cap on pending tasks. When the cap is reached the task runs
+    in the calling thread instead (caller-runs), which applies backpressure without
+    dropping logs or letting the queue grow without bound.
+    """
+
+    def __init__(self, max_pending: int, **kwargs):
+        super().__init__(**kwargs)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._caller_runs_lock = threading.Lock()
+        self.caller_runs = 0  # tasks executed inline because the queue was full
+        self._idle = threading.Condition()
+        self._inflight = 0  # tasks queued on or running in the pool
+
+    def submit(self, fn, /, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            with self._caller_runs_lock:
+                self.caller_runs += 1
+                first = self.caller_runs == 1
+            if first:
+                logger.warning("Background logging queue is full; running log tasks inline (backpressure).")
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+        with self._idle:
+            self._inflight += 1
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release_slot(None)
+            raise
+        future.add_done_callback(self._release_slot)
+        return future
+
+    def _release_slot(self, _future):
+        self._slots.release()
+        with self._idle:
+            self._inflight -= 1
+            if not self._inflight:
+                self._idle.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until no submitted task is pending or running. False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._inflight, timeout)
+
+
 # Global executor for background logging
-_background_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="VectorWaveLogger")
+_background_executor = _BoundedExecutor(
+    max_pending=_LOGGER_MAX_PENDING,
+    max_workers=_LOGGER_MAX_WORKERS,
+    thread_name_prefix="VectorWaveLogger"
+)
+
+
+def enable_tracing():
+    """Turns @vectorize tracing, caching and logging back on."""
+    global _TRACING_ENABLED
+    _TRACING_ENABLED = True
+
+
+def disable_tracing():
+    """Makes every @vectorize function call straight through to the original function."""
+    global _TRACING_ENABLED
+    _TRACING_ENABLED = False
+
+
+def is_tracing_enabled() -> bool:
+    return _TRACING_ENABLED
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Blocks until background span logging has finished and the batch manager has handed every
+    queued object to Weaviate. The timeout (seconds) covers both stages; returns False if it
+    expired first. Do not call it from a logging task, which would wait on itself.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if not _background_executor.wait_idle(timeout):
+        return False
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    return get_batch_manager().wait_until_flushed(remaining)
 
 
 class TraceCollector:
@@ -33,7 +160,18 @@ class TraceCollector:
         self.settings: WeaviateSettings = get_weaviate_settings()
         self.batch = get_batch_manager()
         self.alerter: BaseAlerter = get_alerter()
+        # Resolved once per trace and shared by every span's background logging.
+        self.vectorizer = get_vectorizer()
+        self.base_span_template: Dict[str, Any] = dict(self.settings.global_custom_values or {})
         self.alert_sent: bool = False
+        # Set by trace_root(flush_spans=True): async spans collect here and are submitted
+        # to the logger pool as one task when the root returns (see _buffer_span).
+        self.pending_spans: Optional[List["SpanContext"]] = None
+        self.pending_lock: Optional[threading.Lock] = None
+
+    def start_span_buffer(self):
+        self.pending_spans = []
+        self.pending_lock = threading.Lock()
 
 
 current_tracer_var: ContextVar[Optional[TraceCollector]] = ContextVar('current_tracer', default=None)
@@ -58,6 +196,42 @@ class SpanContext:
     kwargs: Dict[str, Any]  # shallow-copied at creation to avoid race conditions
     exec_source: Optional[str]
     enable_alert: bool = True
+    wall_start: Optional[float] = None  # time.time() at span start, for timestamp_utc
+    binder: Optional[Callable] = None  # decoration-time argument binder (see _make_fast_binder)
+    capture_plan: Optional[Dict[str, str]] = None  # attr name -> lowercased name (see _make_capture_plan)
+    # Raised exception and its traceback as caught; formatted into error_msg at logging time.
+    error_exc: Optional[BaseException] = None
+    error_tb: Any = None
+    background: bool = False  # set when dispatched to the logger pool; enables batched embedding
+
+
+def _format_utc_timestamp(wall_time: Optional[float]) -> str:
+    """ISO-8601 UTC timestamp for a time.time() value (now, if not given)."""
+    if wall_time is None:
+        return datetime.now(_UTC).isoformat()
+    return datetime.fromtimestamp(wall_time, _UTC).isoformat()
+
+
+# (set, list) pair: mask_and_serialize needs a list, and the sensitive key set is built
+# once per settings object, so the converted list is reused until a different set shows up.
+_sensitive_key_list_cache: tuple = (None, [])
+
+
+def _sensitive_key_list(sensitive_keys) -> List[str]:
+    global _sensitive_key_list_cache
+    source, key_list = _sensitive_key_list_cache
+    if source is not sensitive_keys:
+        key_list = list(sensitive_keys)
+        _sensitive_key_list_cache = (sensitive_keys, key_list)
+    return key_list
+
+
+def _new_span_id() -> str:
+    """
+    Random 128-bit span id as 32 hex chars. Span ids are stored as TEXT and only compared
+    for equality, so the dashed RFC-4122 form (and the UUID object behind it) is skipped.
+    """
+    return os.urandom(16).hex()
 
 
 @lru_cache(maxsize=2048)
@@ -65,24 +239,72 @@ def _get_cached_signature(func: Callable) -> inspect.Signature:
     return inspect.signature(func)
 
 
-def _capture_span_attributes(
-        attributes_to_capture: Optional[List[str]],
+def _make_capture_plan(attributes_to_capture: Optional[List[str]]) -> Dict[str, str]:
+    """
+    Maps each attribute to capture to its lowercased name (for the sensitive-key check).
+    The dict keeps the declared order, drops duplicates and gives O(1) membership.
+    Lowered names are interned, like the settings' sensitive keys, so a hit in the
+    sensitive-key set resolves on identity.
+    """
+    return {attr: sys.intern(attr.lower()) for attr in attributes_to_capture or ()}
+
+
+def _make_fast_binder(func: Callable) -> Optional[Callable]:
+    """
+    Precomputes positional names, keyword names and defaults from func's signature and
+    returns a binder equivalent to sig.bind(...) + apply_defaults() for a valid call,
+    without walking the parameters per call. Returns None if func has no signature.
+    """
+    try:
+        params = _get_cached_signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    positional_names = tuple(
+        p.name for p in params
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+    keyword_names = frozenset(
+        p.name for p in params
+        if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    )
+    var_positional = next((p.name for p in params if p.kind is inspect.Parameter.VAR_POSITIONAL), None)
+    var_keyword = next((p.name for p in params if p.kind is inspect.Parameter.VAR_KEYWORD), None)
+    defaults = {p.name: p.default for p in params if p.default is not inspect.Parameter.empty}
+    n_positional = len(positional_names)
+
+    def _fast_bind(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        values = dict(zip(positional_names, args))
+        if var_positional is not None:
+            values[var_positional] = tuple(args[n_positional:])
+        for key, value in kwargs.items():
+            if key in keyword_names:
+                values[key] = value
+        if var_keyword is not None:
+            values[var_keyword] = {}
+        for key, default in defaults.items():
+            values.setdefault(key, default)
+        return values
+
+    return _fast_bind
+
+
+def _bind_span_values(
+        attributes_to_capture: Collection[str],
         args: tuple,
         kwargs: Dict[str, Any],
         func: Callable,
-        sensitive_keys: set
+        binder: Optional[Callable] = None
 ) -> Dict[str, Any]:
     """
-    Captures attribute values using cached function signature for performance.
+    Maps call arguments (defaults applied) and extra tags to names, ready for capture.
     """
-    captured_attributes = {}
-    if not attributes_to_capture:
-        return captured_attributes
-
-    try:
+    if binder is not None:
+        all_values = binder(args, kwargs)
+    else:
         # 1. Use Cached Signature (Fast)
         sig = _get_cached_signature(func)
-        valid_param_names = set(sig.parameters.keys())
+        valid_param_names = sig.parameters.keys()
 
         # Filter kwargs
         sig_kwargs = {k: v for k, v in kwargs.items() if k in valid_param_names}
@@ -91,24 +313,55 @@ def _capture_span_attributes(
         bound = sig.bind(*args, **sig_kwargs)
         bound.apply_defaults()
 
-        all_values = bound.arguments.copy()
+        # The BoundArguments is discarded here, so its dict can be extended in place.
+        all_values = bound.arguments
 
-        # 2. Merge extra tags (e.g., 'team', 'run_id')
-        for key, value in kwargs.items():
-            if key not in all_values and key in attributes_to_capture:
-                all_values[key] = value
+    # 2. Merge extra tags (e.g., 'team', 'run_id')
+    for key, value in kwargs.items():
+        if key not in all_values and key in attributes_to_capture:
+            all_values[key] = value
 
-        # 3. Process & Mask
-        for attr_name in attributes_to_capture:
-            if attr_name in all_values:
-                raw_value = all_values[attr_name]
+    return all_values
+
+
+def _capture_span_attributes(
+        attributes_to_capture: Optional[List[str]],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        func: Callable,
+        sensitive_keys: set,
+        binder: Optional[Callable] = None,
+        capture_plan: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Captures attribute values using the precomputed binder (or cached signature).
+    """
+    captured_attributes = {}
+    if not attributes_to_capture:
+        return captured_attributes
+
+    if capture_plan is None:
+        capture_plan = _make_capture_plan(attributes_to_capture)
 
-                if attr_name.lower() in sensitive_keys:
-                    processed_value = "[MASKED]"
+    try:
+        all_values = _bind_span_values(capture_plan, args, kwargs, func, binder)
+
+        # 3. Process & Mask (all non-sensitive values in a single mask_and_serialize call)
+        to_mask_names = []
+        to_mask_values = []
+        for attr_name, lower_name in capture_plan.items():
+            if attr_name in all_values:
+                if lower_name in sensitive_keys:
+                    captured_attributes[attr_name] = _MASKED
                 else:
-                    processed_value = vectorwave_core.mask_and_serialize(raw_value, list(sensitive_keys))
+                    to_mask_names.append(attr_name)
+                    to_mask_values.append(all_values[attr_name])
 
-                captured_attributes[attr_name] = processed_value
+        if to_mask_values:
+            masked_values = vectorwave_core.mask_and_serialize(
+                to_mask_values, _sensitive_key_list(sensitive_keys)
+            )
+            captured_attributes.update(zip(to_mask_names, masked_values))
 
     except Exception as e:
         logger.warning("Failed to capture attributes for '%s': %s", func.__name__, e)
@@ -130,7 +383,7 @@ def _determine_error_code(tracer: "TraceCollector", e: Exception) -> str:
             error_code = type(e).__name__
 
     except Exception as e_code:
-        logger.warning(f"Failed to determine error_code: {e_code}")
+        logger.warning("Failed to determine error_code: %s", e_code)
         error_code = "UNKNOWN_ERROR_CODE_FAILURE"
 
     return error_code
@@ -148,7 +401,8 @@ def _create_span_properties(
         parent_span_id: Optional[str],
         capture_return_value: bool,
         result: Optional[Any],
-        exec_source: Optional[str]
+        exec_source: Optional[str],
+        wall_start: Optional[float] = None
 ) -> Dict[str, Any]:
     duration_ms = (time.perf_counter() - start_time) * 1000
 
@@ -159,26 +413,23 @@ def _create_span_properties(
         else:
             return_value_to_log = result
 
-    span_properties = {
+    # Same precedence as before: base fields < global custom values < captured attributes.
+    return {
         "trace_id": tracer.trace_id,
         "span_id": my_span_id,
         "parent_span_id": parent_span_id,
         "function_name": func.__name__,
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "timestamp_utc": _format_utc_timestamp(wall_start),
         "duration_ms": duration_ms,
         "status": status,
         "error_message": error_msg,
         "error_code": error_code,
         "return_value": return_value_to_log,
-        "exec_source": exec_source
+        "exec_source": exec_source,
+        **tracer.base_span_template,
+        **captured_attributes
     }
 
-    if tracer.settings.global_custom_values:
-        span_properties.update(tracer.settings.global_custom_values)
-
-    span_properties.update(captured_attributes)
-    return span_properties
-
 
 def _create_input_vector_data(
         func_name: str,
@@ -186,20 +437,23 @@ def _create_input_vector_data(
         kwargs: Dict[str, Any],
         sensitive_keys: set
 ) -> Dict[str, Any]:
-    processed_args = vectorwave_core.mask_and_serialize(list(args), list(sensitive_keys))
-    processed_kwargs = vectorwave_core.mask_and_serialize(kwargs, list(sensitive_keys))
-
-    texts_for_vector = [f"Function Context: {func_name}"]
-
-    for val in processed_args:
-        if val != "[MASKED]":
-            texts_for_vector.append(str(val))
-
-    for key, val in processed_kwargs.items():
-        if val != "[MASKED]":
-            texts_for_vector.append(f"{key}: {val}")
-
-    vector_text = " ".join(texts_for_vector)
+    if not args and not kwargs:
+        # Nothing to mask or describe: skip the FFI call and the join entirely.
+        processed_args, processed_kwargs = [], {}
+        vector_text = f"Function Context: {func_name}"
+    else:
+        # One FFI call: the Rust core walks the outer list element by element.
+        processed_args, processed_kwargs = vectorwave_core.mask_and_serialize(
+            [list(args), kwargs], _sensitive_key_list(sensitive_keys)
+        )
+        if _native_build_vector_text is not None:
+            vector_text = _native_build_vector_text(func_name, processed_args, processed_kwargs)
+        else:
+            vector_text = " ".join(chain(
+                (f"Function Context: {func_name}",),
+                (str(val) for val in processed_args if val != _MASKED),
+                (f"{key}: {val}" for key, val in processed_kwargs.items() if val != _MASKED),
+            ))
 
     canonical_data = {
         "function": func_name,
@@ -213,51 +467,138 @@ def _create_input_vector_data(
     }
 
 
+def _build_span_payload(ctx: SpanContext, with_vector_text: bool):
+    """
+    Returns (captured_attributes, input_vector_text) for a span.
+    Uses the Rust core's build_span_payload (one FFI hop for capture, masking and the
+    vector text) when available, otherwise the Python helpers.
+    """
+    sensitive_keys = ctx.tracer.settings.sensitive_keys
+
+    if _native_build_span_payload is not None:
+        try:
+            bound_values = {}
+            if ctx.attributes_to_capture:
+                try:
+                    bound_values = _bind_span_values(
+                        ctx.capture_plan or ctx.attributes_to_capture,
+                        ctx.args, ctx.kwargs, ctx.func, ctx.binder
+                    )
+                except Exception as e:
+                    logger.warning("Failed to capture attributes for '%s': %s", ctx.func.__name__, e)
+            return _native_build_span_payload(
+                ctx.func.__name__, bound_values, list(ctx.args), ctx.kwargs,
+                _sensitive_key_list(sensitive_keys), list(ctx.attributes_to_capture or ()),
+                with_vector_text
+            )
+        except Exception as e:
+            logger.warning("Native span payload failed for '%s', using Python path: %s", ctx.func.__name__, e)
+
+    captured_attributes = _capture_span_attributes(
+        ctx.attributes_to_capture, ctx.args, ctx.kwargs, ctx.func, sensitive_keys,
+        ctx.binder, ctx.capture_plan
+    )
+    vector_text = None
+    if with_vector_text:
+        try:
+            vector_text = _create_input_vector_data(
+                func_name=ctx.func.__name__,
+                args=ctx.args,
+                kwargs=ctx.kwargs,
+                sensitive_keys=sensitive_keys
+            )['text']
+        except Exception as e:
+            logger.warning("Failed to build input vector text for '%s': %s", ctx.func.__name__, e)
+    return captured_attributes, vector_text
+
+
+# Logger-pool spans share one batcher so concurrent embeds become embed_batch() calls.
+_embed_batcher: Optional[EmbedBatcher] = None
+_embed_batcher_lock = threading.Lock()
+
+
+def _get_embed_batcher(vectorizer) -> EmbedBatcher:
+    global _embed_batcher
+    batcher = _embed_batcher
+    if batcher is None or batcher.vectorizer is not vectorizer:
+        with _embed_batcher_lock:
+            batcher = _embed_batcher
+            if batcher is None or batcher.vectorizer is not vectorizer:
+                if batcher is not None:
+                    batcher.close()
+                batcher = _embed_batcher = EmbedBatcher(vectorizer)
+    return batcher
+
+
+def _embed_span_text(ctx: SpanContext, vectorizer, text: str) -> List[float]:
+    """Embeds via the shared batcher on the logger pool; directly for sync logging."""
+    if ctx.background:
+        return _get_embed_batcher(vectorizer).embed(text)
+    return vectorizer.embed(text)
+
+
+def _should_shed_embedding(tracer: "TraceCollector") -> bool:
+    """
+    True when the batch writer is backed up past EMBED_SHED_THRESHOLD, in which case
+    input embedding (the costliest per-span step) is skipped for successful spans.
+    """
+    threshold = tracer.settings.EMBED_SHED_THRESHOLD
+    if not threshold:
+        return False
+    try:
+        return tracer.batch.pending_size() > threshold
+    except (AttributeError, TypeError):
+        # Batch managers that cannot report their depth are never shed.
+        return False
+
+
 def _perform_background_logging(ctx: SpanContext):
     """
     Executes logging tasks (Vectorization, DB Insert, Drift Check) in the background.
     Receives a SpanContext whose kwargs is already shallow-copied (race-condition safe).
     """
     try:
-        # 1. Capture Attributes (Parsing inputs)
-        captured_attributes = _capture_span_attributes(
-            ctx.attributes_to_capture, ctx.args, ctx.kwargs, ctx.func,
-            ctx.tracer.settings.sensitive_keys
-        )
+        # 0. Format the traceback here (off the traced call's path when logging is async)
+        if ctx.error_msg is None and ctx.error_exc is not None:
+            ctx.error_msg = "".join(
+                traceback.format_exception(type(ctx.error_exc), ctx.error_exc, ctx.error_tb)
+            )
+            ctx.error_exc = ctx.error_tb = None  # drop frame references once formatted
 
         vector_to_add: Optional[List[float]] = None
         return_value_log: Optional[str] = None
-        vectorizer = get_vectorizer()
+        vectorizer = ctx.tracer.vectorizer
+
+        embed_inputs = ctx.capture_return_value and vectorizer is not None
+        if embed_inputs and ctx.status == "SUCCESS" and _should_shed_embedding(ctx.tracer):
+            embed_inputs = False
+
+        # 1. Capture Attributes (Parsing inputs) + input text for vectorization
+        captured_attributes, input_vector_text = _build_span_payload(ctx, with_vector_text=embed_inputs)
 
         # 2. Vectorize Inputs (If enabled)
-        if ctx.capture_return_value and vectorizer is not None:
+        if input_vector_text is not None:
             try:
-                input_vector_data = _create_input_vector_data(
-                    func_name=ctx.func.__name__,
-                    args=ctx.args,
-                    kwargs=ctx.kwargs,
-                    sensitive_keys=ctx.tracer.settings.sensitive_keys
-                )
-                vector_to_add = vectorizer.embed(input_vector_data['text'])
+                vector_to_add = _embed_span_text(ctx, vectorizer, input_vector_text)
             except Exception as ve:
-                logger.warning(f"Failed to vectorize input for '{ctx.func.__name__}': {ve}")
+                logger.warning("Failed to vectorize input for '%s': %s", ctx.func.__name__, ve)
 
         # 3. Process Result
         if ctx.status == "SUCCESS" and ctx.capture_return_value:
             processed_result = vectorwave_core.mask_and_serialize(
-                ctx.result, list(ctx.tracer.settings.sensitive_keys)
+                ctx.result, _sensitive_key_list(ctx.tracer.settings.sensitive_keys)
             )
             try:
-                return_value_log = json.dumps(processed_result)
+                return_value_log = serialize_return_value(processed_result)
             except TypeError:
                 return_value_log = str(processed_result)
 
         # 4. Vectorize Error (If needed)
         if ctx.status != "SUCCESS" and vectorizer is not None:
             try:
-                vector_to_add = vectorizer.embed(str(ctx.error_msg))
+                vector_to_add = _embed_span_text(ctx, vectorizer, str(ctx.error_msg))
             except Exception as ve:
-                logger.warning(f"Failed to vectorize error message: {ve}")
+                logger.warning("Failed to vectorize error message: %s", ve)
 
         # 5. Create Span Properties
         span_properties = _create_span_properties(
@@ -272,7 +613,8 @@ def _perform_background_logging(ctx: SpanContext):
             parent_span_id=ctx.parent_span_id,
             capture_return_value=ctx.capture_return_value,
             result=return_value_log if ctx.status == "SUCCESS" else None,
-            exec_source=ctx.exec_source
+            exec_source=ctx.exec_source,
+            wall_start=ctx.wall_start
         )
 
         # 6. Alerting (If Failure)
@@ -282,7 +624,7 @@ def _perform_background_logging(ctx: SpanContext):
                     ctx.tracer.alerter.notify(span_properties)
                     ctx.tracer.alert_sent = True
             except Exception as alert_e:
-                logger.warning(f"Alerter failed: {alert_e}")
+                logger.warning("Alerter failed: %s", alert_e)
 
         # 7. Semantic Drift Detection
         if ctx.tracer.settings.DRIFT_DETECTION_ENABLED and vector_to_add and ctx.status == "SUCCESS":
@@ -307,7 +649,7 @@ def _perform_background_logging(ctx: SpanContext):
                     span_properties["error_code"] = "SEMANTIC_DRIFT"
                     span_properties["error_message"] = drift_alert_props["error_message"]
             except Exception as e:
-                logger.warning(f"Failed to check semantic drift: {e}")
+                logger.warning("Failed to check semantic drift: %s", e)
 
         # 8. Batch Insert
         if span_properties:
@@ -321,56 +663,103 @@ def _perform_background_logging(ctx: SpanContext):
                 logger.error("Failed to log span: %s", e)
 
     except Exception as e:
-        logger.error(f"Background logging failed for '{ctx.func.__name__}': {e}")
+        logger.error("Background logging failed for '%s': %s", ctx.func.__name__, e)
 
 
-def _init_trace_root(kwargs):
+def _init_trace_root(kwargs, flush_spans: bool = False):
     """Setup for trace_root. Returns token or None if already inside a trace."""
     if current_tracer_var.get() is not None:
         return None
-    trace_id = kwargs.pop('trace_id', str(uuid4()))
+    trace_id = kwargs.pop('trace_id') if 'trace_id' in kwargs else str(uuid4())
     tracer = TraceCollector(trace_id=trace_id)
+    if flush_spans:
+        tracer.start_span_buffer()
     token = current_tracer_var.set(tracer)
     current_span_id_var.set(None)
     return token
 
 
-def trace_root() -> Callable:
+def _end_trace_root(token):
+    tracer = current_tracer_var.get()
+    current_tracer_var.reset(token)
+    if tracer is not None and tracer.pending_lock is not None:
+        _flush_span_buffer(tracer, final=True)
+
+
+def trace_root(flush_spans: bool = False) -> Callable:
+    """
+    Starts a trace unless one is already active. With flush_spans=True, spans that would be
+    logged asynchronously are submitted to the logger pool together when the root returns,
+    one task per trace instead of one per span.
+    """
     def decorator(func: Callable) -> Callable:
         if inspect.iscoroutinefunction(func):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                token = _init_trace_root(kwargs)
+                token = _init_trace_root(kwargs, flush_spans)
                 if token is None:
                     return await func(*args, **kwargs)
                 try:
                     return await func(*args, **kwargs)
                 finally:
-                    current_tracer_var.reset(token)
+                    _end_trace_root(token)
             return async_wrapper
         else:
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                token = _init_trace_root(kwargs)
+                token = _init_trace_root(kwargs, flush_spans)
                 if token is None:
                     return func(*args, **kwargs)
                 try:
                     return func(*args, **kwargs)
                 finally:
-                    current_tracer_var.reset(token)
+                    _end_trace_root(token)
             return sync_wrapper
     return decorator
 
 
+def _log_span_batch(ctxs: List[SpanContext]):
+    for ctx in ctxs:
+        _perform_background_logging(ctx)
+
+
+def _flush_span_buffer(tracer: TraceCollector, final: bool = False):
+    """Submits the trace's buffered spans as one logger-pool task."""
+    with tracer.pending_lock:
+        spans = tracer.pending_spans
+        # After the root returns, stragglers (e.g. spans on threads the trace spawned) log directly.
+        tracer.pending_spans = None if final else []
+    if spans:
+        _background_executor.submit(_log_span_batch, spans)
+
+
+def _buffer_span(ctx: SpanContext) -> bool:
+    """Queues ctx on its trace's span buffer; False if the trace is not buffering."""
+    tracer = ctx.tracer
+    with tracer.pending_lock:
+        spans = tracer.pending_spans
+        if spans is None:
+            return False
+        spans.append(ctx)
+        full = len(spans) >= _SPAN_BUFFER_MAX
+    if full:
+        _flush_span_buffer(tracer)
+    return True
+
+
 def _dispatch_span_logging(ctx: SpanContext, use_async: bool, token):
     """Dispatches logging (sync or async) and resets the span context."""
     try:
         if use_async:
-            _background_executor.submit(_perform_background_logging, ctx)
+            # Submit the function directly: SpanContext already carries exec_source,
+            # so no copy_context()/ctx.run wrapper is needed on this path.
+            ctx.background = True
+            if ctx.tracer.pending_lock is None or not _buffer_span(ctx):
+                _background_executor.submit(_perform_background_logging, ctx)
         else:
             _perform_background_logging(ctx)
     except Exception as log_e:
-        logger.error(f"Error dispatching log for {ctx.func.__name__}: {log_e}")
+        logger.error("Error dispatching log for %s: %s", ctx.func.__name__, log_e)
     finally:
         current_span_id_var.reset(token)
 
@@ -385,32 +774,55 @@ def trace_span(
 ) -> Callable:
     def decorator(func: Callable) -> Callable:
 
-        def should_use_async(tracer):
-            return tracer.settings.ASYNC_LOGGING and not force_sync
+        # Flags are fixed per decorated function, so the dispatch decision is chosen once
+        # here instead of being re-evaluated on every call.
+        if force_sync:
+            def should_use_async(tracer):
+                return False
+        else:
+            def should_use_async(tracer):
+                return tracer.settings.ASYNC_LOGGING
+
+        # The return value is only kept on the span when it will be logged; otherwise the
+        # span must not extend its lifetime until the background worker runs.
+        keep_result = bool(capture_return_value)
+
+        # Argument binding and the capture plan are only needed when attributes are captured.
+        binder = _make_fast_binder(func) if attributes_to_capture else None
+        capture_plan = _make_capture_plan(attributes_to_capture) if attributes_to_capture else None
 
         if inspect.iscoroutinefunction(func):
             @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                tracer = current_tracer_var.get()
+            async def async_wrapper(*args, _vw_get_tracer=current_tracer_var.get, _vw_get_span=current_span_id_var.get,
+                                    _vw_set_span=current_span_id_var.set,
+                                    _vw_get_source=execution_source_context.get, _vw_new_id=_new_span_id,
+                                    _vw_time=time.time, _vw_perf=time.perf_counter, **kwargs):
+                # Hot globals are bound as keyword-only defaults (fast locals); the _vw_
+                # prefix keeps them clear of the wrapped function's own keyword arguments.
+                tracer = _vw_get_tracer()
                 if tracer is None:
                     return await func(*args, **kwargs)
 
-                parent_span_id = current_span_id_var.get()
-                my_span_id = str(uuid4())
-                token = current_span_id_var.set(my_span_id)
-                exec_source = execution_source_context.get()
+                parent_span_id = _vw_get_span()
+                my_span_id = _vw_new_id()
+                token = _vw_set_span(my_span_id)
+                exec_source = _vw_get_source()
 
-                start_time = time.perf_counter()
+                wall_start = _vw_time()
+                start_time = _vw_perf()
                 status = "SUCCESS"
                 error_msg = None
                 error_code = None
+                error_exc = None
+                error_tb = None
                 result = None
 
                 try:
                     result = await func(*args, **kwargs)
                 except Exception as e:
                     status = "ERROR"
-                    error_msg = traceback.format_exc()
+                    # Keep the traceback as caught (before `raise e` adds this frame again).
+                    error_exc, error_tb = e, e.__traceback__
                     error_code = _determine_error_code(tracer, e)
                     if error_code in tracer.settings.ignored_error_codes:
                         status = "FAILURE"
@@ -421,11 +833,16 @@ def trace_span(
                         tracer=tracer, func=func, start_time=start_time,
                         status=status, error_msg=error_msg, error_code=error_code,
                         my_span_id=my_span_id, parent_span_id=parent_span_id,
-                        capture_return_value=capture_return_value, result=result,
+                        capture_return_value=capture_return_value, result=result if keep_result else None,
                         attributes_to_capture=attributes_to_capture,
                         args=args, kwargs=kwargs.copy(),  # shallow copy guards against caller mutation
                         exec_source=exec_source,
-                        enable_alert=enable_alert
+                        enable_alert=enable_alert,
+                        wall_start=wall_start,
+                        binder=binder,
+                        capture_plan=capture_plan,
+                        error_exc=error_exc,
+                        error_tb=error_tb
                     )
                     _dispatch_span_logging(ctx, should_use_async(tracer), token)
                 return result
@@ -433,27 +850,35 @@ def trace_span(
 
         else:  # Sync
             @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                tracer = current_tracer_var.get()
+            def sync_wrapper(*args, _vw_get_tracer=current_tracer_var.get, _vw_get_span=current_span_id_var.get,
+                             _vw_set_span=current_span_id_var.set,
+                             _vw_get_source=execution_source_context.get, _vw_new_id=_new_span_id,
+                             _vw_time=time.time, _vw_perf=time.perf_counter, **kwargs):
+                # Hot globals are bound as keyword-only defaults (see async_wrapper).
+                tracer = _vw_get_tracer()
                 if tracer is None:
                     return func(*args, **kwargs)
 
-                parent_span_id = current_span_id_var.get()
-                my_span_id = str(uuid4())
-                token = current_span_id_var.set(my_span_id)
-                exec_source = execution_source_context.get()
+                parent_span_id = _vw_get_span()
+                my_span_id = _vw_new_id()
+                token = _vw_set_span(my_span_id)
+                exec_source = _vw_get_source()
 
-                start_time = time.perf_counter()
+                wall_start = _vw_time()
+                start_time = _vw_perf()
                 status = "SUCCESS"
                 error_msg = None
                 error_code = None
+                error_exc = None
+                error_tb = None
                 result = None
 
                 try:
                     result = func(*args, **kwargs)
                 except Exception as e:
                     status = "ERROR"
-                    error_msg = traceback.format_exc()
+                    # Keep the traceback as caught (before `raise e` adds this frame again).
+                    error_exc, error_tb = e, e.__traceback__
                     error_code = _determine_error_code(tracer, e)
                     if error_code in tracer.settings.ignored_error_codes:
                         status = "FAILURE"
@@ -464,11 +889,16 @@ def trace_span(
                         tracer=tracer, func=func, start_time=start_time,
                         status=status, error_msg=error_msg, error_code=error_code,
                         my_span_id=my_span_id, parent_span_id=parent_span_id,
-                        capture_return_value=capture_return_value, result=result,
+                        capture_return_value=capture_return_value, result=result if keep_result else None,
                         attributes_to_capture=attributes_to_capture,
                         args=args, kwargs=kwargs.copy(),  # shallow copy guards against caller mutation
                         exec_source=exec_source,
-                        enable_alert=enable_alert
+                        enable_alert=enable_alert,
+                        wall_start=wall_start,
+                        binder=binder,
+                        capture_plan=capture_plan,
+                        error_exc=error_exc,
+                        error_tb=error_tb
                     )
                     _dispatch_span_logging(ctx, should_use_async(tracer), token)
                 return result
@@ -13,7 +13,8 @@ def find_executions(
         filters: Optional[Dict[str, Any]] = None,
         sort_by: str = "timestamp_utc",
         sort_ascending: bool = False,
-        limit: int = 10
+        limit: int = 10,
+        return_properties: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     A general wrapper function for searching the VectorWaveExecutions collection.
@@ -23,6 +24,7 @@ def find_executions(
         sort_by: The property to sort by (e.g., "duration_ms")
         sort_ascending: Whether to sort in ascending order
         limit: The maximum number of results to return
+        return_properties: Properties to fetch (default: all)
 
     Returns:
         A list of retrieved log objects (dictionaries)
@@ -34,7 +36,8 @@ def find_executions(
             limit=limit,
             filters=filters,
             sort_by=sort_by,
-            sort_ascending=sort_ascending
+            sort_ascending=sort_ascending,
+            **({"return_properties": return_properties} if return_properties else {})
         )
     except Exception as e:
         logger.error(f"An error occurred while searching execution logs: {e}", exc_info=True)
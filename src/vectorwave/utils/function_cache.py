@@ -2,21 +2,36 @@ import hashlib
 import json
 import logging
 import os
+import threading
 from typing import Dict, Any, Optional
 from ..models.db_config import get_weaviate_settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 CACHE_FILE_NAME = ".vectorwave_functions_cache.json"
 
 
+def _canonical_default(value: Any) -> Any:
+    """JSON fallback for hashing: sets in sorted order, anything else by str()."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return str(value)
+
+
 class FunctionCacheManager:
     """Manages the local file cache for VectorWave function definitions."""
 
     def __init__(self, cache_dir: str = "."):
         self.cache_path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        # Registrations run on the background logger pool; mutation and save share this lock.
+        self._lock = threading.Lock()
         self.cache: Dict[str, Any] = self._load_cache()
-        logger.info(f"FunctionCacheManager initialized. Cache file: {self.cache_path}")
+        logger.info("FunctionCacheManager initialized. Cache file: %s", self.cache_path)
 
     def _load_cache(self) -> Dict[str, Any]:
         if not os.path.exists(self.cache_path):
@@ -25,25 +40,39 @@ class FunctionCacheManager:
             with open(self.cache_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (IOError, json.JSONDecodeError) as e:
-            logger.warning(f"Failed to load cache. Starting clean. Error: {e}")
+            logger.warning("Failed to load cache. Starting clean. Error: %s", e)
             return {}
 
     def _save_cache(self):
+        """Writes the cache to a temp file and swaps it in, so readers never see a partial file.
+        Callers hold self._lock."""
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
         try:
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(self.cache, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, self.cache_path)
         except IOError as e:
-            logger.error(f"Failed to save cache. Error: {e}")
+            logger.error("Failed to save cache. Error: %s", e)
 
     @staticmethod
     def calculate_content_hash(func_identifier: str, static_properties: Dict[str, Any]) -> str:
-        """Calculates SHA256 hash based on function identifier and static properties."""
-        content_data = {
-            "identifier": func_identifier,
-            "static_props": static_properties
-        }
-        content_str = json.dumps(content_data, sort_keys=True, ensure_ascii=True)
-        return hashlib.sha256(content_str.encode('utf-8')).hexdigest()
+        """
+        Calculates a BLAKE2b (256-bit) hash based on function identifier and static properties.
+        Properties are encoded as JSON with keys sorted at every level, so dict order inside
+        nested values does not change the hash.
+        """
+        if orjson is not None:
+            encoded = orjson.dumps(
+                static_properties,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=_canonical_default
+            )
+        else:
+            encoded = json.dumps(
+                static_properties, sort_keys=True, separators=(',', ':'),
+                ensure_ascii=False, default=_canonical_default
+            ).encode('utf-8')
+        return hashlib.blake2b(func_identifier.encode('utf-8') + b"\x00" + encoded, digest_size=32).hexdigest()
 
     def get_cached_metadata(self, func_uuid: str, current_hash: str) -> Optional[Dict[str, Any]]:
         """
@@ -72,16 +101,18 @@ class FunctionCacheManager:
 
     def update_cache(self, func_uuid: str, current_hash: str):
         """Legacy update: saves only hash."""
-        self.cache[func_uuid] = {"hash": current_hash, "metadata": None}
-        self._save_cache()
+        with self._lock:
+            self.cache[func_uuid] = {"hash": current_hash, "metadata": None}
+            self._save_cache()
 
     def update_cache_with_metadata(self, func_uuid: str, current_hash: str, metadata: Dict[str, Any]):
         """[NEW] Updates cache with hash and generated metadata."""
-        self.cache[func_uuid] = {
-            "hash": current_hash,
-            "metadata": metadata
-        }
-        self._save_cache()
+        with self._lock:
+            self.cache[func_uuid] = {
+                "hash": current_hash,
+                "metadata": metadata
+            }
+            self._save_cache()
 
 
 def initialize_cache_manager() -> FunctionCacheManager:
@@ -1,11 +1,12 @@
 import logging
-import json
 import inspect
 import importlib
 import os
 import ast
-import re
-from typing import Optional, List, Dict, Any, Tuple
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 from datetime import datetime, timedelta, timezone
 
 # Import VectorWave internal modules
@@ -13,7 +14,9 @@ from ..search.execution_search import find_executions
 from ..database.db_search import search_functions_hybrid
 from ..models.db_config import get_weaviate_settings
 from ..core.llm.factory import get_llm_client
+from ..database.db import get_cached_client
 from .github_pr import PRManager
+from .serialization import serialize_lenient
 
 try:
     from openai import OpenAI
@@ -22,14 +25,126 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
+_UNRESOLVED = object()
+
+# Shared by all healer instances for their independent Weaviate lookups.
+_QUERY_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="VectorWaveHealerQuery")
+
+# Span metadata left out of the per-log inputs shown to the LLM; the fields the prompt
+# needs (timestamp, error code/message, output) are rendered on their own lines.
+_PROMPT_EXCLUDED_KEYS = frozenset([
+    'trace_id', 'span_id', 'parent_span_id', 'function_name', 'function_uuid', 'timestamp_utc',
+    'duration_ms', 'status', 'error_code', 'error_message', 'source_code', 'return_value', 'exec_source',
+])
+
+
+# Metadata the healer never reads, so it is not fetched with the error/success logs.
+_UNFETCHED_LOG_KEYS = _PROMPT_EXCLUDED_KEYS - {'timestamp_utc', 'error_code', 'error_message', 'return_value'}
+
+
+def _prompt_inputs(log: Dict[str, Any]) -> str:
+    return serialize_lenient({k: v for k, v in log.items() if k not in _PROMPT_EXCLUDED_KEYS})
+
+
+# Healer prompt; filled via str.format_map in VectorWaveHealer._construct_prompt.
+_PROMPT_TEMPLATE = r'''
+# Debugging Task for Function: `{func_name}`
+
+## 1. Context
+You are an expert Python debugger. Your goal is to fix a buggy function based on its source code and execution logs.
+
+## 2. Current Source Code
+(Note: The code below may contain decorators like @vectorize, which should NOT be included in your output.)
+\`\`\`python
+{source_code}
+\`\`\`
+
+## 3. Recent Errors (last {lookback_minutes} minutes)
+{errors}
+
+## 4. Successful Executions (Reference)
+{successes}
+
+## 5. Instructions
+1. **Analyze**: Infer the intended functionality of `{func_name}` based on its name and current logic.
+2. **Diagnose**: Identify the root cause of the "Recent Errors".
+3. **Fix**: Rewrite the function so that it returns correct results for ALL inputs, including those that previously caused errors.
+    - If you need new libraries (e.g., asyncio, time), include the `import` statements at the very top of your response.
+    - Fix the root logic itself. DO NOT simply add defensive `raise` statements or wrap code in `try/except` as a workaround.
+    - Use the "Successful Executions" above to infer the expected input→output pattern.
+    - Refactor the code to be clean and idiomatic Python.
+4. **Constraint**:
+    - Return **ONLY** the full, corrected function definition.
+    - Start with any necessary imports, then `def {func_name}(...):` or `async def {func_name}(...):`.
+    - **DO NOT** include the `@vectorize` decorator in the output.
+    - **DO NOT** include any markdown formatting (like ```python), comments outside the function, or explanations.
+'''
+
+
+@lru_cache(maxsize=64)
+def _load_source(file_path: str, mtime_ns: int, size: int) -> Tuple[str, Tuple[int, ...], ast.Module, frozenset]:
+    """
+    Reads and parses a source file once per (path, mtime, size); healing several functions
+    in the same file reuses the parse. Returns (source, line start offsets, tree, imports)
+    where imports holds every import statement in normalized (ast.unparse) form; callers
+    must treat the result as read-only.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    line_starts = [0]
+    i = source.find("\n")
+    while i >= 0:
+        line_starts.append(i + 1)
+        i = source.find("\n", i + 1)
+    tree = ast.parse(source)
+    imports = frozenset(
+        ast.unparse(node) for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+    return source, tuple(line_starts), tree, imports
+
+
+def _normalize_import(statement: str) -> str:
+    try:
+        return ast.unparse(ast.parse(statement.strip()))
+    except SyntaxError:
+        return statement.strip()
+
+
+def _find_function_node(tree: ast.Module, func_name: str) -> Optional[ast.AST]:
+    """
+    Finds the definition of func_name, checking module-level statements and class bodies
+    first (where healed functions live) before falling back to a full-tree walk.
+    """
+    pending = [tree.body]
+    while pending:
+        for node in pending.pop(0):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name:
+                return node
+            if isinstance(node, ast.ClassDef):
+                pending.append(node.body)
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name:
+            return node
+    return None
+
+
 class VectorWaveHealer:
     """
     Self-Healing agent that analyzes functions with errors and suggests
     corrected code based on past successful executions.
     """
-    def __init__(self, model: str = "gpt-4-turbo"):
+    def __init__(self, model: str = "gpt-4-turbo", cheap_model: Optional[str] = "gpt-4o-mini"):
+        """
+        model is the main (escalation) model. cheap_model is tried first for simple failures;
+        pass None to always use model.
+        """
         self.settings = get_weaviate_settings()
         self.model = model
+        self.cheap_model = cheap_model
+        self._log_properties = _UNRESOLVED
         self.client = get_llm_client()
 
     def diagnose_and_heal(self, function_name: str, lookback_minutes: int = 60, create_pr: bool = False) -> str:
@@ -42,20 +157,12 @@ class VectorWaveHealer:
 
         print(f"🕵️ Analyzing function: '{function_name}'...")
 
-        # 1. Retrieve original function source code
-        func_defs = search_functions_hybrid(query=function_name, limit=1, alpha=0.1)
-        if not func_defs:
-            return f"❌ Function definition not found: {function_name}"
-
-        module_name = func_defs[0]['properties'].get('module_name')
-        file_path = func_defs[0]['properties'].get('file_path')
-        source_code = func_defs[0]['properties'].get('source_code', '')
-        if not source_code:
-            return "❌ No stored source code found."
-
-        # 2. Collect recent error logs
+        # 1-3. The definition lookup and both log queries are independent; run them concurrently.
         time_limit = (datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)).isoformat()
-        error_logs = find_executions(
+        log_properties = self._log_return_properties()
+        func_defs_future = _QUERY_POOL.submit(search_functions_hybrid, query=function_name, limit=1, alpha=0.1)
+        error_logs_future = _QUERY_POOL.submit(
+            find_executions,
             filters={
                 "function_name": function_name,
                 "status": "ERROR",
@@ -63,46 +170,75 @@ class VectorWaveHealer:
             },
             limit=3,
             sort_by="timestamp_utc",
-            sort_ascending=False
+            sort_ascending=False,
+            return_properties=log_properties
         )
-
-        if not error_logs:
-            return f"✅ No errors found for '{function_name}' in the last {lookback_minutes} minutes."
-
-        # 3. Collect success logs
-        success_logs = find_executions(
+        success_logs_future = _QUERY_POOL.submit(
+            find_executions,
             filters={
                 "function_name": function_name,
                 "status": "SUCCESS"
             },
             limit=2,
             sort_by="timestamp_utc",
-            sort_ascending=False
+            sort_ascending=False,
+            return_properties=log_properties
         )
 
+        # 1. Retrieve original function source code
+        func_defs = func_defs_future.result()
+        if not func_defs:
+            return f"❌ Function definition not found: {function_name}"
+
+        module_name = func_defs[0]['properties'].get('module_name')
+        file_path = func_defs[0]['properties'].get('file_path')
+        source_code = func_defs[0]['properties'].get('source_code', '')
+        if not source_code:
+            return "❌ No stored source code found."
+
+        # 2. Collect recent error logs
+        error_logs = error_logs_future.result()
+        if not error_logs:
+            return f"✅ No errors found for '{function_name}' in the last {lookback_minutes} minutes."
+
+        # 3. Collect success logs
+        success_logs = success_logs_future.result()
+
         # 4. Construct prompt
         prompt_context = self._construct_prompt(function_name, source_code, error_logs, success_logs, lookback_minutes)
 
-        # 5. Call LLM
+        # 5. Call LLM (cheap model first, escalating when its fix doesn't hold up)
         print("🤖 Generating fix via LLM...")
         try:
-            suggested_code = self.client.create_chat_completion(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert Python debugger."
-                                                  " Analyze the code and errors provided,"
-                                                  " then generate a fixed version of the code."},
-                    {"role": "user", "content": prompt_context}
-                ],
-                temperature=0.1,
-                category="healer"
-            )
+            messages = [
+                {"role": "system", "content": "You are an expert Python debugger."
+                                              " Analyze the code and errors provided,"
+                                              " then generate a fixed version of the code."},
+                {"role": "user", "content": prompt_context}
+            ]
+
+            suggested_code = None
+            produced_by = None
+            for tier in self._model_tiers(error_logs):
+                response = self.client.create_chat_completion(
+                    model=tier,
+                    messages=messages,
+                    temperature=0.1,
+                    category="healer"
+                )
+                if not response:
+                    continue
+
+                # [Cleanup 1] 마크다운 제거
+                suggested_code = self._clean_llm_response(response)
+                produced_by = tier
+                if self._is_valid_fix(suggested_code, function_name):
+                    break
+                logger.info("Fix for '%s' from %s failed validation.", function_name, tier)
 
             if not suggested_code:
                 return "❌ LLM returned no response."
-
-            # [Cleanup 1] 마크다운 제거
-            suggested_code = self._clean_llm_response(suggested_code)
+            logger.info("Fix for '%s' generated by %s.", function_name, produced_by)
 
             # 6. Handle PR Creation if requested
             if create_pr and ("def " in suggested_code or "async def " in suggested_code):
@@ -116,16 +252,89 @@ class VectorWaveHealer:
             logger.error(f"LLM generation failed: {e}")
             return f"❌ Error occurred during LLM call: {e}"
 
+    def _log_return_properties(self) -> Optional[List[str]]:
+        """
+        Execution-log properties worth fetching: the collection schema minus span metadata the
+        healer never reads. Resolved once per healer; None (fetch everything) if unavailable.
+        """
+        if self._log_properties is _UNRESOLVED:
+            try:
+                collection = get_cached_client().collections.get(self.settings.EXECUTION_COLLECTION_NAME)
+                schema_props = {p.name for p in collection.config.get().properties}
+                self._log_properties = sorted(schema_props - _UNFETCHED_LOG_KEYS) or None
+            except Exception as e:
+                logger.debug("Could not resolve execution log properties: %s", e)
+                self._log_properties = None
+        return self._log_properties
+
+    def _model_tiers(self, error_logs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Models to try in order. Simple failures start on the cheap model; several logs with
+        distinct error codes go straight to the main model.
+        """
+        if not self.cheap_model or self.cheap_model == self.model:
+            return [self.model]
+        distinct_codes = {log.get('error_code') for log in error_logs}
+        if len(error_logs) >= 3 and len(distinct_codes) > 1:
+            return [self.model]
+        return [self.cheap_model, self.model]
+
+    def _is_valid_fix(self, code: str, function_name: str) -> bool:
+        """The suggested code parses and defines function_name at the top level."""
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            return False
+        return any(
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == function_name
+            for node in tree.body
+        )
+
+    def diagnose_and_heal_many(self, function_names: Iterable[str], lookback_minutes: int = 60,
+                               create_pr: bool = False, max_workers: int = 4) -> Dict[str, str]:
+        """
+        Runs diagnose_and_heal for several functions concurrently so their DB lookups and
+        LLM round-trips overlap instead of running back to back.
+        Returns {function_name: result}, in the order the names were given.
+        """
+        names = list(dict.fromkeys(function_names))
+        if not names:
+            return {}
+        if len(names) == 1 or max_workers <= 1:
+            return {name: self._heal_one(name, lookback_minutes, create_pr) for name in names}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names)),
+                                thread_name_prefix="VectorWaveHealer") as pool:
+            futures = {name: pool.submit(self._heal_one, name, lookback_minutes, create_pr) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _heal_one(self, function_name: str, lookback_minutes: int, create_pr: bool) -> str:
+        try:
+            return self.diagnose_and_heal(function_name, lookback_minutes=lookback_minutes, create_pr=create_pr)
+        except Exception as e:
+            logger.error("Healing failed for '%s': %s", function_name, e)
+            return f"❌ Healing failed for '{function_name}': {e}"
+
     def _clean_llm_response(self, text: str) -> str:
         """
         Removes Markdown code block formatting (```python ... ```) from the LLM response.
         """
         text = text.strip()
-        code_block_pattern = r"```(?:\w+)?\s*(.*?)```"
-        match = re.search(code_block_pattern, text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return text
+        fence_start = text.find("```")
+        if fence_start < 0:
+            return text
+        body_start = fence_start + 3
+        fence_end = text.find("```", body_start)
+        if fence_end < 0:
+            return text
+
+        # Skip an optional language tag (```python) on the opening fence line.
+        line_end = text.find("\n", body_start, fence_end)
+        if line_end >= 0:
+            tag = text[body_start:line_end].strip()
+            if not tag or tag.replace("_", "").isalnum():
+                body_start = line_end + 1
+        return text[body_start:fence_end].strip()
 
     def _handle_pr_creation(self, module_name: str, file_path: str, function_name: str, new_func_code: str) -> str:
         """
@@ -170,6 +379,8 @@ class VectorWaveHealer:
             return result
 
         except Exception as e:
+            # The file may be mid-edit; don't keep serving a parse of it.
+            _load_source.cache_clear()
             logger.error(f"PR creation process failed: {e}")
             return f"❌ PR creation process failed: {e}"
 
@@ -178,7 +389,27 @@ class VectorWaveHealer:
         AI 응답에서 Import와 함수 본문만 남기고,
         중간에 낀 전역 변수나 잡다한 코드는 제거합니다.
         """
-        lines = new_code.strip().splitlines()
+        new_code = new_code.strip()
+        try:
+            tree = ast.parse(new_code)
+        except SyntaxError:
+            tree = None
+
+        if tree is not None:
+            # 모듈 최상위 노드만 분류: (멀티라인 포함) import 문과 함수 정의만 남김.
+            # 데코레이터(@vectorize)는 def 위치부터 잘라내므로 자연스럽게 제외됩니다.
+            imports = []
+            funcs = []
+            for node in tree.body:
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    imports.append(ast.get_source_segment(new_code, node))
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    funcs.append(ast.get_source_segment(new_code, node))
+            if funcs:
+                return imports, "\n\n".join(funcs)
+
+        # 파싱 실패(또는 함수 정의 없음) 시: 문자열 접두사 기반 분리로 폴백
+        lines = new_code.splitlines()
         imports = []
         func_lines = []
 
@@ -210,15 +441,9 @@ class VectorWaveHealer:
             # 1. AI 코드에서 임포트와 함수 분리
             imports_to_add, cleaned_func_code = self._separate_imports_and_code(new_code)
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-            target_node = None
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name:
-                    target_node = node
-                    break
+            stat = os.stat(file_path)
+            source, line_starts, tree, existing_imports = _load_source(file_path, stat.st_mtime_ns, stat.st_size)
+            target_node = _find_function_node(tree, func_name)
 
             if not target_node:
                 logger.warning(f"Function '{func_name}' not found in file '{file_path}' via AST.")
@@ -227,104 +452,65 @@ class VectorWaveHealer:
             start_line = target_node.lineno - 1
             end_line = target_node.end_lineno
 
-            lines = source.splitlines(keepends=True)
-
-            original_def_line = lines[start_line]
-            original_indent = original_def_line[:len(original_def_line) - len(original_def_line.lstrip())]
+            def line_offset(idx: int) -> int:
+                return line_starts[idx] if idx < len(line_starts) else len(source)
 
-            new_lines_raw = cleaned_func_code.strip().splitlines()
-            new_lines_indented = []
+            def line_at(idx: int) -> str:
+                return source[line_offset(idx):line_offset(idx + 1)]
 
-            for line in new_lines_raw:
-                if line.strip():
-                    new_lines_indented.append(original_indent + line + "\n")
-                else:
-                    new_lines_indented.append("\n")
+            original_def_line = line_at(start_line)
+            original_indent = original_def_line[:len(original_def_line) - len(original_def_line.lstrip())]
 
             real_def_line_idx = start_line
             for i in range(start_line, end_line):
-                stripped_line = lines[i].strip()
+                stripped_line = line_at(i).strip()
                 if stripped_line.startswith("def ") or stripped_line.startswith("async def "):
                     real_def_line_idx = i
                     break
 
-            # 2. 파일 내용 재조립 (함수 교체)
-            content_with_new_func = (
-                    "".join(lines[:real_def_line_idx]) +
-                    "".join(new_lines_indented) +
-                    "".join(lines[end_line:])
-            )
-
-            # 3. [Import Hoisting] 임포트 구문 최상단 추가
-            if imports_to_add:
-                # 기존 파일 내용에 이미 해당 임포트가 있는지 단순 텍스트 매칭으로 확인 (중복 방지)
-                # (더 정교하게 하려면 AST를 써야 하지만, 이 정도면 충분합니다)
-                final_imports = []
-                for imp in imports_to_add:
-                    if imp.strip() not in source:
-                        final_imports.append(imp)
-
-                if final_imports:
-                    # 파일 맨 위에 추가
-                    return "\n".join(final_imports) + "\n" + content_with_new_func
+            # 3. [Import Hoisting] 기존 파일에 없는 임포트만 최상단에 추가 (정규화된 import 문 집합으로 중복 판정)
+            final_imports = [imp for imp in imports_to_add if _normalize_import(imp) not in existing_imports]
 
-            return content_with_new_func
+            # 2. 파일 내용 재조립 (함수 교체): 원본은 오프셋으로 잘라 한 버퍼에 기록
+            buf = io.StringIO()
+            if final_imports:
+                buf.write("\n".join(final_imports))
+                buf.write("\n")
+            buf.write(source[:line_offset(real_def_line_idx)])
+            for line in cleaned_func_code.strip().splitlines():
+                if line.strip():
+                    buf.write(original_indent)
+                    buf.write(line)
+                buf.write("\n")
+            buf.write(source[line_offset(end_line):])
+            return buf.getvalue()
 
         except Exception as e:
             logger.error(f"Patch application failed: {e}")
             return None
 
     def _construct_prompt(self, func_name, source_code, errors, successes, lookback_minutes) -> str:
-        # (기존 코드 유지)
-        error_details = []
-        for err in errors:
-            inputs = {k: v for k, v in err.items() if k not in ['trace_id', 'span_id', 'error_message', 'source_code', 'return_value']}
-            error_details.append(f"""
+        error_details = "".join(
+            f"""
 - Timestamp: {err.get('timestamp_utc')}
 - Error Code: {err.get('error_code')}
 - Error Message: {err.get('error_message')}
-- Inputs causing error: {json.dumps(inputs, default=str)}
-            """)
-
-        success_details = []
-        for suc in successes:
-            inputs = {k: v for k, v in suc.items() if k not in ['trace_id', 'span_id', 'return_value']}
-            output = suc.get('return_value')
-            success_details.append(f"""
-- Inputs: {json.dumps(inputs, default=str)}
-- Output: {output}
-            """)
-
-        prompt = fr'''
-# Debugging Task for Function: `{func_name}`
-
-## 1. Context
-You are an expert Python debugger. Your goal is to fix a buggy function based on its source code and execution logs.
-
-## 2. Current Source Code
-(Note: The code below may contain decorators like @vectorize, which should NOT be included in your output.)
-\`\`\`python
-{source_code}
-\`\`\`
-
-## 3. Recent Errors (last {lookback_minutes} minutes)
-{''.join(error_details)}
-
-## 4. Successful Executions (Reference)
-{''.join(success_details) if success_details else "No success logs available."}
+- Inputs causing error: {_prompt_inputs(err)}
+            """
+            for err in errors
+        )
+        success_details = "".join(
+            f"""
+- Inputs: {_prompt_inputs(suc)}
+- Output: {suc.get('return_value')}
+            """
+            for suc in successes
+        )
 
-## 5. Instructions
-1. **Analyze**: Infer the intended functionality of `{func_name}` based on its name and current logic.
-2. **Diagnose**: Identify the root cause of the "Recent Errors".
-3. **Fix**: Rewrite the function so that it returns correct results for ALL inputs, including those that previously caused errors.
-    - If you need new libraries (e.g., asyncio, time), include the `import` statements at the very top of your response.
-    - Fix the root logic itself. DO NOT simply add defensive `raise` statements or wrap code in `try/except` as a workaround.
-    - Use the "Successful Executions" above to infer the expected input→output pattern.
-    - Refactor the code to be clean and idiomatic Python.
-4. **Constraint**:
-    - Return **ONLY** the full, corrected function definition.
-    - Start with any necessary imports, then `def {func_name}(...):` or `async def {func_name}(...):`.
-    - **DO NOT** include the `@vectorize` decorator in the output.
-    - **DO NOT** include any markdown formatting (like ```python), comments outside the function, or explanations.
-'''
-        return prompt
\ No newline at end of file
+        return _PROMPT_TEMPLATE.format_map({
+            "func_name": func_name,
+            "source_code": source_code,
+            "lookback_minutes": lookback_minutes,
+            "errors": error_details,
+            "successes": success_details or "No success logs available.",
+        })
@@ -1,13 +1,16 @@
 import contextlib
 import importlib
-import json
 import logging
+import math
 import traceback
 import inspect
 import asyncio
 import difflib
+import html
+import json
 import pprint
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import patch
 
 import weaviate.classes.query as wvc_query
@@ -16,10 +19,74 @@ from ..database.db import get_cached_client
 from ..models.db_config import get_weaviate_settings
 import vectorwave.vectorwave_core as vectorwave_core
 from .context import execution_source_context
-from .serialization import deserialize_return_value
+from .serialization import deserialize_return_value, serialize_return_value
 
 logger = logging.getLogger(__name__)
 
+_JSON_CONTAINERS = (dict, list, tuple)
+# Concurrent partial updates issued when several baselines drift in one replay.
+_BASELINE_UPDATE_WORKERS = 8
+_ASYNC_REPLAY_CONCURRENCY = 16  # in-flight async replays when max_workers is left at 1
+_AUTO_REPLAY_WORKERS = 32  # pool cap for max_workers=None
+_REPLAY_PAGE_SIZE = 1000  # logs per query once a replay needs more than one page
+# Failure diffs keep the first/last lines of each side; beyond the char cap only sizes are reported.
+_DIFF_MAX_LINES = 200
+_DIFF_MAX_CHARS = 1_000_000
+
+# Python 3.12+: coroutines that finish without suspending complete inside create_task
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+# Parsed scalar baselines ("true", "null", small enums...) keyed by their raw JSON string.
+# Containers are not cached: callers get their own copy they may freely mutate.
+_SCALAR_BASELINE_CACHE: Dict[str, Any] = {}
+_SCALAR_BASELINE_CACHE_MAX = 2048
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _json_key(key: Any) -> Any:
+    """The str key JSON stores a dict key as (1 -> "1", True -> "true", None -> "null")."""
+    if isinstance(key, (bool, int, float)) or key is None:
+        return json.dumps(key)
+    return key
+
+
+def _deep_equal(a: Any, b: Any) -> bool:
+    """
+    Equality as a JSON round-trip would see it, without serializing: lists and tuples are
+    interchangeable, dict keys match their JSON string form, NaN equals NaN, and floats
+    match within a 1e-9 relative tolerance.
+    """
+    if isinstance(a, dict):
+        if not isinstance(b, dict) or len(a) != len(b):
+            return False
+        if a.keys() != b.keys():
+            # Recorded baselines come back from JSON with str keys; {1: "a"} was stored as {"1": "a"}.
+            a = {_json_key(key): value for key, value in a.items()}
+            b = {_json_key(key): value for key, value in b.items()}
+            if a.keys() != b.keys():
+                return False
+        return all(_deep_equal(value, b[key]) for key, value in a.items())
+    if isinstance(a, (list, tuple)):
+        if not isinstance(b, (list, tuple)) or len(a) != len(b):
+            return False
+        return all(_deep_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b  # JSON keeps true/false distinct from 1/0
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9) or (a != a and b != b)
+    return a == b
+
+
+def _deserialize_baseline(value: str) -> Any:
+    try:
+        return _SCALAR_BASELINE_CACHE[value]
+    except KeyError:
+        pass
+    result = deserialize_return_value(value)
+    if isinstance(result, _SCALAR_TYPES) and len(_SCALAR_BASELINE_CACHE) < _SCALAR_BASELINE_CACHE_MAX:
+        _SCALAR_BASELINE_CACHE[value] = result
+    return result
+
 
 class VectorWaveReplayer:
     """
@@ -32,15 +99,23 @@ class VectorWaveReplayer:
         self.settings = get_weaviate_settings()
         self.collection_name = self.settings.EXECUTION_COLLECTION_NAME
         self.golden_collection_name = self.settings.GOLDEN_COLLECTION_NAME
+        # Collection handles are resolved once and shared by every replay on this instance.
+        self.collection = self.client.collections.get(self.collection_name)
+        self.golden_collection = self.client.collections.get(self.golden_collection_name)
 
     def replay(self,
                function_full_name: str,
                limit: int = 10,
                update_baseline: bool = False,
-               mocks: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+               mocks: Optional[Dict[str, Any]] = None,
+               max_workers: Optional[int] = 1) -> Dict[str, Any]:
         """
         Retrieves past execution history (Golden Data First -> Standard Logs),
         re-executes the function, and validates the result.
+        With max_workers > 1, independent sync replays run concurrently on a thread pool;
+        max_workers=None sizes the pool to the number of logs (up to 32).
+        Async replays always run concurrently on one event loop, at most max_workers
+        (or 16 by default) at a time.
         """
         target_func, test_objects, results = self._load_and_fetch(function_full_name, limit)
         if target_func is None:
@@ -50,7 +125,8 @@ class VectorWaveReplayer:
         return self._run_replay_loop(
             target_func, test_objects, results, update_baseline,
             compare_fn=lambda exp, act: (self._compare_results(exp, act), None, {}),
-            mocks=mocks
+            mocks=mocks,
+            max_workers=max_workers
         )
 
     def _load_and_fetch(self, function_full_name: str, limit: int):
@@ -68,7 +144,7 @@ class VectorWaveReplayer:
             results["error"] = f"Function loading failed: {e}"
             return None, [], results
 
-        test_objects = self._fetch_test_candidates(func_short_name, limit)
+        test_objects = self._fetch_test_candidates(func_short_name, limit, self._get_valid_params(target_func))
         if not test_objects:
             logger.warning(f"No data found to test: {function_full_name}")
         return target_func, test_objects, results
@@ -80,44 +156,37 @@ class VectorWaveReplayer:
             results: Dict[str, Any],
             update_baseline: bool,
             compare_fn,
-            mocks: Optional[Dict[str, Any]] = None
+            mocks: Optional[Dict[str, Any]] = None,
+            max_workers: Optional[int] = 1,
+            prepare_fn=None
     ) -> Dict[str, Any]:
         """
         Core replay loop. compare_fn(expected, actual) -> (is_match, reason, extra_failure_fields).
         'reason' may be None; 'extra_failure_fields' is merged into the failure entry.
+        All logs are executed first (concurrently when max_workers > 1), then evaluated in order.
+        prepare_fn, if given, receives every (expected, actual) pair that executed cleanly
+        before evaluation starts, so subclasses can batch work compare_fn would repeat per case.
         """
-        is_async_func = inspect.iscoroutinefunction(target_func)
-
-        for obj_data in test_objects:
+        valid_params = self._get_valid_params(target_func)
+        cases = [(obj_data, self._extract_inputs(obj_data['inputs'], valid_params)) for obj_data in test_objects]
+        outcomes = self._execute_cases(target_func, [inputs for _, inputs in cases], mocks, max_workers)
+        if prepare_fn is not None:
+            prepare_fn([(obj_data['expected_output'], actual_output)
+                        for (obj_data, _), (actual_output, error_tb) in zip(cases, outcomes)
+                        if error_tb is None])
+        pending_updates = []  # (uuid, new_value, is_golden), written together after evaluation
+
+        for (obj_data, inputs), (actual_output, error_tb) in zip(cases, outcomes):
             results["total"] += 1
             uuid_str = obj_data['uuid']
-            raw_inputs = obj_data['inputs']
             expected_output = obj_data['expected_output']
             is_golden = obj_data.get('is_golden', False)
-            inputs = self._extract_inputs(raw_inputs, target_func)
 
-            token = None
-            try:
-                token = execution_source_context.set("REPLAY")
-                with contextlib.ExitStack() as stack:
-                    if mocks:
-                        for target, behavior in mocks.items():
-                            mock_obj = stack.enter_context(patch(target))
-                            if isinstance(behavior, dict):
-                                if "side_effect" in behavior:
-                                    mock_obj.side_effect = behavior["side_effect"]
-                                elif "return_value" in behavior:
-                                    mock_obj.return_value = behavior["return_value"]
-                                else:
-                                    mock_obj.return_value = behavior
-                            else:
-                                mock_obj.return_value = behavior
-
-                    if is_async_func:
-                        actual_output = asyncio.run(target_func(**inputs))
-                    else:
-                        actual_output = target_func(**inputs)
+            if error_tb is not None:
+                self._record_execution_error(results, uuid_str, inputs, expected_output, actual_output, error_tb)
+                continue
 
+            try:
                 is_match, reason, extra_fields = compare_fn(expected_output, actual_output)
 
                 tag = f" ({reason})" if reason else ""
@@ -128,7 +197,7 @@ class VectorWaveReplayer:
                     logger.debug(f"UUID {uuid_str}: PASSED{tag}{golden_tag}")
                 else:
                     if update_baseline:
-                        self._update_baseline_value(uuid_str, actual_output, is_golden)
+                        pending_updates.append((uuid_str, actual_output, is_golden))
                         results["updated"] += 1
                         results["passed"] += 1
                         logger.info(f"UUID {uuid_str}: Baseline UPDATED")
@@ -147,47 +216,149 @@ class VectorWaveReplayer:
                         logger.warning(f"UUID {uuid_str}: FAILED{tag or ' (Mismatch)'}{golden_tag}")
 
             except Exception as e:
-                results["failed"] += 1
-                logger.error(f"UUID {uuid_str}: EXECUTION ERROR - {e}")
-                results["failures"].append({
-                    "uuid": uuid_str,
-                    "inputs": inputs,
-                    "expected": expected_output,
-                    "actual": "EXCEPTION_RAISED",
-                    "error": f"Exception: {str(e)}",
-                    "diff_html": f"<div class='error'>{traceback.format_exc()}</div>",
-                    "traceback": traceback.format_exc()
-                })
-            finally:
-                if token is not None:
-                    execution_source_context.reset(token)
+                self._record_execution_error(results, uuid_str, inputs, expected_output, e, traceback.format_exc())
 
+        self._flush_baseline_updates(pending_updates)
         logger.info(f"Replay Finished. Passed: {results['passed']}, Failed: {results['failed']}")
         return results
 
-    def _fetch_test_candidates(self, func_short_name: str, limit: int) -> List[Dict[str, Any]]:
+    def _record_execution_error(self, results: Dict[str, Any], uuid_str: str, inputs: Dict[str, Any],
+                                expected_output: Any, error: Exception, tb_text: str):
+        results["failed"] += 1
+        logger.error(f"UUID {uuid_str}: EXECUTION ERROR - {error}")
+        results["failures"].append({
+            "uuid": uuid_str,
+            "inputs": inputs,
+            "expected": expected_output,
+            "actual": "EXCEPTION_RAISED",
+            "error": f"Exception: {str(error)}",
+            "diff_html": f"<div class='error'><pre>{html.escape(tb_text, quote=False)}</pre></div>",
+            "traceback": tb_text
+        })
+
+    def _execute_cases(self, target_func, inputs_list: List[Dict[str, Any]],
+                       mocks: Optional[Dict[str, Any]],
+                       max_workers: Optional[int]) -> List[Tuple[Any, Optional[str]]]:
+        """
+        Executes target_func once per inputs dict and returns [(output, None) | (exception, traceback)]
+        in input order. Async targets share one event loop with bounded concurrency. Sync targets
+        run on a thread pool when max_workers > 1 (or None) and no mocks are given (patches are
+        process-global, so mocked replays stay sequential). Each worker sets the REPLAY source
+        in its own context.
+        """
+        if max_workers is None:
+            max_workers = min(_AUTO_REPLAY_WORKERS, len(inputs_list))
+
+        if inspect.iscoroutinefunction(target_func):
+            concurrency = max_workers if max_workers > 1 else _ASYNC_REPLAY_CONCURRENCY
+            coro = self._execute_cases_async(target_func, inputs_list, mocks, concurrency)
+            if _EAGER_TASK_FACTORY is None:
+                return asyncio.run(coro)
+            with asyncio.Runner() as runner:  # 3.12+, like the factory itself
+                runner.get_loop().set_task_factory(_EAGER_TASK_FACTORY)
+                return runner.run(coro)
+
+        if max_workers > 1 and not mocks and len(inputs_list) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(inputs_list)),
+                                    thread_name_prefix="VectorWaveReplay") as pool:
+                return list(pool.map(lambda inputs: self._execute_one(target_func, inputs, None), inputs_list))
+
+        return [self._execute_one(target_func, inputs, mocks) for inputs in inputs_list]
+
+    async def _execute_cases_async(self, target_func, inputs_list: List[Dict[str, Any]],
+                                   mocks: Optional[Dict[str, Any]],
+                                   concurrency: int = _ASYNC_REPLAY_CONCURRENCY) -> List[Tuple[Any, Optional[str]]]:
+        """
+        Runs every async replay on one event loop. Without mocks the calls are gathered
+        concurrently, at most `concurrency` in flight, so a slow call only holds its own slot;
+        with mocks they are awaited one by one so each gets its own patches.
+        """
+        async def run_one(inputs):
+            try:
+                return await target_func(**inputs), None
+            except Exception as e:
+                return e, traceback.format_exc()
+
+        async def run_bounded(inputs):
+            async with semaphore:
+                return await run_one(inputs)
+
+        # Tasks copy the current context when created, so they all see the REPLAY source.
+        token = execution_source_context.set("REPLAY")
+        try:
+            if not mocks:
+                semaphore = asyncio.Semaphore(max(1, concurrency))
+                return list(await asyncio.gather(*(run_bounded(inputs) for inputs in inputs_list)))
+
+            outcomes = []
+            for inputs in inputs_list:
+                try:
+                    with contextlib.ExitStack() as stack:
+                        self._apply_mocks(stack, mocks)
+                        outcomes.append(await run_one(inputs))
+                except Exception as e:
+                    outcomes.append((e, traceback.format_exc()))
+            return outcomes
+        finally:
+            execution_source_context.reset(token)
+
+    def _execute_one(self, target_func, inputs: Dict[str, Any],
+                     mocks: Optional[Dict[str, Any]]) -> Tuple[Any, Optional[str]]:
+        token = execution_source_context.set("REPLAY")
+        try:
+            with contextlib.ExitStack() as stack:
+                self._apply_mocks(stack, mocks)
+                return target_func(**inputs), None
+        except Exception as e:
+            return e, traceback.format_exc()
+        finally:
+            execution_source_context.reset(token)
+
+    def _apply_mocks(self, stack: contextlib.ExitStack, mocks: Optional[Dict[str, Any]]):
+        if not mocks:
+            return
+        for target, behavior in mocks.items():
+            mock_obj = stack.enter_context(patch(target))
+            if isinstance(behavior, dict):
+                if "side_effect" in behavior:
+                    mock_obj.side_effect = behavior["side_effect"]
+                elif "return_value" in behavior:
+                    mock_obj.return_value = behavior["return_value"]
+                else:
+                    mock_obj.return_value = behavior
+            else:
+                mock_obj.return_value = behavior
+
+    def _fetch_test_candidates(self, func_short_name: str, limit: int,
+                               valid_params: Optional[frozenset] = None) -> List[Dict[str, Any]]:
         """
         Helper to fetch Golden Data first, then fill remainder with Standard Executions.
         Resolves inputs for Golden Data by querying the original log.
+        When valid_params is known, only those properties (plus return_value) are fetched.
         """
         candidates = []
 
         # 2-1. Fetch from Golden Dataset
-        golden_col = self.client.collections.get(self.golden_collection_name)
-        exec_col = self.client.collections.get(self.collection_name)
+        golden_col = self.golden_collection
+        exec_col = self.collection
+        exec_properties = self._replay_return_properties(exec_col, valid_params)
+        projection = {"return_properties": exec_properties} if exec_properties else {}
 
         try:
             golden_res = golden_col.query.fetch_objects(
                 filters=wvc_query.Filter.by_property("function_name").equal(func_short_name),
-                limit=limit
+                limit=limit,
+                return_properties=["original_uuid", "return_value"]
             )
 
-            for obj in golden_res.objects:
-                original_uuid = obj.properties.get("original_uuid")
-                if not original_uuid:
-                    continue
+            golden_objs = [obj for obj in golden_res.objects if obj.properties.get("original_uuid")]
+            original_logs = self._fetch_original_logs(
+                exec_col, [obj.properties["original_uuid"] for obj in golden_objs], projection
+            )
 
-                original_log = exec_col.query.fetch_object_by_id(original_uuid)
+            for obj in golden_objs:
+                original_uuid = obj.properties["original_uuid"]
+                original_log = original_logs.get(str(original_uuid))
                 if original_log is None:
                     logger.warning(f"Golden Data {obj.uuid} refers to missing log {original_uuid}. Skipping.")
                     continue
@@ -213,13 +384,7 @@ class VectorWaveReplayer:
                         wvc_query.Filter.by_property("function_name").equal(func_short_name) &
                         wvc_query.Filter.by_property("status").equal("SUCCESS")
                 )
-                exec_res = exec_col.query.fetch_objects(
-                    filters=filters,
-                    limit=remaining,
-                    sort=wvc_query.Sort.by_property("timestamp_utc", ascending=False)
-                )
-
-                for obj in exec_res.objects:
+                for obj in self._iter_recent_executions(exec_col, filters, remaining, projection):
                     candidates.append({
                         "uuid": str(obj.uuid),
                         "inputs": obj.properties,
@@ -231,55 +396,179 @@ class VectorWaveReplayer:
 
         return candidates
 
-    def _extract_inputs(self, props: Dict[str, Any], target_func: callable) -> Dict[str, Any]:
-        """Extracts only the arguments defined in the target function's signature."""
+    def _iter_recent_executions(self, exec_col, filters, limit: int, projection: Dict[str, Any]):
+        """
+        Yields up to `limit` logs matching filters, newest first. Up to one page is a single query.
+        Larger limits page by timestamp (each page asks for logs no newer than the last one seen),
+        since Weaviate caps offset paging and its `after` cursor cannot be combined with filters.
+        """
+        sort = wvc_query.Sort.by_property("timestamp_utc", ascending=False)
+        if limit <= _REPLAY_PAGE_SIZE:
+            yield from exec_col.query.fetch_objects(filters=filters, limit=limit, sort=sort, **projection).objects
+            return
+
+        properties = projection.get("return_properties")
+        if properties is not None and "timestamp_utc" not in properties:
+            projection = {"return_properties": [*properties, "timestamp_utc"]}
+
+        remaining = limit
+        last_ts = None
+        tied = set()  # uuids already yielded whose timestamp equals last_ts
+        while remaining > 0:
+            page_filters = filters
+            if last_ts is not None:
+                page_filters = filters & wvc_query.Filter.by_property("timestamp_utc").less_or_equal(last_ts)
+            page_limit = min(_REPLAY_PAGE_SIZE, remaining) + len(tied)
+            page = exec_col.query.fetch_objects(
+                filters=page_filters,
+                limit=page_limit,
+                sort=sort,
+                **projection
+            ).objects
+
+            fresh = [obj for obj in page if str(obj.uuid) not in tied]
+            for obj in fresh[:remaining]:
+                yield obj
+            remaining -= len(fresh)
+
+            page_last_ts = page[-1].properties.get("timestamp_utc") if page else None
+            if len(page) < page_limit or not fresh or page_last_ts is None:
+                return
+            if page_last_ts != last_ts:
+                tied = set()
+            tied.update(str(obj.uuid) for obj in fresh if obj.properties.get("timestamp_utc") == page_last_ts)
+            last_ts = page_last_ts
+
+    def _fetch_original_logs(self, exec_col, original_uuids: List[str],
+                             projection: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolves the execution logs Golden Data points at, keyed by str(uuid).
+        Several are fetched with one by-id filter query instead of one request each.
+        """
+        if not original_uuids:
+            return {}
+        if len(original_uuids) == 1:
+            log = exec_col.query.fetch_object_by_id(original_uuids[0], **projection)
+            return {str(original_uuids[0]): log} if log is not None else {}
+
+        unique_uuids = list(dict.fromkeys(original_uuids))
+        res = exec_col.query.fetch_objects(
+            filters=wvc_query.Filter.by_id().contains_any(unique_uuids),
+            limit=len(unique_uuids),
+            **projection
+        )
+        return {str(obj.uuid): obj for obj in res.objects}
+
+    def _replay_return_properties(self, exec_col, valid_params: Optional[frozenset]) -> Optional[List[str]]:
+        """
+        Execution-log properties a replay needs: the target's parameters that exist in the
+        collection schema, plus return_value. None (fetch everything) when either is unknown.
+        """
+        if not valid_params:
+            return None
         try:
-            sig = inspect.signature(target_func)
-            valid_params = sig.parameters.keys()
-            inputs = {}
-            for k, v in props.items():
-                if k in valid_params and v != "[MASKED]":
-                    inputs[k] = v
-            return inputs
+            existing_props = {p.name for p in exec_col.config.get().properties}
+        except Exception as e:
+            logger.debug(f"Could not read schema of '{self.collection_name}': {e}")
+            return None
+        if not existing_props:
+            return None
+        return sorted((valid_params & existing_props) | {"return_value"})
+
+    def _get_valid_params(self, target_func: callable) -> Optional[frozenset]:
+        """Parameter names of target_func, resolved once per replay run (None if unavailable)."""
+        try:
+            return frozenset(inspect.signature(target_func).parameters)
         except Exception as e:
             logger.warning(f"Failed to extract inputs: {e}")
+            return None
+
+    def _extract_inputs(self, props: Dict[str, Any], valid_params: Optional[frozenset]) -> Dict[str, Any]:
+        """Extracts only the arguments defined in the target function's signature."""
+        if valid_params is None:
             return props
+        return {k: v for k, v in props.items() if k in valid_params and v != "[MASKED]"}
 
     def _deserialize_value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return _deserialize_baseline(value)
         return deserialize_return_value(value)
 
     def _compare_results(self, expected: Any, actual: Any) -> bool:
-        if expected == actual: return True
+        if expected is actual or expected == actual: return True
         if str(expected) == str(actual): return True
+        # Structural equality can only differ from the checks above for containers.
+        if not (isinstance(expected, _JSON_CONTAINERS) and isinstance(actual, _JSON_CONTAINERS)):
+            return False
         try:
-            return json.dumps(expected, sort_keys=True) == json.dumps(actual, sort_keys=True)
-        except:
+            return _deep_equal(expected, actual)
+        except RecursionError:
             return False
 
+    def _flush_baseline_updates(self, pending_updates: List[Tuple[str, Any, bool]]):
+        """
+        Writes drifted baselines after the replay loop. Updates are independent partial
+        updates, so several are issued concurrently to overlap their round-trips.
+        """
+        if len(pending_updates) <= 1:
+            for update in pending_updates:
+                self._update_baseline_value(*update)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(_BASELINE_UPDATE_WORKERS, len(pending_updates)),
+                                thread_name_prefix="VectorWaveBaseline") as pool:
+            list(pool.map(lambda update: self._update_baseline_value(*update), pending_updates))
+
     def _update_baseline_value(self, uuid_str: str, new_value: Any, is_golden: bool):
-        collection_name = self.golden_collection_name if is_golden else self.collection_name
-        collection = self.client.collections.get(collection_name)
+        collection = self.golden_collection if is_golden else self.collection
 
         processed_val = vectorwave_core.mask_and_serialize(new_value, [])
         try:
-            val_str = json.dumps(processed_val)
+            val_str = serialize_return_value(processed_val)
         except (TypeError, ValueError):
             val_str = str(processed_val)
 
         try:
             collection.data.update(
                 uuid=uuid_str,
-                properties={"return_value": str(val_str)}
+                properties={"return_value": val_str}
             )
         except Exception as e:
             logger.error(f"Failed to update baseline for {uuid_str}: {e}")
 
+    @staticmethod
+    def _format_for_diff(value: Any) -> str:
+        # pformat returns the plain repr of any scalar that fits the width; skip its printer setup.
+        if isinstance(value, _SCALAR_TYPES):
+            text = repr(value)
+            if len(text) <= 80:
+                return text
+        return pprint.pformat(value, width=80)
+
+    @staticmethod
+    def _truncate_for_diff(lines: List[str], max_lines: int = _DIFF_MAX_LINES) -> List[str]:
+        if len(lines) <= max_lines:
+            return lines
+        head = max_lines // 2
+        tail = max_lines - head
+        return lines[:head] + [f"... ({len(lines) - max_lines} lines omitted) ..."] + lines[-tail:]
+
     def _generate_diff_html(self, expected: Any, actual: Any) -> str:
-        exp_str = pprint.pformat(expected, width=80)
-        act_str = pprint.pformat(actual, width=80)
+        exp_str = self._format_for_diff(expected)
+        act_str = self._format_for_diff(actual)
+        if len(exp_str) + len(act_str) > _DIFF_MAX_CHARS:
+            # make_table is O(N*M) and its HTML grows with the input; summarise instead.
+            exp_lines = exp_str.count("\n") + 1
+            act_lines = act_str.count("\n") + 1
+            return (
+                "<pre class='diff-summary'>Output too large to diff: "
+                f"expected {exp_lines} lines / {len(exp_str)} chars, "
+                f"actual {act_lines} lines / {len(act_str)} chars</pre>"
+            )
+        # HtmlDiff keeps per-table state on the instance, so concurrent replays each get their own.
         return difflib.HtmlDiff(wrapcolumn=80).make_table(
-            fromlines=exp_str.splitlines(),
-            tolines=act_str.splitlines(),
+            fromlines=self._truncate_for_diff(exp_str.splitlines()),
+            tolines=self._truncate_for_diff(act_str.splitlines()),
             fromdesc='Expected (Baseline)',
             todesc='Actual (Current)',
             context=True,
@@ -1,14 +1,66 @@
-import json
+import hashlib
 import logging
 import math
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.llm.factory import get_llm_client
 from .replayer import VectorWaveReplayer
 from ..vectorizer.factory import get_vectorizer
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
+_STR_FAITHFUL_TYPES = frozenset((str, int, bool))
+_LLM_VERDICT_CACHE_MAX = 4096
+_EMBEDDING_CACHE_MAX = 4096
+_LLM_JUDGE_WORKERS = 8
+_JUDGE_MAX_TOKENS = 5
+
+_JUDGE_PROMPT = """Compare two outputs. Are they semantically equivalent?
+Ignore minor formatting differences.
+
+Expected: {expected}
+Actual: {actual}
+
+Answer with a single word: true or false."""
+
+
+def _verdict_key(expected: str, actual: str) -> str:
+    pair = f"{expected}\x00{actual}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(pair, digest_size=16).hexdigest()
+
+
+def _cosine(v1: List[float], v2: List[float]) -> float:
+    dot = sum(a * b for a, b in zip(v1, v2))
+    norm1 = math.sqrt(sum(a * a for a in v1))
+    norm2 = math.sqrt(sum(b * b for b in v2))
+    return dot / (norm1 * norm2) if norm1 and norm2 else 0.0
+
+
+def _pair_cosines(vectors: List[List[float]], index_pairs: List[Tuple[int, int]]) -> List[float]:
+    """
+    Cosine score of vectors[i] and vectors[j] for each (i, j) in index_pairs.
+    With NumPy, every distinct vector is L2-normalised once in a float32 matrix and all
+    scores come from one row-wise dot product; ragged input falls back to pure Python.
+    """
+    if np is not None:
+        try:
+            matrix = np.asarray(vectors, dtype=np.float32)
+        except ValueError:
+            matrix = None  # ragged, e.g. a failed embedding came back as []
+        if matrix is not None and matrix.ndim == 2:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)  # zero vectors stay zero
+            left, right = np.asarray(index_pairs, dtype=np.intp).reshape(-1, 2).T
+            return np.einsum('ij,ij->i', matrix[left], matrix[right]).tolist()
+    return [_cosine(vectors[i], vectors[j]) for i, j in index_pairs]
+
 
 class SemanticReplayer(VectorWaveReplayer):
     """
@@ -16,9 +68,18 @@ class SemanticReplayer(VectorWaveReplayer):
     Updated to prioritize 'Golden Data' using the parent's data fetching logic.
     """
 
-    def __init__(self):
+    def __init__(self, judge_model: str = "gpt-4o-mini"):
         super().__init__()
         self.openai_client = get_llm_client()
+        self.judge_model = judge_model
+        # (str_expected, str_actual) -> cosine score, filled once per replay by _prefetch_similarities
+        self._similarity_cache: Dict[Tuple[str, str], float] = {}
+        # content hash of (expected, actual) -> LLM verdict, kept for the replayer's lifetime
+        self._llm_verdict_cache: Dict[str, bool] = {}
+        # text -> embedding, shared by every replay on this instance
+        self._embedding_cache: Dict[str, List[float]] = {}
+        self._embedding_hits = 0
+        self._embedding_misses = 0
 
     def replay(self,
                function_full_name: str,
@@ -26,7 +87,8 @@ class SemanticReplayer(VectorWaveReplayer):
                update_baseline: bool = False,
                similarity_threshold: Optional[float] = None,
                semantic_eval: bool = False,
-               mocks: Optional[Dict[str, Any]] = None
+               mocks: Optional[Dict[str, Any]] = None,
+               max_workers: Optional[int] = 1
                ) -> Dict[str, Any]:
         """
         Retrieves past execution history (Golden > Standard), re-executes it,
@@ -48,7 +110,20 @@ class SemanticReplayer(VectorWaveReplayer):
             )
             return is_match, reason, ({"reason": reason} if not is_match else {})
 
-        return self._run_replay_loop(target_func, test_objects, results, update_baseline, compare_fn, mocks=mocks)
+        def prepare_fn(pairs):
+            text_pairs = self._mismatched_text_pairs(pairs)
+            if similarity_threshold is not None:
+                self._prefetch_similarities(text_pairs)
+            if semantic_eval:
+                self._prefetch_llm_verdicts(text_pairs, similarity_threshold)
+
+        if similarity_threshold is None and not semantic_eval:
+            prepare_fn = None
+        try:
+            return self._run_replay_loop(target_func, test_objects, results, update_baseline, compare_fn,
+                                         mocks=mocks, max_workers=max_workers, prepare_fn=prepare_fn)
+        finally:
+            self._similarity_cache = {}
 
     def _compare_results_semantic(self, expected: Any, actual: Any,
                                   similarity_threshold: Optional[float],
@@ -60,15 +135,23 @@ class SemanticReplayer(VectorWaveReplayer):
         if expected == actual:
             return True, "Exact Match"
 
+        # For two values of one of these types, equal str() implies ==, so the string
+        # check cannot succeed and str() is only worth computing for the later stages.
+        same_scalar = type(expected) is type(actual) and type(expected) in _STR_FAITHFUL_TYPES
+        if same_scalar and similarity_threshold is None and not semantic_eval:
+            return False, "Exact match failed"
+
         str_expected = str(expected)
         str_actual = str(actual)
 
-        if str_expected == str_actual:
+        if not same_scalar and str_expected == str_actual:
             return True, "String Match"
 
         # 2. Vector Similarity
         if similarity_threshold is not None:
-            score = self._calculate_cosine_similarity(str_expected, str_actual)
+            score = self._similarity_cache.get((str_expected, str_actual))
+            if score is None:
+                score = self._calculate_cosine_similarity(str_expected, str_actual)
             if score >= similarity_threshold:
                 return True, f"Vector Similarity ({score:.4f})"
 
@@ -83,48 +166,151 @@ class SemanticReplayer(VectorWaveReplayer):
 
         return False, "Exact match failed"
 
+    @staticmethod
+    def _mismatched_text_pairs(pairs: List[Tuple[Any, Any]]) -> List[Tuple[str, str]]:
+        """Distinct (str_expected, str_actual) pairs that get past the exact and string checks."""
+        text_pairs = []
+        seen = set()
+        for expected, actual in pairs:
+            if expected == actual:
+                continue
+            key = (str(expected), str(actual))
+            if key[0] != key[1] and key not in seen:
+                seen.add(key)
+                text_pairs.append(key)
+        return text_pairs
+
+    def _prefetch_similarities(self, text_pairs: List[Tuple[str, str]]):
+        """
+        Embeds every pair that will reach the vector stage in at most one embed_batch() call
+        and caches the scores, instead of two embed() round-trips per test case.
+        """
+        if not text_pairs:
+            return
+
+        vectorizer = get_vectorizer()
+        if vectorizer is None:
+            return
+        # Baselines often share one actual output (or vice versa); embed and normalise each text once.
+        unique_texts = list(dict.fromkeys(text for pair in text_pairs for text in pair))
+        index = {text: i for i, text in enumerate(unique_texts)}
+        try:
+            vectors = self._embed_texts(vectorizer, unique_texts)
+        except Exception as e:
+            # compare_fn falls back to embedding each pair on its own
+            logger.warning("Batched similarity embedding failed: %s", e)
+            return
+
+        scores = _pair_cosines(vectors, [(index[expected], index[actual]) for expected, actual in text_pairs])
+        self._similarity_cache.update(zip(text_pairs, scores))
+        logger.debug("Embedding cache: %d hits, %d misses", self._embedding_hits, self._embedding_misses)
+
     def _calculate_cosine_similarity(self, text1: str, text2: str) -> float:
         vectorizer = get_vectorizer()
         if vectorizer is None:
             return 0.0
         try:
-            v1 = vectorizer.embed(text1)
-            v2 = vectorizer.embed(text2)
-            dot = sum(a * b for a, b in zip(v1, v2))
-            norm1 = math.sqrt(sum(a * a for a in v1))
-            norm2 = math.sqrt(sum(b * b for b in v2))
-            return dot / (norm1 * norm2) if norm1 and norm2 else 0.0
-
-        except Exception:
+            return _pair_cosines(self._embed_texts(vectorizer, [text1, text2]), [(0, 1)])[0]
+
+        except (TypeError, ValueError, RuntimeError) as e:
+            # Unusable vectors score 0.0; anything else is a bug the replay should report.
+            logger.debug("Similarity scoring failed: %s", e)
             return 0.0
 
+    def _embed_texts(self, vectorizer, texts: List[str]) -> List[List[float]]:
+        """
+        Vectors for texts, in order. Each distinct text not embedded before is sent
+        in a single embed_batch() call; the rest come from the replayer's cache.
+        """
+        missing = [text for text in dict.fromkeys(texts) if text not in self._embedding_cache]
+        self._embedding_misses += len(missing)
+        self._embedding_hits += len(texts) - len(missing)
+        if not missing:
+            return [self._embedding_cache[text] for text in texts]
+
+        vectors = vectorizer.embed_batch(missing)
+        if len(vectors) != len(missing):
+            raise ValueError(f"embed_batch returned {len(vectors)} vectors for {len(missing)} texts")
+        fresh = dict(zip(missing, vectors))
+        result = [fresh[text] if text in fresh else self._embedding_cache[text] for text in texts]
+
+        if len(self._embedding_cache) + len(fresh) > _EMBEDDING_CACHE_MAX:
+            self._embedding_cache.clear()
+        # An empty vector means that text failed to embed; let it be retried.
+        self._embedding_cache.update((text, vector) for text, vector in fresh.items() if len(vector))
+        return result
+
+    def _prefetch_llm_verdicts(self, text_pairs: List[Tuple[str, str]], similarity_threshold: Optional[float]):
+        """
+        Judges the pairs that will fall through to the LLM stage concurrently, so compare_fn
+        finds their verdicts cached instead of waiting on one completion per test case.
+        """
+        if self.openai_client is None:
+            return
+        pending: Dict[str, Tuple[str, str]] = {}
+        for expected, actual in text_pairs:
+            if similarity_threshold is not None:
+                score = self._similarity_cache.get((expected, actual))
+                if score is None or score >= similarity_threshold:
+                    continue  # passes on similarity, or compare_fn will score it first
+            key = _verdict_key(expected, actual)
+            if key not in self._llm_verdict_cache:
+                pending.setdefault(key, (expected, actual))
+        if len(pending) < 2:
+            return  # nothing to overlap; compare_fn asks on demand
+
+        with ThreadPoolExecutor(max_workers=min(_LLM_JUDGE_WORKERS, len(pending)),
+                                thread_name_prefix="VectorWaveJudge") as pool:
+            verdicts = pool.map(lambda pair: self._request_llm_verdict(*pair), pending.values())
+            for key, verdict in zip(pending, verdicts):
+                if verdict is not None:
+                    self._store_verdict(key, verdict)
+
     def _evaluate_with_llm(self, expected: str, actual: str) -> bool:
         if self.openai_client is None:
             return False
 
-        prompt = f"""
-        Compare two outputs. Are they semantically equivalent?
-        Ignore minor formatting differences.
+        key = _verdict_key(expected, actual)
+        verdict = self._llm_verdict_cache.get(key)
+        if verdict is None:
+            verdict = self._request_llm_verdict(expected, actual)
+            if verdict is not None:
+                self._store_verdict(key, verdict)
+        return bool(verdict)
 
-        Expected: {expected}
-        Actual: {actual}
+    def _store_verdict(self, key: str, verdict: bool):
+        if len(self._llm_verdict_cache) >= _LLM_VERDICT_CACHE_MAX:
+            self._llm_verdict_cache.clear()
+        self._llm_verdict_cache[key] = verdict
 
-        Respond JSON: {{"equivalent": true}} or {{"equivalent": false}}
-        """
+    def _request_llm_verdict(self, expected: str, actual: str) -> Optional[bool]:
+        """Asks the judge model once; None when no verdict came back (not cached)."""
+        prompt = _JUDGE_PROMPT.format_map({"expected": expected, "actual": actual})
         try:
-            # Refactored to use create_chat_completion
             response_text = self.openai_client.create_chat_completion(
-                model="gpt-4-turbo",
+                model=self.judge_model,
                 messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
                 temperature=0.0,
+                max_tokens=_JUDGE_MAX_TOKENS,
                 category="semantic_replay"
             )
 
-            if response_text:
-                return json.loads(response_text).get("equivalent", False)
-            return False
+            answer = (response_text or "").strip().lower()
+            if answer.startswith("true"):
+                return True
+            if answer.startswith("false"):
+                return False
+            return None
 
         except Exception as e:
             logger.error(f"LLM Eval failed: {e}")
-            return False
+            return None
+
+
+@lru_cache()
+def get_semantic_replayer(judge_model: str = "gpt-4o-mini") -> SemanticReplayer:
+    """
+    Returns a shared SemanticReplayer per judge model, so repeated replays reuse its clients,
+    collection handles and embedding / verdict caches.
+    """
+    return SemanticReplayer(judge_model=judge_model)
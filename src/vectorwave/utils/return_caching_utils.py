@@ -41,7 +41,7 @@ def _check_and_return_cached_result(
     vectorizer = get_vectorizer()
 
     if vectorizer is None:
-        logger.error(f"Cannot perform vectorization for caching on '{function_name}': Vectorizer is None.")
+        logger.error("Cannot perform vectorization for caching on '%s': Vectorizer is None.", function_name)
         return None
 
     try:
@@ -81,10 +81,10 @@ def _check_and_return_cached_result(
 
             if response.objects:
                 golden_match = response.objects[0]
-                logger.info(f"🌟 [Golden Cache Hit] '{function_name}' found in Golden Dataset. (Distance: {golden_match.metadata.distance:.4f})")
+                logger.info("🌟 [Golden Cache Hit] '%s' found in Golden Dataset. (Distance: %.4f)", function_name, golden_match.metadata.distance)
 
         except Exception as e:
-            logger.warning(f"Golden cache search failed: {e}")
+            logger.warning("Golden cache search failed: %s", e)
 
         # (D) Decide Source (Golden vs Standard)
         cached_log = None
@@ -153,12 +153,12 @@ def _check_and_return_cached_result(
                 )
 
             except Exception as log_e:
-                logger.error(f"Failed to log CACHE_HIT: {log_e}")
+                logger.error("Failed to log CACHE_HIT: %s", log_e)
 
             return _deserialize_return_value(cached_log.get('return_value'))
 
         return None
 
     except Exception as e:
-        logger.error(f"Failed to check semantic cache for '{function_name}': {e}", exc_info=True)
+        logger.error("Failed to check semantic cache for '%s': %s", function_name, e, exc_info=True)
         return None
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import logging
 import schedule
@@ -59,33 +60,38 @@ class AutoHealerBot:
 
         logger.info(f"🚨 Found issues in {len(target_functions)} functions: {list(target_functions)}")
 
-        # 3. Attempt healing for each function
+        # 3. Attempt healing for every function outside its cooldown, concurrently
+        to_heal = []
         for func_name in target_functions:
             if self._is_in_cooldown(func_name):
                 logger.info(f"⏳ Skipping '{func_name}': Already processed recently (Cooldown active).")
                 continue
-
             logger.info(f"🚑 Initiating healing process for '{func_name}'...")
+            to_heal.append(func_name)
 
-            try:
-                # Call Healer in PR creation mode
-                result = self.healer.diagnose_and_heal(
-                    function_name=func_name,
-                    lookback_minutes=60,
-                    create_pr=True
-                )
-
-                # Check result
-                if "PR Created Successfully" in result:
-                    logger.info(f"🎉 AutoHealer Fixed '{func_name}'! PR Created.")
-                    self._update_cooldown(func_name)
-                elif "No errors found" in result:
-                    logger.info(f"⚠️ Healer found no logs for '{func_name}' (Maybe intermittent).")
-                else:
-                    logger.warning(f"⚠️ Healing attempted for '{func_name}' but PR not created. Check logs.")
-
-            except Exception as e:
-                logger.error(f"❌ Critical error while healing '{func_name}': {e}")
+        if not to_heal:
+            return
+
+        try:
+            # Call Healer in PR creation mode
+            results = self.healer.diagnose_and_heal_many(
+                to_heal,
+                lookback_minutes=60,
+                create_pr=True
+            )
+        except Exception as e:
+            logger.error(f"❌ Critical error while healing {to_heal}: {e}")
+            return
+
+        for func_name, result in results.items():
+            # Check result
+            if "PR Created Successfully" in result:
+                logger.info(f"🎉 AutoHealer Fixed '{func_name}'! PR Created.")
+                self._update_cooldown(func_name)
+            elif "No errors found" in result:
+                logger.info(f"⚠️ Healer found no logs for '{func_name}' (Maybe intermittent).")
+            else:
+                logger.warning(f"⚠️ Healing attempted for '{func_name}' but PR not created. Check logs.")
 
     def _is_in_cooldown(self, func_name: str) -> bool:
         """Checks if the function is in the cooldown period (recently healed)."""
@@ -106,16 +112,19 @@ class AutoHealerBot:
         self.healed_history[func_name] = datetime.now()
 
 
-def start_scheduler(interval_minutes: int = 5):
-    """Entry point to start the scheduler."""
-    bot = AutoHealerBot(check_interval_minutes=interval_minutes)
-
+def _log_scheduler_banner(interval_minutes: int):
     logger.info("=" * 60)
     logger.info(f"🚀 VectorWave AutoHealer Started!")
     logger.info(f"   - Check Interval: Every {interval_minutes} minutes")
     logger.info(f"   - Mode: Automatic Diagnosis & PR Creation")
     logger.info("=" * 60)
 
+
+def start_scheduler(interval_minutes: int = 5):
+    """Entry point to start the scheduler."""
+    bot = AutoHealerBot(check_interval_minutes=interval_minutes)
+    _log_scheduler_banner(interval_minutes)
+
     # Register schedule
     schedule.every(interval_minutes).minutes.do(bot.scan_and_heal)
 
@@ -124,4 +133,18 @@ def start_scheduler(interval_minutes: int = 5):
 
     while True:
         schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+        time.sleep(1)
+
+
+async def start_scheduler_async(interval_minutes: int = 5):
+    """
+    Async entry point for hosts that already run an event loop (e.g., FastAPI).
+    Sleeps on the loop between scans instead of holding a dedicated thread.
+    """
+    bot = AutoHealerBot(check_interval_minutes=interval_minutes)
+    _log_scheduler_banner(interval_minutes)
+
+    while True:
+        # scan_and_heal does blocking DB/LLM calls, so keep it off the event loop
+        await asyncio.to_thread(bot.scan_and_heal)
+        await asyncio.sleep(interval_minutes * 60)
@@ -1,6 +1,61 @@
 import json
+import math
+import re
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+# Every JSON document starts with one of these (NaN/Infinity are stdlib json extensions).
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI \t\n\r')
+# orjson parses integer literals wider than 64 bits as floats; 20+ digits is the safe cut-off.
+_WIDE_INT_RE = re.compile(r'\d{20}')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """True if value holds a NaN/Infinity float, which orjson would write as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def serialize_return_value(value: Any) -> str:
+    """
+    Serializes a (masked) return value to a JSON string.
+    Uses orjson when installed, falling back to the stdlib for anything orjson rejects
+    (e.g. integers beyond 64 bits) or would not round-trip (NaN/Infinity, which orjson
+    writes as null). Raises TypeError if the value is not serializable.
+    """
+    if orjson is not None:
+        try:
+            dumped = orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            if b'null' not in dumped or not _has_non_finite(value):
+                return dumped.decode('utf-8')
+    return json.dumps(value)
+
+
+def serialize_lenient(value: Any) -> str:
+    """
+    Serializes value to a JSON string for display (e.g. in LLM prompts), rendering anything
+    JSON cannot represent with str() instead of raising.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value, default=str, ensure_ascii=False)
+
 
 def deserialize_return_value(value: Optional[Any]) -> Any:
     """
@@ -10,6 +65,16 @@ def deserialize_return_value(value: Optional[Any]) -> Any:
     if value is None:
         return None
     if isinstance(value, str):
+        # Plain strings are common return values; skip the parse (and its exception) for them.
+        if not value or value[0] not in _JSON_START_CHARS:
+            return value
+        # The stdlib also covers what orjson rejects (NaN/Infinity) or would narrow to a
+        # float (integers beyond 64 bits).
+        if orjson is not None and not _WIDE_INT_RE.search(value):
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
         try:
             return json.loads(value)
         except (json.JSONDecodeError, TypeError):
@@ -0,0 +1,104 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional
+
+from .base import BaseVectorizer
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmbedBatcher:
+    """
+    Coalesces single-text embed requests from concurrent callers into embed_batch() calls.
+    A worker thread collects up to `max_batch` texts, or whatever arrived within
+    `max_delay_ms` of the first one, and resolves each caller's Future.
+    """
+
+    def __init__(self, vectorizer: BaseVectorizer, max_batch: int = 32,
+                 max_delay_ms: float = 5.0, max_pending: int = 1024):
+        self.vectorizer = vectorizer
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, text: str) -> Future:
+        """Queues text for embedding; the Future resolves to its vector."""
+        self._ensure_worker()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((text, future))
+        except queue.Full:
+            # Saturated: embed on the caller's thread rather than queueing without bound.
+            try:
+                future.set_result(self.vectorizer.embed(text))
+            except Exception as e:
+                future.set_exception(e)
+        return future
+
+    def embed(self, text: str) -> List[float]:
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(text).result()
+
+    def close(self):
+        """Stops the worker after it finishes the texts already queued."""
+        with self._lock:
+            if self._worker is not None:
+                self._queue.put(_STOP)
+                self._worker = None
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, daemon=True, name="VectorWaveEmbedBatcher"
+                    )
+                    self._worker.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch):
+        texts = [text for text, _ in batch]
+        try:
+            vectors = self.vectorizer.embed_batch(texts)
+            if len(vectors) != len(batch):
+                raise ValueError(f"embed_batch returned {len(vectors)} vectors for {len(batch)} texts")
+        except Exception as e:
+            logger.warning("Batched embedding of %d texts failed: %s", len(batch), e)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
@@ -12,6 +12,9 @@ except ImportError:
     logger.warning("To use OpenAIVectorizer, run 'pip install openai'.")
     OpenAI = None
 
+# Line breaks degrade embedding quality; flatten \r and \n in one C-level pass.
+_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
 
 class OpenAIVectorizer(BaseVectorizer):
 
@@ -27,7 +30,7 @@ class OpenAIVectorizer(BaseVectorizer):
         logger.info("OpenAIVectorizer initialized with model '%s'.", self.model)
 
     def embed(self, text: str) -> List[float]:
-        text = text.replace("\n", " ")
+        text = text.translate(_NEWLINE_TABLE)
         vector = self.client.create_embedding(
             text=text,
             model=self.model,
@@ -36,11 +39,10 @@ class OpenAIVectorizer(BaseVectorizer):
         return vector if vector else []
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            emb = self.embed(text)
-            if emb:
-                embeddings.append(emb)
-            else:
-                embeddings.append([])
-        return embeddings
+        # One embeddings request for the whole batch, so EmbedBatcher's coalescing pays off.
+        vectors = self.client.create_embeddings(
+            texts=[text.translate(_NEWLINE_TABLE) for text in texts],
+            model=self.model,
+            category="embedding"
+        )
+        return [vector if vector else [] for vector in vectors]
@@ -0,0 +1,29 @@
+"""
+Shared path setup for the demo scripts in test_ex.
+
+Importing this module puts the project root (so 'test_ex.*' resolves as a package) and 'src'
+(so the local vectorwave wins over an installed copy) on sys.path. The paths are resolved once
+at import time; later imports reuse the cached module.
+
+It also hosts demo_sleep(): the scripts' "simulate work" delays, skipped when DEMO_FAST=1.
+"""
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+
+for _path in (PROJECT_ROOT, SRC_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# Read once at import; demo_sleep() is called on every simulated step.
+DEMO_FAST = os.environ.get("DEMO_FAST", "").lower() in ("1", "true", "yes")
+
+
+def demo_sleep(seconds: float):
+    """time.sleep() for demo theatrics; a no-op under DEMO_FAST=1."""
+    if not DEMO_FAST:
+        time.sleep(seconds)
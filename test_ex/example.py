@@ -1,18 +1,28 @@
-import sys
 import os
 import time
 import random # random 모듈 임포트 위치 조정
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 
-current_script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_script_dir)
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
-os.chdir(current_script_dir)
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
+os.chdir(_bootstrap.SCRIPT_DIR)
 
 # [MODIFIED] Import generate_and_register_metadata
-from vectorwave import vectorize, initialize_database, generate_and_register_metadata
+from vectorwave import vectorize, initialize_database, generate_and_register_metadata, flush
 from vectorwave.monitoring.tracer import trace_span
 
+# step_3~5는 서로 의존성이 없으므로 한 번 만든 풀에서 동시에 실행합니다.
+_step_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="example-steps")
+
+
+def _submit_traced(fn, **kwargs):
+    # 워커 스레드는 contextvars를 상속하지 않으므로, 호출마다 현재 컨텍스트를 복사해
+    # 실행해야 하위 span이 process_payment의 trace/parent span에 연결됩니다.
+    return _step_pool.submit(copy_context().run, fn, **kwargs)
+
 # Exception 클래스와 함수 정의는 모듈 레벨에 유지해야 Replayer가 찾을 수 있습니다.
 class CustomValueError(Exception):
     def __init__(self, message, error_code):
@@ -24,32 +34,32 @@ def step_1_validate_payment(user_id: str, amount: int):
     print(f"  [SPAN 1] Validating payment for {user_id}...")
     if amount < 0:
         raise CustomValueError("Amount cannot be negative", "INVALID_INPUT")
-    time.sleep(0.1)
+    _bootstrap.demo_sleep(0.1)
     print(f"  [SPAN 1] Validation complete.")
     return True
 
 @trace_span(attributes_to_capture=['user_id', 'receipt_id'], capture_return_value=True)
 def step_2_send_receipt(user_id: str, receipt_id: str):
     print(f"  [SPAN 2] Sending receipt {receipt_id} to {user_id}...")
-    time.sleep(0.2)
+    _bootstrap.demo_sleep(0.2)
     print(f"  [SPAN 2] Receipt sent.")
 
 @trace_span(attributes_to_capture=['user_id'], capture_return_value=True)
 def step_3_get_user_details(user_id: str):
     print(f"  [SPAN 3] Fetching user details for {user_id}...")
-    time.sleep(0.05)
+    _bootstrap.demo_sleep(0.05)
     return {"username": "user_A", "email": "user_a@example.com", "is_active": True}
 
 @trace_span(capture_return_value=True)
 def step_4_get_user_roles():
     print(f"  [SPAN 4] Fetching user roles...")
-    time.sleep(0.02)
+    _bootstrap.demo_sleep(0.02)
     return ["admin", "billing_user", "support_agent"]
 
 @trace_span(capture_return_value=True)
 def step_5_get_user_balance():
     print(f"  [SPAN 5] Fetching user balance...")
-    time.sleep(0.01)
+    _bootstrap.demo_sleep(0.01)
     return 15000
 
 @vectorize(
@@ -58,16 +68,20 @@ def step_5_get_user_balance():
     team="billing",
     priority=1,
     replay=True,
-    capture_inputs=True
+    capture_inputs=True,
+    flush_spans=True  # step_* spans are handed to the logger as one batch when this returns
 )
 def process_payment(user_id: str, amount: int):
     print(f"  [ROOT EXEC] process_payment: Processing payment...")
 
     step_1_validate_payment(user_id=user_id, amount=amount)
 
-    user_details = step_3_get_user_details(user_id=user_id)
-    user_roles = step_4_get_user_roles()
-    user_balance = step_5_get_user_balance()
+    details_future = _submit_traced(step_3_get_user_details, user_id=user_id)
+    roles_future = _submit_traced(step_4_get_user_roles)
+    balance_future = _submit_traced(step_5_get_user_balance)
+    user_details = details_future.result()
+    user_roles = roles_future.result()
+    user_balance = balance_future.result()
     print(f"  [INFO] Got details: {user_details['username']}, Roles: {len(user_roles)}, Balance: {user_balance}")
 
     receipt_id = f"receipt_{int(time.time())}"
@@ -85,7 +99,7 @@ def process_payment(user_id: str, amount: int):
 )
 def generate_report():
     print(f"  [ROOT EXEC] generate_report: Generating report...")
-    time.sleep(0.3)
+    _bootstrap.demo_sleep(0.3)
     print(f"  [ROOT DONE] generate_report")
     return {"report_url": "/reports/analytics.pdf"}
 
@@ -102,6 +116,14 @@ def calculate_loyalty_points(purchase_amount: int, is_vip: bool):
         points *= 2
     return {"points": points, "tier": "VIP" if is_vip else "Regular"}
 
+# 요약 후보는 한 번만 만들어 두고 매 호출마다 재사용합니다.
+_REVIEW_SUMMARIES = (
+    "The customer is highly satisfied with the product quality and fast shipping.",
+    "User expressed great satisfaction regarding quality and delivery speed.",
+    "Great product quality and fast delivery made the customer happy.",
+)
+_choice = random.choice
+
 @vectorize(
     search_description="Generate a summary of customer review.",
     team="ai-service",
@@ -115,14 +137,7 @@ def generate_review_summary(review_text: str):
     호출될 때마다 문장 표현이 조금씩 달라지지만 의미는 같습니다.
     """
     print(f"  [AI] Summarizing review: {review_text[:10]}...")
-
-    responses = [
-        "The customer is highly satisfied with the product quality and fast shipping.",
-        "User expressed great satisfaction regarding quality and delivery speed.",
-        "Great product quality and fast delivery made the customer happy."
-    ]
-
-    return random.choice(responses)
+    return _choice(_REVIEW_SUMMARIES)
 
 
 # =================================================================
@@ -170,7 +185,8 @@ if __name__ == "__main__":
         for _ in range(6):
             generate_review_summary(review_text='I really loved this item! It arrived so fast...')
 
-        time.sleep(10) # 이 대기 시간이 Replay 로그와의 시간차 원인이었습니다.
+        # 고정 10초 대기 대신, 비동기 로그가 실제로 기록되는 즉시 진행합니다 (최대 10초).
+        flush(timeout=10)
 
         print("\nFunction calls completed.")
 
@@ -1,22 +1,15 @@
-import sys
 import os
-import time
 
 # --- 경로 설정 ---
-current_dir = os.path.dirname(os.path.abspath(__file__))
-os.chdir(current_dir)
-src_path = os.path.abspath(os.path.join(current_dir, "../src"))
-
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-
-project_root = os.path.abspath(os.path.join(current_dir, ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
+os.chdir(_bootstrap.SCRIPT_DIR)
 
 # --- 모듈 임포트 ---
-from vectorwave import initialize_database
-from vectorwave.utils.replayer_semantic import SemanticReplayer
+from vectorwave import initialize_database, flush
+from vectorwave.utils.replayer_semantic import get_semantic_replayer
 from vectorwave.database.dataset import VectorWaveDatasetManager
 from vectorwave.search.execution_search import search_executions
 
@@ -45,15 +38,19 @@ def run_test():
     sample_review = "The product quality is amazing and delivery was super fast!"
     generate_review_summary(review_text=sample_review)
 
-    print("  ⏳ Waiting 4s for async indexing...")
-    time.sleep(4)
+    print("  ⏳ Waiting (up to 4s) for async logs to be written...")
+    flush(timeout=4)
 
     # 3. Golden Data 등록
     print("\n[Step 2] Registering Golden Data...")
 
-    # 최신 로그 조회
-    logs = search_executions(limit=5, filters={"function_name": short_func_name})
-    target_log = next((log for log in logs if log.get('review_text') == sample_review), None)
+    # 최신 로그 조회: review_text 일치 여부까지 Weaviate 필터로 넘겨 해당 로그 1건만 받아옵니다.
+    logs = search_executions(
+        limit=1,
+        filters={"function_name": short_func_name, "review_text": sample_review},
+        return_properties=["function_name"]
+    )
+    target_log = logs[0] if logs else None
 
     if target_log:
         log_uuid = target_log['uuid']
@@ -76,7 +73,7 @@ def run_test():
     print("  -> Watch the logs for 'Golden Data test cases' or '[GOLDEN]' tag.")
 
     try:
-        replayer = SemanticReplayer()
+        replayer = get_semantic_replayer()
 
         # LLM 의미론적 비교 (Golden Data가 포함되어 테스트되는지 확인)
         result = replayer.replay(
@@ -1,21 +1,20 @@
 import sys
-import os
 from dotenv import load_dotenv
 
 # --- 1. Path setup (recognize src folder) ---
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
 
 try:
     from vectorwave import initialize_database
     from vectorwave.database.db import get_cached_client
     # Import the newly added hybrid search function
-    from vectorwave import search_functions_hybrid
+    from vectorwave import search_functions_hybrid_multi
 except ImportError as e:
     print(f"Module import failed: {e}")
-    print("Please check if search_functions_hybrid is added to src/vectorwave/__init__.py.")
+    print("Please check if search_functions_hybrid_multi is added to src/vectorwave/__init__.py.")
     sys.exit(1)
 
 
@@ -39,6 +38,17 @@ def run_hybrid_test():
     # 0.0 ~ 1.0 (Closer to 0 is keyword-centric, closer to 1 is vector/semantic-centric)
     alpha_values = [0.1, 0.5, 0.9]
 
+    # One call embeds the query once and runs the hybrid search for every alpha
+    try:
+        results_by_alpha = search_functions_hybrid_multi(
+            query=query,
+            alphas=alpha_values,
+            limit=3
+        )
+    except Exception as e:
+        print(f"   -> Error during search: {e}")
+        results_by_alpha = {}
+
     for alpha in alpha_values:
         print(f"\n🔹 [Alpha: {alpha}] ", end="")
         if alpha < 0.3:
@@ -48,23 +58,14 @@ def run_hybrid_test():
         else:
             print("(Balanced)")
 
-        try:
-            results = search_functions_hybrid(
-                query=query,
-                limit=3,
-                alpha=alpha
-            )
-
-            if not results:
-                print("   -> No results")
-            else:
-                for i, res in enumerate(results):
-                    score = res['metadata'].score or 0.0
-                    func_name = res['properties']['function_name']
-                    print(f"   {i + 1}. {func_name} (Score: {score:.4f})")
-
-        except Exception as e:
-            print(f"   -> Error during search: {e}")
+        results = results_by_alpha.get(alpha)
+        if not results:
+            print("   -> No results")
+        else:
+            for i, res in enumerate(results):
+                score = res['metadata'].score or 0.0
+                func_name = res['properties']['function_name']
+                print(f"   {i + 1}. {func_name} (Score: {score:.4f})")
 
     print("\n" + "=" * 60)
 
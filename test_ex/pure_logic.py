@@ -1,16 +1,34 @@
 # test_ex/pure_logic.py
-import time
 import random
 
+from ._bootstrap import demo_sleep
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_jit_discount = None
+if njit is not None:
+    # Arithmetic-only kernel, compiled when numba is installed. A numba dispatcher is not a
+    # plain function, so the AutoInjector does not wrap it in a span of its own.
+    @njit("float64(float64)", cache=True)
+    def _jit_discount(amount):
+        if amount > 100:
+            return amount * 0.1
+        return 0.0
+
 def validate_user(user_id):
     """Function to validate user ID"""
     print(f"  [Logic] Validating user: {user_id}")
-    time.sleep(0.1)  # Simulate processing time
+    demo_sleep(0.1)  # Simulate processing time (skipped under DEMO_FAST=1)
     return True
 
 def calculate_discount(amount):
     """Function to calculate discount rate"""
     print(f"  [Logic] Calculating discount for ${amount}...")
+    if _jit_discount is not None:
+        return _jit_discount(amount)
     if amount > 100:
         return amount * 0.1
     return 0
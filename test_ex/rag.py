@@ -1,12 +1,11 @@
 import sys
-import os
 from dotenv import load_dotenv
 
 # --- 1. 경로 설정 ---
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
 
 # --- 2. 모듈 임포트 ---
 try:
@@ -1,16 +1,15 @@
-import sys
 import os
 import time
 import statistics
 
 # --- 1. Path Setup ---
-current_script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_script_dir)
-src_path = os.path.join(project_root, 'src')
-sys.path.insert(0, src_path)
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
 
 # --- 2. VectorWave Import ---
-from vectorwave import vectorize, initialize_database
+from vectorwave import vectorize, initialize_database, flush
 from vectorwave.database.db import get_cached_client
 
 # 경고 끄기
@@ -43,12 +42,12 @@ def run_benchmark(label, func, input_val, count=10000):
 
     # 예열 (Warm-up): 첫 실행은 DB 인덱싱/초기화 때문에 오래 걸리므로 제외할 수도 있음
     # 여기서는 "첫 실행(Miss)"과 "이후 실행(Hit)"을 구분하지 않고 전체 평균을 봅니다.
-    # 단, VectorWave는 첫 실행 후 2초 대기하여 캐시를 확실히 만듭니다.
+    # 단, VectorWave는 첫 실행 로그가 기록될 때까지(최대 2초) 기다려 캐시를 확실히 만듭니다.
 
     print("   🔥 예열 중 (First Run)...")
     func(input_val)
     if "VectorWave" in label:
-        time.sleep(2) # DB 인덱싱 대기
+        flush(timeout=2) # 첫 실행 로그가 DB에 기록될 때까지 대기
 
     print("   ⏱️ 측정 시작...")
     for i in range(count):
@@ -1,13 +1,12 @@
-import sys
 import os
-import time
-current_dir = os.path.dirname(os.path.abspath(__file__))
-os.chdir(current_dir)
-src_path = os.path.abspath(os.path.join(current_dir, "../src"))
-
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
+os.chdir(_bootstrap.SCRIPT_DIR)
+
+from vectorwave import flush
 from vectorwave.utils.replayer import VectorWaveReplayer
 
 
@@ -20,35 +19,27 @@ def run_replay_test():
     # Note: The main logic of example.py may execute when importing this file.
     target_module = "test_ex.example"
 
-    # -----------------------------------------------------
-    # Test 1: validate_payment (Unit Function Test)
-    # -----------------------------------------------------
-    func_full_name = f"{target_module}.step_1_validate_payment"
-    print(f"\n▶️ Testing '{func_full_name}'...")
-
-    # Find and execute 'step_1_validate_payment' logs from the DB
-    result_1 = replayer.replay(func_full_name, limit=10)
-    print_summary(result_1)
-
-    # -----------------------------------------------------
-    # Test 2: process_payment (Main Business Logic Test)
-    # -----------------------------------------------------
-    # Since this function calls step_1, step_2, etc. internally,
-    # verification is performed to see if this flow is reproduced during Replay.
-    func_full_name = f"{target_module}.process_payment"
-    print(f"\n▶️ Testing '{func_full_name}'...")
-
-    result_2 = replayer.replay(func_full_name, limit=10)
-    print_summary(result_2)
-
-    # -----------------------------------------------------
-    # Test 3: generate_report (Simple Return Value Test)
-    # -----------------------------------------------------
-    func_full_name = f"{target_module}.generate_report"
-    print(f"\n▶️ Testing '{func_full_name}'...")
-
-    result_3 = replayer.replay(func_full_name, limit=10)
-    print_summary(result_3)
+    # The three targets share no state, so their replays run concurrently on one replayer
+    # (replay() keeps all per-run state local) and summaries print as each one finishes.
+    targets = [
+        # Test 1: validate_payment (Unit Function Test)
+        f"{target_module}.step_1_validate_payment",
+        # Test 2: process_payment (Main Business Logic Test)
+        # Since this function calls step_1, step_2, etc. internally,
+        # verification is performed to see if this flow is reproduced during Replay.
+        f"{target_module}.process_payment",
+        # Test 3: generate_report (Simple Return Value Test)
+        f"{target_module}.generate_report",
+    ]
+
+    for func_full_name in targets:
+        print(f"\n▶️ Testing '{func_full_name}'...")
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = {pool.submit(replayer.replay, name, limit=10): name for name in targets}
+        for future in as_completed(futures):
+            print(f"\n✅ Finished '{futures[future]}'")
+            print_summary(future.result())
 
 def print_summary(result):
     if "error" in result:
@@ -71,14 +62,9 @@ def print_summary(result):
                 print(f"      - Error Msg: {fail['error']}")
 
 if __name__ == "__main__":
-    # Add the parent directory to the path to recognize the example.py path as a Python package
-    # (Set the vectorwave folder as the package root)
-    project_root = os.path.abspath(os.path.join(current_dir, ".."))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-
+    # _bootstrap already put the project root on sys.path, so 'test_ex.example' resolves as a package.
     try:
         run_replay_test()
-        time.sleep(10)
+        flush(timeout=10)  # Drain replay logs instead of sleeping a fixed 10s
     except Exception as e:
         print(f"\n❌ Error during test execution: {e}")
\ No newline at end of file
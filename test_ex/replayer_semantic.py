@@ -1,25 +1,19 @@
-import sys
 import os
 import time
 
-current_dir = os.path.dirname(os.path.abspath(__file__))
-os.chdir(current_dir)
-src_path = os.path.abspath(os.path.join(current_dir, "../src"))
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
+os.chdir(_bootstrap.SCRIPT_DIR)
 
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-
-project_root = os.path.abspath(os.path.join(current_dir, ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-from vectorwave.utils.replayer_semantic import SemanticReplayer
+from vectorwave.utils.replayer_semantic import get_semantic_replayer
 
 def run_test():
     print("🚀 Starting Semantic Replay Test (LLM Text Mode)...")
 
     try:
-        replayer = SemanticReplayer()
+        replayer = get_semantic_replayer()
     except Exception as e:
         print(f"❌ Initialization Failed: {e}")
         return
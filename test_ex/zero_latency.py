@@ -1,11 +1,12 @@
 import time
-import os
-import sys
 import logging
 from unittest.mock import MagicMock, patch
 
 # 프로젝트 루트 경로 추가 (모듈 임포트용)
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+try:
+    from . import _bootstrap
+except ImportError:  # Run as a script: test_ex itself is sys.path[0]
+    import _bootstrap
 
 from vectorwave import vectorize
 from vectorwave.models.db_config import get_weaviate_settings